@@ -0,0 +1,132 @@
+"""
+Benchmark building the views of many related models with the four builder presets.
+
+Models are grouped in clusters of ten, where every model refers to the next one, and the last one
+to the first one, so views are built with forward references to views still being built.
+
+Building the views with ``defer_build`` leaves the compilation of their validators and serializers
+for their first use, or for ``Builder.warm``. ``build_views`` builds the views of all the presets in
+one pass.
+
+Deferring the views and using the ``Create`` and ``Load`` views of a single model only builds the
+views of its cluster.
+
+Run with ``python benchmarks/bench_builder.py``.
+"""
+
+import sys
+import time
+import types
+from typing import Optional
+
+from pydantic import BaseModel, Field, create_model
+
+from pydantic_views import Builder, CreatePreset, CreateResultPreset, LoadPreset, ReadOnly, UpdatePreset, build_views
+
+
+def make_models(count: int, module_name: str) -> list[type[BaseModel]]:
+    module = types.ModuleType(module_name)
+    sys.modules[module_name] = module
+
+    models: list[type[BaseModel]] = []
+    for i in range(count):
+        name = f"Model{i}"
+        related = f"Model{i + 1 if i % 10 < 9 else i - 9}"
+        fields: dict = {
+            "id": (ReadOnly[int], 0),
+            "name": (str, ...),
+            "tags": (list[str], Field(default_factory=list)),
+            "related": (Optional[related], None),  # noqa: UP045
+            "children": (list[related], Field(default_factory=list)),
+        }
+        model = create_model(name, __module__=module_name, **fields)
+        setattr(module, name, model)
+        models.append(model)
+
+    for model in models:
+        model.model_rebuild()
+    return models
+
+
+PRESETS = (CreatePreset, CreateResultPreset, UpdatePreset, LoadPreset)
+VIEW_NAMES = tuple(preset.view_name for preset in PRESETS)
+
+
+def make_builders(**kwargs: bool) -> list[Builder]:
+    return [
+        Builder(**preset._asdict() | kwargs) for preset in (CreatePreset, CreateResultPreset, UpdatePreset, LoadPreset)
+    ]
+
+
+def bench_build(count: int, *, defer_build: bool):
+    models = make_models(count, f"bench_builder_models_{count}_{defer_build}")
+    builders = make_builders(defer_build=defer_build)
+
+    start = time.perf_counter()
+    for model in models:
+        for builder in builders:
+            builder.build_view(model)
+    elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for builder in builders:
+        builder.warm()
+    warmed = time.perf_counter() - start
+
+    incomplete = sum(1 for model in models for name in VIEW_NAMES if not model.model_views[name].__pydantic_complete__)  # type: ignore
+    label = "building (defer_build)" if defer_build else "building"
+    print(
+        f"{count:>5} models: {elapsed:7.2f} s {label} {count * 4} views, "
+        f"{warmed:.2f} s warming them, {incomplete} incomplete"
+    )
+
+
+def bench_build_views(count: int, *, defer_build: bool):
+    module_name = f"bench_builder_fused_models_{count}_{defer_build}"
+    models = make_models(count, module_name)
+    presets = [preset._replace(defer_build=defer_build) for preset in PRESETS]
+
+    start = time.perf_counter()
+    build_views(sys.modules[module_name], presets)
+    elapsed = time.perf_counter() - start
+
+    incomplete = sum(1 for model in models for name in VIEW_NAMES if not model.model_views[name].__pydantic_complete__)  # type: ignore
+    label = "build_views (defer_build)" if defer_build else "build_views"
+    print(f"{count:>5} models: {elapsed:7.2f} s {label} {count * 4} views, {incomplete} incomplete")
+
+
+def bench_defer_view(count: int):
+    module_name = f"bench_builder_deferred_models_{count}"
+    models = make_models(count, module_name)
+    builders = make_builders()
+
+    start = time.perf_counter()
+    for model in models:
+        for builder in builders:
+            builder.defer_view(model)
+    deferred = time.perf_counter() - start
+
+    module = sys.modules[module_name]
+    start = time.perf_counter()
+    assert module.Model0Create.__pydantic_complete__
+    assert models[0].model_views["Load"].__pydantic_complete__  # type: ignore
+    used = time.perf_counter() - start
+
+    built = sum(1 for name in vars(module) if name.endswith(VIEW_NAMES))
+    print(
+        f"{count:>5} models: {deferred:7.2f} s deferring {count * 4} views, "
+        f"{used:.2f} s using two of them ({built} views built)"
+    )
+
+
+def main(counts: tuple[int, ...] = (100, 500)):
+    for count in counts:
+        bench_build(count, defer_build=False)
+        bench_build_views(count, defer_build=False)
+        bench_build(count, defer_build=True)
+        bench_build_views(count, defer_build=True)
+        bench_defer_view(count)
+
+
+if __name__ == "__main__":
+    main()
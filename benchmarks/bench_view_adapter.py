@@ -0,0 +1,46 @@
+"""
+Benchmark ``View.view_adapter`` against building container type adapters on every call.
+
+Run with ``python benchmarks/bench_view_adapter.py``.
+"""
+
+import timeit
+
+from pydantic import BaseModel, Field, TypeAdapter
+
+from pydantic_views import BuilderLoad
+
+
+class Address(BaseModel):
+    street: str
+    city: str
+
+
+class User(BaseModel):
+    id: int
+    name: str
+    email: str
+    addresses: list[Address] = Field(default_factory=list)
+
+
+UserLoad = BuilderLoad().build_view(User)
+
+
+def main(number: int = 2_000):
+    data = [{"id": i, "name": f"user {i}", "email": f"u{i}@example.com"} for i in range(10)]
+
+    def ad_hoc():
+        return TypeAdapter(list[UserLoad]).validate_python(data)  # type: ignore
+
+    def cached():
+        return UserLoad.view_adapter("list").validate_python(data)
+
+    assert ad_hoc() == cached()
+    for label, call in (("ad hoc", ad_hoc), ("cached", cached)):
+        elapsed = min(timeit.repeat(call, number=number, repeat=3))
+        print(f"{label:>7}: {elapsed / number * 1e6:10.2f} us/call")
+    print(UserLoad.view_adapter_cache().cache_info())
+
+
+if __name__ == "__main__":
+    main()
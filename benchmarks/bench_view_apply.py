@@ -0,0 +1,74 @@
+"""
+Benchmark ``View.view_apply_to`` in deep copy and copy-on-write modes on a large aggregate and a wide model.
+
+Run with ``python benchmarks/bench_view_apply.py``.
+"""
+
+import timeit
+
+from pydantic import BaseModel, Field, create_model
+
+from pydantic_views import BuilderUpdate
+
+
+class Address(BaseModel):
+    street: str
+    city: str
+    country: str = "ES"
+
+
+class Account(BaseModel):
+    name: str
+    email: str
+    active: bool = True
+    address: Address
+    addresses: list[Address] = Field(default_factory=list)
+    meta: dict[str, str] = Field(default_factory=dict)
+
+
+AccountUpdate = BuilderUpdate().build_view(Account)
+
+Wide = create_model("Wide", **{f"field_{i}": (int, 0) for i in range(150)})  # type: ignore
+WideUpdate = BuilderUpdate().build_view(Wide)
+
+
+def main(number: int = 5_000):
+    account = Account(
+        name="John",
+        email="john@example.com",
+        address=Address(street="Main", city="Madrid"),
+        addresses=[Address(street=f"Street {i}", city="Madrid") for i in range(200)],
+        meta={f"key{i}": f"value{i}" for i in range(200)},
+    )
+    scenarios = {
+        "one field": AccountUpdate.model_validate({"active": False}),
+        "nested": AccountUpdate.model_validate({"address": {"city": "Sevilla"}}),
+    }
+
+    wide = Wide()
+    wide_scenarios = {
+        "wide 1": WideUpdate.model_validate({"field_0": 1}),
+        "wide 10": WideUpdate.model_validate({f"field_{i}": i for i in range(10)}),
+    }
+
+    for name, update in scenarios.items():
+        assert update.view_apply_to(account) == update.view_apply_to(account, copy_on_write=True)  # type: ignore
+        for label, cow in (("deep copy", False), ("copy-on-write", True)):
+            elapsed = min(
+                timeit.repeat(
+                    lambda u=update, c=cow: u.view_apply_to(account, copy_on_write=c),  # type: ignore
+                    number=number,
+                    repeat=5,
+                )
+            )
+            print(f"{name:>10} {label:>14}: {elapsed / number * 1e6:8.2f} us/op")
+
+    for name, update in wide_scenarios.items():
+        elapsed = min(
+            timeit.repeat(lambda u=update: u.view_apply_to(wide, copy_on_write=True), number=number, repeat=5)  # type: ignore
+        )
+        print(f"{name:>10} {'copy-on-write':>14}: {elapsed / number * 1e6:8.2f} us/op")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Benchmark ``model_apply_many`` against per item ``View.view_apply_to`` calls.
+
+Run with ``python benchmarks/bench_view_apply_many.py``.
+"""
+
+import timeit
+
+from pydantic import BaseModel, Field
+
+from pydantic_views import BuilderUpdate, ReadOnly
+from pydantic_views.view import model_apply_many
+
+
+class Account(BaseModel):
+    id: ReadOnly[int] = 0
+    name: str
+    email: str
+    age: int | None = None
+    balance: float = 0.0
+    tags: list[str] = Field(default_factory=list)
+    meta: dict[str, str] = Field(default_factory=dict)
+
+
+AccountUpdate = BuilderUpdate().build_view(Account)
+
+
+def main(sizes: tuple[int, ...] = (10_000, 100_000)):
+    for size in sizes:
+        accounts = [Account(id=i, name=f"User {i}", email=f"user{i}@example.com") for i in range(size)]
+        updates = [
+            AccountUpdate.model_validate({"balance": i * 1.5, "tags": ["a"], "meta": {"source": "nightly"}})
+            for i in range(size)
+        ]
+        pairs = list(zip(accounts, updates, strict=True))
+
+        def per_item(p=pairs):
+            return [u.view_apply_to(a, copy_on_write=True) for a, u in p]  # type: ignore
+
+        def bulk(p=pairs):
+            return [r.model for r in model_apply_many(p, copy_on_write=True)]  # type: ignore
+
+        assert per_item() == bulk()
+        for label, func in (("per item", per_item), ("bulk", bulk)):
+            elapsed = min(timeit.repeat(func, number=1, repeat=3))
+            print(f"{size:>8} {label:>9}: {elapsed / size * 1e6:6.2f} us/item")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Benchmark ``View.view_apply_to`` patching one entry of a large dictionary of models.
+
+Run with ``python benchmarks/bench_view_apply_mapping.py``.
+"""
+
+import timeit
+
+from pydantic import BaseModel, Field
+
+from pydantic_views import BuilderUpdate
+
+
+class Metric(BaseModel):
+    name: str
+    value: float = 0.0
+    unit: str = "ms"
+
+
+class Dashboard(BaseModel):
+    title: str
+    metrics: dict[str, Metric] = Field(default_factory=dict)
+
+
+DashboardUpdate = BuilderUpdate().build_view(Dashboard)
+
+
+def main(sizes: tuple[int, ...] = (1_000, 10_000, 50_000), number: int = 50):
+    for size in sizes:
+        dashboard = Dashboard(title="Service", metrics={f"m{i}": Metric(name=f"m{i}") for i in range(size)})
+        update = DashboardUpdate.model_validate({"metrics": {"m0": {"value": 3.5}}})
+
+        assert update.view_apply_to(dashboard, copy_on_write=True).metrics["m0"].value == 3.5  # type: ignore
+        elapsed = min(
+            timeit.repeat(
+                lambda u=update, d=dashboard: u.view_apply_to(d, copy_on_write=True),  # type: ignore
+                number=number,
+                repeat=5,
+            )
+        )
+        print(f"{size:>8} entries: {elapsed / number * 1e6:10.2f} us/op")
+
+
+if __name__ == "__main__":
+    main()
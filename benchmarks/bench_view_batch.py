@@ -0,0 +1,72 @@
+"""
+Benchmark batch view conversions against per item conversions.
+
+Run with ``python benchmarks/bench_view_batch.py``.
+"""
+
+import timeit
+
+from pydantic import BaseModel, Field
+
+from pydantic_views import BuilderCreate, BuilderLoad, ReadOnly
+
+
+class Address(BaseModel):
+    street: str
+    city: str
+    zip_code: str = Field(alias="zipCode")
+
+
+class User(BaseModel):
+    id: ReadOnly[int] = 0
+    name: str
+    email: str
+    age: int | None = None
+    tags: list[str] = Field(default_factory=list)
+    address: Address | None = None
+
+
+UserCreate = BuilderCreate().build_view(User)
+UserLoad = BuilderLoad().build_view(User)
+
+
+def main(size: int = 10_000, number: int = 5):
+    users = [
+        User.model_validate(
+            {
+                "id": i,
+                "name": f"User {i}",
+                "email": f"user{i}@example.com",
+                "age": 20 + i % 50,
+                "tags": ["a", "b"],
+                "address": {"street": "Main", "city": "Madrid", "zipCode": "28001"} if i % 2 else None,
+            }
+        )
+        for i in range(size)
+    ]
+    views = [UserCreate.model_validate(u.model_dump(by_alias=True, exclude={"id"}, exclude_none=True)) for u in users]
+
+    cases = {
+        "build_from (validate)": (
+            lambda: [UserLoad.view_build_from(u, validate=True) for u in users],
+            lambda: UserLoad.view_build_from_many(users, validate=True),
+        ),
+        "build_from (projection)": (
+            lambda: [UserLoad.view_build_from(u) for u in users],
+            lambda: UserLoad.view_build_from_many(users),
+        ),
+        "build_to": (
+            lambda: [v.view_build_to() for v in views],
+            lambda: UserCreate.view_build_to_many(views),
+        ),
+    }
+
+    for name, (per_item, batch) in cases.items():
+        assert per_item() == batch()
+        for label, func in (("per item", per_item), ("batch", batch)):
+            elapsed = min(timeit.repeat(func, number=number, repeat=3)) / number
+            print(f"{name:>24} {label:>9}: {size / elapsed:12,.0f} items/s")
+
+
+if __name__ == "__main__":
+    main()
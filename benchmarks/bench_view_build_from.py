@@ -0,0 +1,89 @@
+"""
+Benchmark ``View.view_build_from`` projection against the dump and validate round trip.
+
+Run with ``python benchmarks/bench_view_build_from.py``.
+"""
+
+import timeit
+
+from pydantic import BaseModel, Field, computed_field
+
+from pydantic_views import BuilderLoad, Hidden, ReadOnly, WriteOnly
+
+
+class Address(BaseModel):
+    street: str
+    city: str
+    zip_code: str = Field(alias="zipCode")
+    country: str = "ES"
+    internal_code: Hidden[str] = ""
+
+
+class Profile(BaseModel):
+    id: ReadOnly[int] = 0
+    name: str
+    email: str
+    password: WriteOnly[str] = ""
+    age: int | None = None
+    active: bool = True
+    score: float = 0.0
+    tags: list[str] = Field(default_factory=list)
+    meta: dict[str, str] = Field(default_factory=dict)
+
+    @computed_field
+    def display_name(self) -> str:
+        return f"{self.name} <{self.email}>"
+
+
+class User(Profile):
+    address: Address
+    addresses: list[Address] = Field(default_factory=list)
+
+
+ProfileLoad = BuilderLoad().build_view(Profile)
+UserLoad = BuilderLoad().build_view(User)
+
+
+def main(number: int = 50_000):
+    profile = {
+        "id": 1,
+        "name": "John",
+        "email": "john@example.com",
+        "password": "secret",
+        "age": 33,
+        "tags": ["a", "b"],
+        "meta": {"source": "bench"},
+    }
+
+    def user(addresses: int) -> User:
+        return User.model_validate(
+            {
+                **profile,
+                "address": {"street": "Main", "city": "Madrid", "zipCode": "28001"},
+                "addresses": [
+                    {"street": f"Street {i}", "city": "Madrid", "zipCode": "28001"} for i in range(addresses)
+                ],
+            }
+        )
+
+    scenarios = {
+        "flat": (ProfileLoad, Profile.model_validate(profile), number),
+        "nested": (UserLoad, user(5), number),
+        "large": (UserLoad, user(100), number // 20),
+    }
+
+    for name, (view_cls, model, n) in scenarios.items():
+        assert view_cls.view_build_from(model) == view_cls.view_build_from(model, validate=True)  # type: ignore
+        for label, validate in (("dump + validate", True), ("projection", False)):
+            elapsed = min(
+                timeit.repeat(
+                    lambda c=view_cls, m=model, v=validate: c.view_build_from(m, validate=v),  # type: ignore
+                    number=n,
+                    repeat=5,
+                )
+            )
+            print(f"{name:>8} {label:>16}: {elapsed / n * 1e6:8.2f} us/op")
+
+
+if __name__ == "__main__":
+    main()
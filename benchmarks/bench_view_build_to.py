@@ -0,0 +1,82 @@
+"""
+Benchmark ``View.view_build_to`` against the former dump and validate round trip.
+
+Only flat views are compiled into steps. Views holding nested views are still serialized whole
+before the base model validates them, so the ``serialized`` scenario measures that fallback, which
+is on par with the round trip.
+
+Run with ``python benchmarks/bench_view_build_to.py``.
+"""
+
+import timeit
+
+from pydantic import BaseModel, Field
+
+from pydantic_views import BuilderCreate, ReadOnly
+
+
+class Address(BaseModel):
+    street: str
+    city: str
+    zip_code: str = Field(alias="zipCode")
+    country: str = "ES"
+
+
+class Profile(BaseModel):
+    id: ReadOnly[int] = 0
+    name: str
+    email: str
+    age: int | None = None
+    active: bool = True
+    score: float = 0.0
+    tags: list[str] = Field(default_factory=list)
+    meta: dict[str, str] = Field(default_factory=dict)
+
+
+class User(Profile):
+    address: Address
+    addresses: list[Address] = Field(default_factory=list)
+
+
+ProfileCreate = BuilderCreate().build_view(Profile)
+UserCreate = BuilderCreate().build_view(User)
+
+
+def legacy_build_to(view: BaseModel) -> BaseModel:
+    return view.view_class_root().model_validate(  # type: ignore
+        view.model_dump(exclude_unset=True, exclude_defaults=True, by_alias=True)
+    )
+
+
+def compiled_build_to(view: BaseModel) -> BaseModel:
+    return view.view_build_to()  # type: ignore
+
+
+def main(number: int = 50_000):
+    profile = {
+        "name": "John",
+        "email": "john@example.com",
+        "age": 33,
+        "tags": ["a", "b"],
+        "meta": {"source": "bench"},
+    }
+    scenarios = {
+        "flat": ProfileCreate.model_validate(profile),
+        "serialized": UserCreate.model_validate(
+            {
+                **profile,
+                "address": {"street": "Main", "city": "Madrid", "zipCode": "28001"},
+                "addresses": [{"street": f"Street {i}", "city": "Madrid", "zipCode": "28001"} for i in range(5)],
+            }
+        ),
+    }
+
+    for name, view in scenarios.items():
+        assert legacy_build_to(view) == compiled_build_to(view)
+        for label, func in (("dump + validate", legacy_build_to), ("compiled plan", compiled_build_to)):
+            elapsed = min(timeit.repeat(lambda f=func, v=view: f(v), number=number, repeat=5))  # type: ignore
+            print(f"{name:>10} {label:>16}: {elapsed / number * 1e6:8.2f} us/op")
+
+
+if __name__ == "__main__":
+    main()
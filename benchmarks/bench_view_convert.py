@@ -0,0 +1,67 @@
+"""
+Benchmark ``View.view_convert`` against building the model and the target view from it.
+
+Run with ``python benchmarks/bench_view_convert.py``.
+"""
+
+import timeit
+
+from pydantic import BaseModel, Field
+
+from pydantic_views import BuilderCreate, BuilderCreateResult, BuilderLoad, BuilderUpdate, ReadOnly
+
+
+class Address(BaseModel):
+    street: str
+    city: str
+    zip_code: str = Field(alias="zipCode")
+
+
+class User(BaseModel):
+    id: ReadOnly[int] = 0
+    name: str
+    email: str
+    age: int = 0
+    active: bool = True
+    tags: list[str] = Field(default_factory=list)
+    meta: dict[str, str] = Field(default_factory=dict)
+    address: Address | None = None
+    addresses: list[Address] = Field(default_factory=list)
+
+
+UserCreate = BuilderCreate().build_view(User)
+UserCreateResult = BuilderCreateResult().build_view(User)
+UserLoad = BuilderLoad().build_view(User)
+UserUpdate = BuilderUpdate().build_view(User)
+
+
+def main(number: int = 50_000):
+    flat = {"name": "Ann", "email": "ann@example.com", "age": 41, "tags": ["a", "b"], "meta": {"k": "v"}}
+    nested = {
+        **flat,
+        "addresses": [{"street": f"Side St. {i}", "city": "Shelbyville", "zipCode": "54321"} for i in range(3)],
+    }
+    scenarios = {
+        "Create->CreateResult": (UserCreate.model_validate(flat), UserCreateResult),
+        "Load->Update": (UserLoad.model_validate(flat), UserUpdate),
+        "Load->Update nested": (UserLoad.model_validate(nested), UserUpdate),
+    }
+    for label, (view, target) in scenarios.items():
+
+        def round_trip(v=view, t=target):
+            return t.view_build_from(v.view_build_to())
+
+        def direct(v=view, t=target):
+            return v.view_convert(t)
+
+        assert round_trip() == direct()
+        through = min(timeit.repeat(round_trip, number=number, repeat=3))
+        converted = min(timeit.repeat(direct, number=number, repeat=3))
+        print(
+            f"{label:>22}: round trip {through / number * 1e6:7.2f} us, view_convert {converted / number * 1e6:7.2f} us"
+            f" ({through / converted:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmark ``View.view_dump_json`` against building the view and dumping it.
+
+Run with ``python benchmarks/bench_view_dump.py``.
+"""
+
+import timeit
+
+from pydantic import BaseModel, Field
+
+from pydantic_views import BuilderLoad, WriteOnly
+
+
+class Address(BaseModel):
+    street: str
+    city: str
+    secret: WriteOnly[str] = ""
+
+
+class User(BaseModel):
+    id: int
+    name: str
+    email: str
+    password: WriteOnly[str] = ""
+    tags: list[str] = Field(default_factory=list)
+    addresses: list[Address] = Field(default_factory=list)
+
+
+UserLoad = BuilderLoad().build_view(User)
+
+
+def main(sizes: tuple[int, ...] = (10_000, 100_000)):
+    for size in sizes:
+        users = [
+            User(
+                id=i,
+                name=f"User {i}",
+                email=f"user{i}@example.com",
+                password="x",
+                tags=["a", "b"],
+                addresses=[Address(street=f"{i} Main St", city="Springfield", secret="y")],
+            )
+            for i in range(size)
+        ]
+
+        def two_step(u=users):
+            return [UserLoad.view_build_from(m).model_dump_json() for m in u]
+
+        def direct(u=users):
+            return [UserLoad.view_dump_json(m) for m in u]
+
+        assert two_step() == direct()
+        for label, func in (("two step", two_step), ("direct", direct)):
+            elapsed = min(timeit.repeat(func, number=1, repeat=3))
+            print(f"{size:>8} {label:>9}: {elapsed / size * 1e6:6.2f} us/item")
+
+
+if __name__ == "__main__":
+    main()
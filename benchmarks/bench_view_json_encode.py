@@ -0,0 +1,69 @@
+"""
+Benchmark ``View.view_dump_json_iter`` against dumping a whole list of views at once.
+
+Time to first byte, total time and peak memory (measured in a second run with :mod:`tracemalloc`,
+so only Python allocations are accounted) are reported.
+
+Run with ``python benchmarks/bench_view_json_encode.py``.
+"""
+
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+
+from pydantic import BaseModel, Field, TypeAdapter
+
+from pydantic_views import BuilderLoad, WriteOnly
+
+
+class Product(BaseModel):
+    id: int
+    name: str
+    price: float
+    secret: WriteOnly[str] = ""
+    tags: list[str] = Field(default_factory=list)
+
+
+ProductLoad = BuilderLoad().build_view(Product)
+
+
+def products(size: int) -> Iterator[Product]:
+    for i in range(size):
+        yield Product(id=i, name=f"Product {i}", price=i * 0.5, secret="x", tags=["a"])
+
+
+def main(sizes: tuple[int, ...] = (100_000, 1_000_000)):
+    adapter = TypeAdapter(list[ProductLoad])  # type: ignore
+    for size in sizes:
+
+        def whole(s=size) -> Iterator[bytes]:
+            yield adapter.dump_json([ProductLoad.view_build_from(p) for p in products(s)])
+
+        def streamed(s=size) -> Iterator[bytes]:
+            return ProductLoad.view_dump_json_iter(products(s))
+
+        for label, func in (("whole", whole), ("streamed", streamed)):
+            ttfb, elapsed, written = _consume(func)
+            tracemalloc.start()
+            _consume(func)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(
+                f"{size:>8} {label:>9}: first byte {ttfb * 1e3:8.2f} ms, total {elapsed:6.2f} s, "
+                f"{written / 2**20:7.1f} MiB written, peak {peak / 2**20:8.2f} MiB"
+            )
+
+
+def _consume(func: Callable[[], Iterator[bytes]]) -> tuple[float, float, int]:
+    start = time.perf_counter()
+    ttfb = None
+    written = 0
+    for chunk in func():
+        if ttfb is None:
+            ttfb = time.perf_counter() - start
+        written += len(chunk)
+    return ttfb or 0.0, time.perf_counter() - start, written
+
+
+if __name__ == "__main__":
+    main()
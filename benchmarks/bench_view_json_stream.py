@@ -0,0 +1,61 @@
+"""
+Benchmark ``View.view_validate_json_iter`` against loading a whole JSON array at once.
+
+Peak memory is measured in a second run with :mod:`tracemalloc`, so only Python allocations are
+accounted.
+
+Run with ``python benchmarks/bench_view_json_stream.py``.
+"""
+
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from pydantic import BaseModel, Field, TypeAdapter
+
+from pydantic_views import BuilderCreate
+
+
+class Contact(BaseModel):
+    name: str
+    email: str
+    phone: str | None = None
+    tags: list[str] = Field(default_factory=list)
+
+
+ContactCreate = BuilderCreate().build_view(Contact)
+
+
+def main(sizes: tuple[int, ...] = (10_000, 100_000)):
+    adapter = TypeAdapter(list[ContactCreate])  # type: ignore
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "contacts.json"
+            with path.open("w") as f:
+                json.dump(
+                    [{"name": f"Contact {i}", "email": f"c{i}@example.com", "tags": ["a", "b"]} for i in range(size)], f
+                )
+
+            def whole(p=path):
+                return len(adapter.validate_json(p.read_bytes()))
+
+            def streamed(p=path):
+                with p.open("rb") as f:
+                    return sum(1 for r in ContactCreate.view_validate_json_iter(f) if r.error is None)
+
+            for label, func in (("whole", whole), ("streamed", streamed)):
+                start = time.perf_counter()
+                assert func() == size
+                elapsed = time.perf_counter() - start
+
+                tracemalloc.start()
+                func()
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                print(f"{size:>8} {label:>9}: {elapsed / size * 1e6:6.2f} us/record, peak {peak / 2**20:8.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark ``View.view_validate_json_to_model`` against validating the view and building the model.
+
+Run with ``python benchmarks/bench_view_json_to_model.py``.
+"""
+
+import json
+import timeit
+
+from pydantic import BaseModel, Field
+
+from pydantic_views import BuilderCreate, ReadOnly
+
+
+class Address(BaseModel):
+    street: str
+    city: str
+    zip_code: str = Field(alias="zipCode")
+
+
+class Contact(BaseModel):
+    kind: str
+    value: str
+
+
+class User(BaseModel):
+    id: ReadOnly[int | None] = None
+    name: str
+    email: str
+    age: int = 0
+    address: Address
+    contacts: list[Contact] = Field(default_factory=list)
+    tags: dict[str, str] = Field(default_factory=dict)
+
+
+UserCreate = BuilderCreate().build_view(User)
+
+
+def main(contacts: tuple[int, ...] = (0, 5, 50), number: int = 20_000):
+    for count in contacts:
+        body = json.dumps(
+            {
+                "name": "Ann",
+                "email": "ann@example.com",
+                "age": 41,
+                "address": {"street": "Main St. 1", "city": "Springfield", "zipCode": "12345"},
+                "contacts": [{"kind": "phone", "value": f"555-{i:04}"} for i in range(count)],
+                "tags": {"team": "blue"},
+            }
+        ).encode()
+
+        def through_view(b=body):
+            return UserCreate.model_validate_json(b).view_build_to()
+
+        def direct(b=body):
+            return UserCreate.view_validate_json_to_model(b)
+
+        assert through_view() == direct()
+        for label, parse in (("view", through_view), ("direct", direct)):
+            elapsed = min(timeit.repeat(parse, number=number, repeat=3))
+            print(f"{count:>4} contacts {label:>7}: {elapsed / number * 1e6:8.2f} us/request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark ``View.view_build_rows`` feeding ``executemany`` against per item model dumps.
+
+Run with ``python benchmarks/bench_view_rows.py``.
+"""
+
+import sqlite3
+import timeit
+
+from pydantic import BaseModel
+
+from pydantic_views import BuilderCreate, ReadOnly
+
+
+class Event(BaseModel):
+    id: ReadOnly[int | None] = None
+    kind: str
+    source: str
+    payload: str
+    priority: int = 0
+    processed: bool = False
+
+
+EventCreate = BuilderCreate().build_view(Event)
+
+COLUMNS = ("kind", "source", "payload", "priority", "processed")
+INSERT = f"INSERT INTO event ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})"
+
+
+def main(sizes: tuple[int, ...] = (10_000, 100_000)):
+    for size in sizes:
+        views = [
+            EventCreate.model_validate({"kind": "click", "source": f"page-{i}", "payload": "{}", "priority": i % 5})
+            for i in range(size)
+        ]
+        conn = sqlite3.connect(":memory:")
+        conn.execute(
+            "CREATE TABLE event (id INTEGER PRIMARY KEY, kind TEXT, source TEXT, payload TEXT, priority INTEGER,"
+            " processed INTEGER)"
+        )
+
+        def per_item(v=views):
+            rows = []
+            for view in v:
+                data = view.view_build_to().model_dump()
+                rows.append(tuple(data[c] for c in COLUMNS))
+            return rows
+
+        def bulk(v=views):
+            return EventCreate.view_build_rows(v, COLUMNS)
+
+        assert per_item() == bulk()
+        for label, build in (("per item", per_item), ("bulk", bulk)):
+
+            def insert(b=build, c=conn):
+                c.executemany(INSERT, b())
+
+            elapsed = min(timeit.repeat(build, number=1, repeat=3))
+            inserted = min(timeit.repeat(insert, number=1, repeat=3))
+            print(
+                f"{size:>8} {label:>9}: {size / elapsed:12,.0f} rows/s built, {size / inserted:12,.0f} rows/s inserted"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark fetching only the columns a view needs from an in-memory SQLite database.
+
+The reference adapter below builds the ``SELECT`` statement from ``View.view_select_columns`` and
+validates the fetched rows with the view straight away. It is compared with fetching full rows,
+validating the model and building the view from it.
+
+Run with ``python benchmarks/bench_view_select_columns.py``.
+"""
+
+import sqlite3
+import timeit
+from collections.abc import Iterator
+from typing import Any
+
+from pydantic import BaseModel
+
+from pydantic_views import BuilderLoad, WriteOnly
+from pydantic_views.view import View
+
+
+class Article(BaseModel):
+    id: int
+    title: str
+    author: str
+    summary: str
+    body: WriteOnly[str]
+    raw_html: WriteOnly[str]
+    search_vector: WriteOnly[str]
+
+
+ArticleLoad = BuilderLoad().build_view(Article)
+
+
+def fetch_views[V: View[Any]](conn: sqlite3.Connection, table: str, view_cls: type[V]) -> Iterator[V]:
+    """
+    Fetch the rows of ``table`` as views, selecting only the columns the view needs.
+
+    :param conn: Database connection.
+    :param table: Table holding the view base model rows.
+    :param view_cls: View class to build.
+    :returns: Iterator of views.
+    """
+    columns = view_cls.view_select_columns()
+    cursor = conn.execute(f"SELECT {', '.join(columns)} FROM {table}")
+    for row in cursor:
+        yield view_cls.model_validate(dict(zip(columns, row, strict=True)))
+
+
+def fetch_full(conn: sqlite3.Connection, table: str) -> Iterator[Any]:
+    cursor = conn.execute(f"SELECT * FROM {table}")
+    columns = [c[0] for c in cursor.description]
+    for row in cursor:
+        yield ArticleLoad.view_build_from(Article.model_validate(dict(zip(columns, row, strict=True))))
+
+
+def main(sizes: tuple[int, ...] = (10_000, 50_000)):
+    for size in sizes:
+        conn = sqlite3.connect(":memory:")
+        conn.execute(
+            "CREATE TABLE article (id INTEGER PRIMARY KEY, title TEXT, author TEXT, summary TEXT, body TEXT,"
+            " raw_html TEXT, search_vector TEXT)"
+        )
+        conn.executemany(
+            "INSERT INTO article VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                (i, f"Title {i}", "someone", "A short summary", "body " * 200, "<p>html</p>" * 200, "vector " * 100)
+                for i in range(size)
+            ),
+        )
+
+        def full(c=conn):
+            return list(fetch_full(c, "article"))
+
+        def projected(c=conn):
+            return list(fetch_views(c, "article", ArticleLoad))
+
+        assert full() == projected()
+        for label, func in (("full rows", full), ("projected", projected)):
+            elapsed = min(timeit.repeat(func, number=1, repeat=3))
+            print(f"{size:>8} {label:>9}: {elapsed / size * 1e6:6.2f} us/row")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark the trusted conversions of views against the validating ones.
+
+Plain field constraints are checked by ``pydantic-core`` about as fast as trusted conversions copy
+the values, so trusted conversions pay off with Python validators, like the ones of ``Checked*``.
+
+Run with ``python benchmarks/bench_view_trusted.py``.
+"""
+
+import timeit
+
+from pydantic import BaseModel, Field, field_validator
+
+from pydantic_views import BuilderLoad, BuilderUpdate, ReadOnly
+
+
+class Address(BaseModel):
+    street: str
+    city: str
+    zip_code: str = Field(alias="zipCode")
+
+
+class User(BaseModel):
+    id: ReadOnly[int] = 0
+    name: str
+    email: str
+    age: int = Field(default=0, ge=0)
+    tags: list[str] = Field(default_factory=list)
+    address: Address
+    addresses: list[Address] = Field(default_factory=list)
+
+    @field_validator("email")
+    @classmethod
+    def lower_email(cls, value: str) -> str:
+        return value.lower()
+
+
+class CheckedAddress(Address):
+    @field_validator("street", "city")
+    @classmethod
+    def normalize(cls, value: str) -> str:
+        return " ".join(value.split()).title()
+
+    @field_validator("zip_code")
+    @classmethod
+    def check_zip_code(cls, value: str) -> str:
+        if not value.isdigit():
+            raise ValueError("invalid zip code")
+        return value
+
+
+class CheckedUser(User):
+    address: CheckedAddress
+    addresses: list[CheckedAddress] = Field(default_factory=list)
+
+    @field_validator("tags")
+    @classmethod
+    def unique_tags(cls, value: list[str]) -> list[str]:
+        return sorted(set(value))
+
+
+SCENARIOS = {
+    "plain": (BuilderUpdate().build_view(User), BuilderLoad().build_view(User)),
+    "validators": (BuilderUpdate().build_view(CheckedUser), BuilderLoad().build_view(CheckedUser)),
+}
+
+
+def main(number: int = 50_000):
+    data = {
+        "name": "Ann",
+        "email": "ann@example.com",
+        "age": 41,
+        "tags": ["a", "b"],
+        "address": {"street": "Main St. 1", "city": "Springfield", "zipCode": "12345"},
+        "addresses": [{"street": f"Side St. {i}", "city": "Shelbyville", "zipCode": "54321"} for i in range(3)],
+    }
+    for name, (update_view, load_view) in SCENARIOS.items():
+        update = update_view.model_validate(data)
+        model = update.view_build_to()
+        orig = model.model_validate({**data, "address": {**data["address"], "city": "Ogdenville"}})
+
+        calls = {
+            "view_build_to": lambda trusted, u=update: u.view_build_to(trusted=trusted),
+            "view_apply_to": lambda trusted, u=update, o=orig: u.view_apply_to(o, copy_on_write=True, trusted=trusted),
+            "view_build_from": lambda trusted, v=load_view, m=model: v.view_build_from(m, trusted=trusted),
+        }
+        for label, call in calls.items():
+            assert call(True) == call(False)
+            validating = min(timeit.repeat(lambda c=call: c(False), number=number, repeat=3))
+            trusted = min(timeit.repeat(lambda c=call: c(True), number=number, repeat=3))
+            print(
+                f"{name:>10} {label:>16}: validating {validating / number * 1e6:7.2f} us,"
+                f" trusted {trusted / number * 1e6:7.2f} us ({validating / trusted:.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
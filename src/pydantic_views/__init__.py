@@ -9,6 +9,7 @@ from .annotations import (
     AccessMode,
     AccessTag,
     Hidden,
+    KeyedBy,
     ReadAndWrite,
     ReadOnly,
     ReadOnlyOnCreation,
@@ -26,9 +27,10 @@ from .builder import (
     LoadPreset,
     Preset,
     UpdatePreset,
+    build_views,
     ensure_model_views,
 )
-from .manager import Manager
+from .manager import FieldAccess, Manager
 from .view import RootView, View
 
 __all__ = [
@@ -40,6 +42,7 @@ __all__ = [
     "WriteOnly",
     "WriteOnlyOnCreation",
     "Hidden",
+    "KeyedBy",
     "Builder",
     "BuilderCreate",
     "BuilderCreateResult",
@@ -50,8 +53,10 @@ __all__ = [
     "CreateResultPreset",
     "LoadPreset",
     "UpdatePreset",
+    "build_views",
     "ensure_model_views",
     "Manager",
+    "FieldAccess",
     "View",
     "RootView",
 ]
@@ -2,9 +2,10 @@
 Helpers to annotate Pydantic fields with access modes used by pydantic-views builders.
 
 These annotations tell the builders whether a field should be exposed for read, write,
-creation-only flows, or hidden entirely.
+creation-only flows, or hidden entirely, and how list fields are merged when views are applied.
 """
 
+from collections.abc import Iterable
 from enum import Enum, auto
 from typing import Annotated, ClassVar, TypeVar
 
@@ -32,6 +33,28 @@ class AccessMode(Enum):
     #: Hidden mark.
     HIDDEN = auto()
 
+    @property
+    def bit(self) -> int:
+        """
+        Bit of the access mode in access mode masks.
+
+        :returns: Power of two, unique to the access mode.
+        """
+        return 1 << (self.value - 1)
+
+    @classmethod
+    def mask(cls, modes: Iterable["AccessMode"]) -> int:
+        """
+        Compute the mask of some access modes.
+
+        :param modes: Access modes.
+        :returns: Bitwise or of the bits of ``modes``, ``0`` when there are none.
+        """
+        result = 0
+        for mode in modes:
+            result |= mode.bit
+        return result
+
 
 #: Read and write field annotation. Field could be read and written always.
 ReadAndWrite = Annotated[T, AccessMode.READ_AND_WRITE]
@@ -90,3 +113,34 @@ class AccessTag:
             super().__setattr__(name, value)
             return
         raise TypeError("AccessTag is immutable")
+
+
+class KeyedBy:
+    """
+    List merge annotation. It marks a list of models as keyed by one of their fields.
+
+    When a view is applied to a model, the elements of a keyed list are merged with the elements of
+    the original list sharing the same key, instead of replacing the whole list. Elements with an
+    unknown key, or without key, are appended.
+    """
+
+    __slots__ = ("key",)
+
+    def __init__(self, key: str) -> None:
+        """
+        :param key: Name of the element field used as key.
+        """
+        self.key = key
+
+    def __repr__(self) -> str:
+        return f"KeyedBy({self.key})"
+
+    __str__ = __repr__
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, KeyedBy):  # pragma: no cover
+            return NotImplemented
+        return self.key == other.key
+
+    def __hash__(self) -> int:
+        return hash((KeyedBy, self.key))
@@ -1,7 +1,8 @@
 import sys
-from collections.abc import Iterable, Mapping
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from contextlib import contextmanager
 from functools import reduce
-from types import NoneType, UnionType
+from types import ModuleType, NoneType, UnionType
 from typing import (
     Annotated,
     Any,
@@ -14,11 +15,12 @@ from typing import (
 )
 
 from pydantic import BaseModel, RootModel, create_model
+from pydantic.alias_generators import to_pascal
 from pydantic.fields import ComputedFieldInfo, FieldInfo
 from pydantic_core import MISSING, PydanticUndefined
 
-from .annotations import AccessMode, AccessTag
-from .manager import Manager
+from .annotations import AccessMode, AccessTag, KeyedBy
+from .manager import FieldAccess, Manager
 from .view import View
 
 
@@ -35,6 +37,8 @@ class Builder:
         all_nullable: bool = False,
         hide_default_null: bool = False,
         include_computed_fields: bool = False,
+        trusted: bool = False,
+        defer_build: bool = False,
     ) -> None:
         """
         :param view_name: Name suffix for the generated view class.
@@ -47,16 +51,28 @@ class Builder:
         :param all_nullable: Make all fields nullable when allowed.
         :param hide_default_null: Replace default ``None`` with ``PydanticUndefined`` to hide ``null`` in schemas.
         :param include_computed_fields: Whether computed fields should be included in generated views.
+        :param trusted: Make generated views convert data without validation by default
+                        (see :attr:`View.__view_trusted__ <pydantic_views.view.View.__view_trusted__>`).
+        :param defer_build: Make generated views compile their validator and serializer on first use
+                            instead of on creation (see :meth:`warm`).
         """
         self.view_name = view_name
         self.access_modes = set(access_modes) if access_modes is not None else set()
         self.include_tags = set(include_tags) if include_tags is not None else set()
         self.exclude_tags = set(exclude_tags) if exclude_tags is not None else set()
+        self._modes_mask = AccessMode.mask(self.access_modes)
+        self._include_tags = frozenset(self.include_tags)
+        self._exclude_tags = frozenset(self.exclude_tags)
         self.all_optional = all_optional
         self.all_nullable = all_nullable
         self.hide_default_null = hide_default_null
         self.include_computed_fields = include_computed_fields
+        self.trusted = trusted
+        self.defer_build = defer_build
         self._views: dict[type[BaseModel], type[View[BaseModel]] | ForwardRef] = {}
+        self._keyed_builders: dict[str, Builder] = {}
+        self._pending = _PendingViews()
+        self._fields: dict[FieldInfo, _FieldAnalysis] = {}
 
     def build_view[T: BaseModel](self, model: type[T]) -> type[View[T] | T]:
         """
@@ -71,14 +87,48 @@ class Builder:
         except (KeyError, TypeError):
             result = manager.build_view(self)
 
-        [
-            v.model_rebuild(raise_errors=False)  # type: ignore
-            for v in self._views.values()
-            if not isinstance(v, ForwardRef)
-        ]
+        self._pending.rebuild()
 
         return result
 
+    def defer_view(self, model: type[BaseModel]):
+        """
+        Record the view for the given model, to build it on first use.
+
+        The view is built when it is got from the model views manager, when it is got as an
+        attribute of the model module (``module.ModelCreate``), or when another view refers to it.
+        Processes using a few views of many models don't pay for the validators and serializers
+        of the other views.
+
+        :param model: Model class to derive the view from.
+        """
+        ensure_model_views(model).defer_view(self)
+        _module_views(model.__module__)[self._view_class_name(model)] = (self, model)
+
+    def warm(self, *models: type[BaseModel]):
+        """
+        Compile the validators and serializers of views built with ``defer_build``.
+
+        Views of the given models are built first when needed, deferred ones included.
+
+        :param models: Model classes of the views to compile. All the views built by this builder
+                       are compiled when none is given.
+        :raises pydantic.errors.PydanticUndefinedAnnotation: When a view refers to an undefined type.
+        """
+        if models:
+            views = [self.build_view(model) for model in models]
+        else:
+            views = [
+                view
+                for builder in (self, *self._keyed_builders.values())
+                for view in builder._views.values()
+                if not isinstance(view, ForwardRef)
+            ]
+
+        for view in views:
+            if not view.__pydantic_complete__:
+                view.model_rebuild()
+
     def get_view_ref[T: BaseModel](self, model: type[T]) -> type[View[T] | T] | ForwardRef:
         """
         Return the view class or a forward reference for the model.
@@ -87,9 +137,13 @@ class Builder:
         :returns: View class or forward reference for ``model``.
         """
         try:
-            return cast(type[View[T]] | ForwardRef, self._views[model])
+            view_cache = self._views[model]
         except KeyError:
             pass
+        else:
+            if isinstance(view_cache, ForwardRef):
+                self._pending.awaiting(self, model)
+            return cast(type[View[T]] | ForwardRef, view_cache)
 
         manager = ensure_model_views(model)
 
@@ -102,18 +156,23 @@ class Builder:
 
         return view
 
-    def _filter_field(self, f_info: FieldInfo):
-        am = {m for m in f_info.metadata if isinstance(m, AccessMode)}
-        tags = {t for t in f_info.metadata if isinstance(t, AccessTag)}
+    def _analyze_field(self, f_info: FieldInfo) -> "_FieldAnalysis":
+        try:
+            return self._fields[f_info]
+        except KeyError:
+            analysis = self._fields[f_info] = _FieldAnalysis(f_info)
+            return analysis
 
-        if (self.access_modes is not None and len(am & set(self.access_modes)) > 0) or len(am) == 0:
-            return self.exclude_tags is not None and len(tags & set(self.exclude_tags)) > 0
+    def _filter_field(self, access: FieldAccess) -> bool:
+        if not access.modes or access.modes & self._modes_mask:
+            return not self._exclude_tags.isdisjoint(access.tags)
 
-        return not (self.include_tags is not None and len(tags & set(self.include_tags)) > 0)
+        return self._include_tags.isdisjoint(access.tags)
 
     def _iter_fields[T: BaseModel](self, model: type[T]):
+        field_access = ensure_model_views(model).field_access
         for f_name, f_info in model.model_fields.items():
-            if self._filter_field(f_info):
+            if self._filter_field(field_access[f_name]):
                 continue
             yield f_name, f_info
 
@@ -149,6 +208,9 @@ class Builder:
     def set_forward_ref(self, model: type[BaseModel], name: str, module: str):
         self._views[model] = ForwardRef(name, module=module)
 
+    def _view_class_name(self, model: type[BaseModel]) -> str:
+        return model.__name__ + self.view_name[0].upper() + self.view_name[1:]
+
     def build_from_model[T: BaseModel](self, model: type[T]) -> type[View[T] | T]:
         """
         Build the concrete view class from the provided model.
@@ -156,7 +218,7 @@ class Builder:
         :param model: Model class to derive the view from.
         :returns: Generated view class for the model.
         """
-        view_name = model.__name__ + self.view_name[0].upper() + self.view_name[1:]
+        view_name = self._view_class_name(model)
         try:
             view_cache = self._views[model]
             if not isinstance(view_cache, ForwardRef):
@@ -174,13 +236,19 @@ class Builder:
         except KeyError:
             from .view import RootView
 
-            model_fields = self.define_fields_from_model(model)
+            with self._pending.collect() as awaited:
+                model_fields = self.define_fields_from_model(model)
 
             params: dict[str, Any] = {
                 "__module__": model.__module__,
                 "__base__": (RootView[model] if issubclass(model, RootModel) else View[model]),
                 "__doc__": (f"View `{self.view_name}` of model :class:`~{model.__module__}.{model.__qualname__}`"),
-                "__cls_kwargs__": {"view_name": self.view_name, "no_process": True},
+                "__cls_kwargs__": {
+                    "view_name": self.view_name,
+                    "no_process": True,
+                    "trusted": self.trusted,
+                    "defer_build": self.defer_build,
+                },
                 **model_fields,
             }
 
@@ -194,6 +262,7 @@ class Builder:
 
             setattr(sys.modules[model.__module__], view_name, view)
             self._views[model] = cast(type[View[BaseModel]], view)
+            self._pending.add(view, awaited)
 
         return view
 
@@ -203,28 +272,36 @@ class Builder:
         *,
         ignore_nullable: bool = False,
     ) -> tuple[type[Any] | None, FieldInfo]:
-        f_info = FieldInfo.merge_field_infos(
-            f_info,
-            annotation=self._map_annotation(f_info.annotation, ignore_nullable=ignore_nullable),
-            metadata=[m for m in f_info.metadata if not isinstance(m, (AccessMode, AccessTag))],
-        )
-
+        analysis = self._analyze_field(f_info)
+
+        # Annotations not referring to models are mapped the same way by builders with the same flags.
+        flags = (self.all_nullable, self.hide_default_null, ignore_nullable)
+        annotation = analysis.annotations.get(flags, PydanticUndefined) if analysis.plain else PydanticUndefined
+        if annotation is PydanticUndefined:
+            mapper = self if analysis.keyed_by is None else self._keyed_builder(analysis.keyed_by.key)
+            annotation = mapper._map_annotation(f_info.annotation, ignore_nullable=ignore_nullable)
+            if analysis.plain:
+                analysis.annotations[flags] = annotation
+
+        overrides: dict[str, Any] = {"annotation": annotation, "metadata": list(analysis.metadata)}
         if self.all_optional:
-            f_info = FieldInfo.merge_field_infos(
-                f_info,
-                default_factory=lambda: MISSING,
-            )
-            f_info.default = PydanticUndefined
+            overrides["default_factory"] = lambda: MISSING
+        elif self.hide_default_null and f_info.default is None:
+            overrides["default_factory"] = lambda: None
 
-        if self.hide_default_null and f_info.default is None:
-            f_info = FieldInfo.merge_field_infos(
-                f_info,
-                default_factory=lambda: None,
-            )
+        f_info = FieldInfo.merge_field_infos(f_info, **overrides)
+        if "default_factory" in overrides:
             f_info.default = PydanticUndefined
 
         return f_info.annotation, f_info
 
+    def _keyed_builder(self, key: str) -> "Builder":
+        try:
+            return self._keyed_builders[key]
+        except KeyError:
+            builder = self._keyed_builders[key] = _KeyedItemBuilder(self, key)
+            return builder
+
     def _map_annotation(
         self, annotation: type[Any] | None, *, ignore_nullable: bool = False
     ) -> type[Any] | ForwardRef | None | UnionType:
@@ -296,6 +373,166 @@ class Builder:
         )
 
 
+class _KeyedItemBuilder(Builder):
+    """
+    Builder of the element views of lists annotated with :class:`~pydantic_views.annotations.KeyedBy`.
+
+    Elements are merged by key, so their views must expose the key field even when the parent
+    builder filters it out (e.g. a read only ``id`` in ``Update`` views). In that case an element
+    view including the key field is built, named after the parent view and the key
+    (e.g. ``LineUpdateById``). Otherwise, and for every nested field, the parent builder is used.
+    """
+
+    def __init__(self, parent: Builder, key: str) -> None:
+        """
+        :param parent: Builder of the view holding the keyed list.
+        :param key: Name of the element field used as key.
+        """
+        super().__init__(
+            view_name=f"{parent.view_name}By{to_pascal(key)}",
+            access_modes=parent.access_modes,
+            include_tags=parent.include_tags,
+            exclude_tags=parent.exclude_tags,
+            all_optional=parent.all_optional,
+            all_nullable=parent.all_nullable,
+            hide_default_null=parent.hide_default_null,
+            include_computed_fields=parent.include_computed_fields,
+            trusted=parent.trusted,
+            defer_build=parent.defer_build,
+        )
+        self.parent = parent
+        self.key = key
+        self._pending = parent._pending
+        self._fields = parent._fields
+
+    def get_view_ref[T: BaseModel](self, model: type[T]) -> type[View[T] | T] | ForwardRef:
+        access = ensure_model_views(model).field_access.get(self.key)
+        if access is None or not self.parent._filter_field(access):
+            return self.parent.get_view_ref(model)
+        return super().get_view_ref(model)
+
+    def _iter_fields[T: BaseModel](self, model: type[T]):
+        field_access = ensure_model_views(model).field_access
+        for f_name, f_info in model.model_fields.items():
+            if f_name == self.key or not self._filter_field(field_access[f_name]):
+                yield f_name, f_info
+
+    def _map_field_info(
+        self,
+        f_info: FieldInfo,
+        *,
+        ignore_nullable: bool = False,
+    ) -> tuple[type[Any] | None, FieldInfo]:
+        return self.parent._map_field_info(f_info, ignore_nullable=ignore_nullable)
+
+
+class _FieldAnalysis:
+    """
+    Metadata and annotation analysis of a model field, shared by the builders of its views.
+
+    Access metadata is indexed by the model views manager instead
+    (see :attr:`Manager.field_access <pydantic_views.manager.Manager.field_access>`).
+    """
+
+    __slots__ = ("keyed_by", "metadata", "plain", "annotations")
+
+    def __init__(self, f_info: FieldInfo) -> None:
+        """
+        :param f_info: Model field.
+        """
+        #: Key of the list elements, when it is a list annotated with :class:`KeyedBy`.
+        self.keyed_by = next((m for m in f_info.metadata if isinstance(m, KeyedBy)), None)
+        #: Field metadata without access metadata.
+        self.metadata = [m for m in f_info.metadata if not isinstance(m, (AccessMode, AccessTag))]
+        #: Whether the annotation does not refer to any model, so it does not depend on views.
+        self.plain = not _refers_models(f_info.annotation)
+        #: Mapped plain annotations, by builder ``all_nullable``, ``hide_default_null`` and
+        #: ``ignore_nullable`` flags.
+        self.annotations: dict[tuple[bool, bool, bool], Any] = {}
+
+
+def _refers_models(annotation: Any) -> bool:
+    if get_origin(annotation) is Literal:
+        return False
+    if isinstance(annotation, (str, ForwardRef)):
+        return True
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return True
+    return any(_refers_models(a) for a in get_args(annotation))
+
+
+class _PendingViews:
+    """
+    Views built while some of the views they refer to were not built yet.
+
+    It is shared by a builder and its keyed item builders, which refer to each other's views. Each
+    view keeps the forward references it is waiting on, and it is rebuilt only once all of them are
+    built, and only when some view was built since its last attempt.
+    """
+
+    __slots__ = ("views", "collecting", "generation")
+
+    def __init__(self) -> None:
+        #: Pending views, with the builder and model of the views they are waiting on and the
+        #: generation of their last attempt.
+        self.views: dict[type[BaseModel], tuple[set[tuple[Builder, type[BaseModel]]], int]] = {}
+        #: Forward references used by the views being defined, innermost last.
+        self.collecting: list[set[tuple[Builder, type[BaseModel]]]] = []
+        #: Number of views built or completed so far.
+        self.generation = 0
+
+    @contextmanager
+    def collect(self) -> Iterator[set[tuple[Builder, type[BaseModel]]]]:
+        """
+        Collect the forward references used while defining the fields of a view.
+
+        :returns: Set of builders and models of the forward references.
+        """
+        awaited: set[tuple[Builder, type[BaseModel]]] = set()
+        self.collecting.append(awaited)
+        try:
+            yield awaited
+        finally:
+            self.collecting.pop()
+
+    def awaiting(self, builder: Builder, model: type[BaseModel]):
+        """
+        Record that the view being defined uses the forward reference of a view not built yet.
+
+        :param builder: Builder of the referred view.
+        :param model: Model of the referred view.
+        """
+        if self.collecting:
+            self.collecting[-1].add((builder, model))
+
+    def add(self, view: type[BaseModel], awaited: set[tuple[Builder, type[BaseModel]]]):
+        """
+        Register a view just built, when it is not complete.
+
+        :param view: View class.
+        :param awaited: Builders and models of the forward references used by the view.
+        """
+        self.generation += 1
+        if not view.__pydantic_complete__ and not view.model_config.get("defer_build"):
+            self.views[view] = (awaited, self.generation)
+
+    def rebuild(self):
+        """Rebuild the pending views which may be completed, until no more views are completed."""
+        progress = True
+        while progress and self.views:
+            progress = False
+            for view, (awaited, generation) in list(self.views.items()):
+                if generation == self.generation or any(isinstance(b._views[m], ForwardRef) for b, m in awaited):
+                    continue
+
+                if view.__pydantic_complete__ or view.model_rebuild(raise_errors=False):
+                    del self.views[view]
+                    self.generation += 1
+                    progress = True
+                else:
+                    self.views[view] = (awaited, self.generation)
+
+
 class Preset(NamedTuple):
     """Preset for a builder with predefined configuration."""
 
@@ -307,6 +544,8 @@ class Preset(NamedTuple):
     all_nullable: bool = False
     hide_default_null: bool = False
     include_computed_fields: bool = False
+    trusted: bool = False
+    defer_build: bool = False
 
 
 CreatePreset = Preset(
@@ -427,3 +666,93 @@ def ensure_model_views[T: BaseModel](model: type[T]):
     model.model_views = manager  # type: ignore
 
     return manager
+
+
+class _ModuleViews(dict[str, tuple[Builder, type[BaseModel]]]):
+    """
+    Deferred views of a module, by class name, installed as the module ``__getattr__`` hook.
+
+    A module ``__getattr__`` hook defined before is called for any other name.
+    """
+
+    def __init__(self, module: ModuleType) -> None:
+        """
+        :param module: Module holding the models.
+        """
+        super().__init__()
+        self.module_name = module.__name__
+        self.fallback: Callable[[str], Any] | None = getattr(module, "__getattr__", None)
+
+    def __call__(self, name: str) -> Any:
+        try:
+            builder, model = self[name]
+        except KeyError:
+            if self.fallback is not None:
+                return self.fallback(name)
+            raise AttributeError(f"module {self.module_name!r} has no attribute {name!r}") from None
+
+        return ensure_model_views(model)[builder.view_name]
+
+
+def _module_views(module_name: str) -> _ModuleViews:
+    module = sys.modules[module_name]
+    hook = getattr(module, "__getattr__", None)
+    if not isinstance(hook, _ModuleViews):
+        hook = _ModuleViews(module)
+        module.__getattr__ = hook  # type: ignore
+    return hook
+
+
+def build_views(
+    models: type[BaseModel] | Iterable[type[BaseModel]] | ModuleType,
+    presets: Iterable[Preset] = (CreatePreset, CreateResultPreset, UpdatePreset, LoadPreset),
+) -> dict[type[BaseModel], dict[str, type[View[BaseModel]]]]:
+    """
+    Build the views of many models for many presets in one pass.
+
+    The builders of the presets share the analysis of the access metadata and annotations of every
+    model field, and views referring to views not built yet are rebuilt once per model, after the
+    views of all the presets are built. Views already built are kept.
+
+    :param models: Model class, model classes, or module whose model classes get views. View classes
+                   and models imported from other modules are skipped.
+    :param presets: Presets of the views to build. Standard presets by default.
+    :returns: Views by model class and view name.
+    """
+    model_classes: Iterable[type[BaseModel]]
+    if isinstance(models, ModuleType):
+        model_classes = [
+            m
+            for m in list(vars(models).values())
+            if isinstance(m, type)
+            and issubclass(m, BaseModel)
+            and not issubclass(m, View)
+            and m.__module__ == models.__name__
+        ]
+    elif isinstance(models, type):
+        model_classes = [models]
+    else:
+        model_classes = cast(Iterable[type[BaseModel]], models)
+
+    pending = _PendingViews()
+    fields: dict[FieldInfo, _FieldAnalysis] = {}
+    builders = [Builder(**preset._asdict()) for preset in presets]
+    for builder in builders:
+        builder._pending = pending
+        builder._fields = fields
+
+    views: dict[type[BaseModel], dict[str, type[View[BaseModel]]]] = {}
+    for model in model_classes:
+        manager = ensure_model_views(model)
+        model_views = views[model] = {}
+        for builder in builders:
+            try:
+                view = manager[builder.view_name]
+            except KeyError:
+                view = manager.build_view(builder)
+            model_views[builder.view_name] = cast(type[View[BaseModel]], view)
+
+        # Views referring to complete views reuse their schemas, so views are completed as soon as possible.
+        pending.rebuild()
+
+    return views
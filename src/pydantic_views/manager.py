@@ -1,18 +1,44 @@
-from typing import TYPE_CHECKING
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, NamedTuple
 from weakref import ref
 
 from pydantic import BaseModel
 
+from .annotations import AccessMode, AccessTag
 from .view import View
 
 if TYPE_CHECKING:
-    from .builder import Builder
+    from .builder import Builder, Preset
+
+
+class FieldAccess(NamedTuple):
+    """Access metadata of a model field."""
+
+    #: Access modes of the field, as a :meth:`mask <pydantic_views.AccessMode.mask>`.
+    #: It is ``0`` for fields without access mode.
+    modes: int
+    #: Access tags of the field.
+    tags: frozenset[AccessTag]
+
+    @classmethod
+    def from_metadata(cls, metadata: list[Any]) -> "FieldAccess":
+        """
+        Extract the access metadata from the metadata of a field.
+
+        :param metadata: Field metadata.
+        :returns: Access metadata of the field.
+        """
+        return cls(
+            modes=AccessMode.mask(m for m in metadata if isinstance(m, AccessMode)),
+            tags=frozenset(t for t in metadata if isinstance(t, AccessTag)),
+        )
 
 
 class Manager[TModel: BaseModel]:
     """Registry and factory for views derived from a model class."""
 
-    __slots__ = ("_model", "_views")
+    __slots__ = ("_model", "_views", "_deferred", "_access")
 
     def __init__(self, model: type[TModel]):
         """
@@ -22,6 +48,8 @@ class Manager[TModel: BaseModel]:
         """
         self._model = ref(model)
         self._views: dict[str, type[View[TModel] | TModel]] = {}
+        self._deferred: dict[str, Builder] = {}
+        self._access: tuple[dict[str, Any], Mapping[str, FieldAccess]] | None = None
 
     @property
     def model(self) -> type[TModel]:
@@ -35,14 +63,61 @@ class Manager[TModel: BaseModel]:
             raise RuntimeError("Model class disappeared")
         return result
 
+    @property
+    def field_access(self) -> Mapping[str, FieldAccess]:
+        """
+        Access metadata of the model fields, by field name.
+
+        It is computed once, and again only when the model fields are rebuilt.
+
+        :returns: Read only mapping of the access metadata of every model field.
+        """
+        fields = self.model.__pydantic_fields__
+        if self._access is None or self._access[0] is not fields:
+            self._access = (
+                fields,
+                MappingProxyType(
+                    {f_name: FieldAccess.from_metadata(f_info.metadata) for f_name, f_info in fields.items()}
+                ),
+            )
+        return self._access[1]
+
+    def visible_fields(self, builder: "Builder | Preset") -> tuple[str, ...]:
+        """
+        Get the names of the fields of a view, without building it.
+
+        :param builder: Builder or preset of the view.
+        :returns: Names of the view fields, computed fields included when the builder includes them.
+        """
+        from .builder import Builder
+
+        if not isinstance(builder, Builder):
+            builder = Builder(**builder._asdict())
+
+        names = [f_name for f_name, _ in builder._iter_fields(self.model)]
+        if builder.include_computed_fields:
+            names.extend(f_name for f_name, _ in builder._iter_computed_fields(self.model))
+        return tuple(names)
+
     def __getitem__(self, view_name: str) -> type["View[TModel] | TModel"]:
         """
         Get a model view.
 
+        Deferred views are built on first access.
+
         :param view_name: Name of view to get.
         :returns: View class registered under ``view_name``.
         """
-        return self._views[view_name]
+        try:
+            return self._views[view_name]
+        except KeyError:
+            builder = self._deferred.pop(view_name)
+
+        try:
+            return builder.build_view(self.model)
+        except BaseException:
+            self._deferred[view_name] = builder
+            raise
 
     def __setitem__(self, view_name: str, view: type["View[TModel] | TModel"]):
         """
@@ -53,6 +128,17 @@ class Manager[TModel: BaseModel]:
         """
         self._views[view_name] = view
 
+    def defer_view(self, builder: "Builder"):
+        """
+        Record the builder of a view, to build the view on first access.
+
+        Views already built or deferred under the builder name are kept.
+
+        :param builder: Builder used to generate the view for the managed model.
+        """
+        if builder.view_name not in self._views:
+            self._deferred.setdefault(builder.view_name, builder)
+
     def build_view(self, builder: "Builder") -> type["View[TModel] | TModel"]:
         """
         Build view class for Manager's model.
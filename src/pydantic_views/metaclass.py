@@ -58,6 +58,8 @@ class ViewMetaClass(ModelMetaclass):
         hide_default_null: bool = False,
         include_computed_fields: bool = False,
         no_process: bool = False,
+        trusted: bool = False,
+        defer_build: bool = False,
         **kwargs,
     ):
         if ABC in bases or namespace.get("__module__") == "pydantic_views.view":
@@ -81,6 +83,7 @@ class ViewMetaClass(ModelMetaclass):
             pass
 
         namespace["__model_class_root__"] = ref(model_class)
+        namespace["__view_trusted__"] = trusted
         namespace["model_config"] = deepcopy(model_class.model_config)
         namespace["model_config"]["protected_namespaces"] = tuple(
             {
@@ -88,6 +91,8 @@ class ViewMetaClass(ModelMetaclass):
                 *ConfigWrapper(view_class.model_config).protected_namespaces,
             }
         )
+        if defer_build:
+            namespace["model_config"]["defer_build"] = True
 
         if no_process:
             return super().__new__(cls, name, bases, namespace, **kwargs)
@@ -103,6 +108,8 @@ class ViewMetaClass(ModelMetaclass):
             all_nullable=all_nullable,
             hide_default_null=hide_default_null,
             include_computed_fields=include_computed_fields,
+            trusted=trusted,
+            defer_build=defer_build,
         )
         builder.set_forward_ref(model_class, name, namespace["__module__"])
 
@@ -546,6 +546,8 @@ PRESET_FIELDS = (
     "all_nullable",
     "hide_default_null",
     "include_computed_fields",
+    "trusted",
+    "defer_build",
 )
 
 
@@ -0,0 +1,2293 @@
+"""
+Compiled conversion plans used by :class:`~pydantic_views.view.View` helpers.
+
+A plan is computed once per view class, on first use, and stored on the class itself. It turns the
+per-call work of moving data between a view and its base model into a flat loop over precomputed
+field steps, avoiding intermediate serialization passes wherever possible.
+"""
+
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from functools import partial
+from types import UnionType
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    ForwardRef,
+    Literal,
+    NamedTuple,
+    Self,
+    Union,
+    cast,
+    get_args,
+    get_origin,
+)
+
+from pydantic import AliasChoices, BaseModel, RootModel, TypeAdapter
+from pydantic.fields import FieldInfo
+from pydantic_core import MISSING, PydanticUndefined, SchemaSerializer, SchemaValidator, ValidationError, core_schema
+
+from .annotations import AccessMode, AccessTag, KeyedBy
+
+if TYPE_CHECKING:
+    from .view import View
+
+type Converter = Callable[[Any], Any]
+type Leaf = Callable[[type[Any]], tuple[type[Any], Converter] | None]
+
+
+def class_plans(cls: type[BaseModel]) -> dict[Any, Any]:
+    """
+    Return the plan cache owned by ``cls``.
+
+    The cache lives in the class ``__dict__`` so subclasses never reuse the plans of their parents.
+
+    :param cls: Class owning the cache.
+    :returns: Mutable plan cache.
+    """
+    try:
+        return cls.__dict__["__view_plans__"]
+    except KeyError:
+        plans: dict[Any, Any] = {}
+        type.__setattr__(cls, "__view_plans__", plans)
+        return plans
+
+
+def ensure_complete(cls: type[BaseModel]):
+    """
+    Make sure ``cls`` has resolved all its forward references.
+
+    :param cls: Model class.
+    """
+    if not cls.__pydantic_complete__:
+        cls.model_rebuild()
+
+
+def compile_converter(annotation: Any, leaf: Leaf) -> Converter | None:
+    """
+    Compile a converter for values of the given annotation.
+
+    The ``leaf`` callable decides which classes must be converted. Containers (sequences, sets,
+    tuples and mappings) and unions are traversed, so only the parts of a value that may hold a
+    convertible class are visited at runtime.
+
+    :param annotation: Field annotation.
+    :param leaf: Returns the class to match and its converter, or ``None`` when a class is left as is.
+    :returns: Converter, or ``None`` when values of ``annotation`` never need conversion.
+    """
+    compiled = _compile(annotation, leaf)
+    return compiled[1] if compiled is not None else None
+
+
+def _compile(annotation: Any, leaf: Leaf) -> tuple[Any, Converter] | None:
+    origin = get_origin(annotation)
+
+    if origin is Annotated:
+        return _compile(get_args(annotation)[0], leaf)
+
+    if origin is None:
+        if annotation is Self:
+            # ``Self`` is only resolved by pydantic, so it stands for any model class.
+            return leaf(BaseModel)
+        return leaf(annotation) if isinstance(annotation, type) else None
+
+    args = get_args(annotation)
+
+    if origin is Union or origin is UnionType:
+        return _compile_union([b for b in (_compile(a, leaf) for a in args) if b is not None])
+
+    if not isinstance(origin, type) or not issubclass(origin, Iterable):
+        return None
+
+    if issubclass(origin, Mapping):
+        if len(args) != 2 or (item := _compile(args[1], leaf)) is None:
+            return None
+        convert_item = item[1]
+        return Mapping, lambda value: {k: convert_item(v) for k, v in value.items()}
+
+    if issubclass(origin, tuple) and not (len(args) == 2 and args[1] is Ellipsis):
+        items = [_compile(a, leaf) for a in args]
+        if all(i is None for i in items):
+            return None
+        converters = [i[1] if i is not None else None for i in items]
+        return tuple, lambda value: tuple(c(v) if c is not None else v for c, v in zip(converters, value, strict=False))
+
+    if len(args) == 0 or (item := _compile(args[0], leaf)) is None:
+        return None
+
+    convert_item = item[1]
+    if issubclass(origin, (tuple, set, frozenset)):
+        container = origin if origin in (tuple, set, frozenset) else set
+        return origin, lambda value: container(convert_item(v) for v in value)
+    return origin, lambda value: [convert_item(v) for v in value]
+
+
+def _compile_union(branches: list[tuple[Any, Converter]]) -> tuple[Any, Converter] | None:
+    if len(branches) == 0:
+        return None
+
+    if len(branches) == 1:
+        match, convert = branches[0]
+        return match, lambda value: convert(value) if isinstance(value, match) else value
+
+    def convert_union(value: Any) -> Any:
+        for match, convert in branches:
+            if isinstance(value, match):
+                return convert(value)
+        return value
+
+    return tuple(m for m, _ in branches), convert_union
+
+
+def validation_key(name: str, f_info: FieldInfo, model: type[BaseModel]) -> str | None:
+    """
+    Return the input key ``model`` accepts for one of its fields.
+
+    :param name: Field name.
+    :param f_info: Model field information.
+    :param model: Model class owning the field.
+    :returns: Key to use in validation input, or ``None`` when it could only be given as a path.
+    """
+    if model.model_config.get("validate_by_alias", True) is False:
+        return name
+
+    alias = f_info.validation_alias
+    if alias is None:
+        return f_info.alias or name
+    if isinstance(alias, str):
+        return alias
+    if isinstance(alias, AliasChoices):
+        return next((c for c in alias.choices if isinstance(c, str)), None)
+    return None
+
+
+class BuildToStep(NamedTuple):
+    """Precomputed handling of one view field when building the base model."""
+
+    #: Input key used to validate the field on the base model.
+    key: str
+
+    #: Field default on the view, or ``PydanticUndefined``.
+    default: Any
+
+    #: Field default factory on the view, or ``None``.
+    default_factory: Callable[[], Any] | None
+
+
+class BuildToPlan:
+    """
+    Compiled conversion from a view class to its base model.
+
+    When no view field may hold a nested model, the plan moves the set values of a view straight
+    into the validation input of the base model. Otherwise the view is serialized in a single
+    ``pydantic-core`` call. Either way, the base model validates the input once.
+
+    Nested views are not compiled into steps: collecting their values in Python costs as much as
+    serializing them, and validating the base model dominates both, so views holding nested views
+    gain nothing over dumping and validating.
+    """
+
+    __slots__ = ("model", "steps")
+
+    def __init__(self, view_cls: "type[View[Any]]") -> None:
+        """
+        :param view_cls: View class to compile.
+        """
+        ensure_complete(view_cls)
+
+        self.model: type[BaseModel] = view_cls.view_class_root()
+
+        #: Steps by view field name, or ``None`` when the view must be serialized.
+        self.steps: dict[str, BuildToStep] | None = None
+
+        # Serializers of the view change the input of the base model.
+        if issubclass(view_cls, RootModel) or _has_serializers(view_cls):
+            return
+
+        model_fields = self.model.model_fields
+        computed_fields = self.model.model_computed_fields
+        steps: dict[str, BuildToStep] = {}
+        for f_name, f_info in view_cls.model_fields.items():
+            if f_name in computed_fields:
+                continue
+
+            if holds_models(f_info.annotation):
+                return
+
+            if f_name in model_fields:
+                key = validation_key(f_name, model_fields[f_name], self.model)
+                if key is None:
+                    return
+            else:
+                key = f_info.serialization_alias or f_name
+
+            default_factory = f_info.default_factory
+            if default_factory is not None and f_info.default_factory_takes_validated_data:
+                default_factory = None
+
+            steps[f_name] = BuildToStep(
+                key=key,
+                default=f_info.default,
+                default_factory=default_factory,  # type: ignore
+            )
+
+        self.steps = steps
+
+    def data(self, view: BaseModel) -> Any:
+        """
+        Collect the validation input of the base model from a view instance.
+
+        Only fields set on the view with a non default value are collected.
+
+        :param view: View instance.
+        :returns: Validation input for the base model.
+        """
+        steps = self.steps
+        if steps is None:
+            return view.__pydantic_serializer__.to_python(
+                view, exclude_unset=True, exclude_defaults=True, by_alias=True
+            )
+
+        values = view.__dict__
+        data: dict[str, Any] = {}
+        for f_name in view.__pydantic_fields_set__:
+            try:
+                step = steps[f_name]
+            except KeyError:
+                continue
+
+            value = values[f_name]
+            if value is MISSING:
+                continue
+            if step.default is not PydanticUndefined:
+                if value == step.default:
+                    continue
+            elif step.default_factory is not None and value == step.default_factory():
+                continue
+
+            data[step.key] = value
+
+        if view.__pydantic_extra__:
+            data.update(view.__pydantic_extra__)
+
+        return data
+
+    def __call__(self, view: BaseModel) -> BaseModel:
+        """
+        Build the base model instance from a view instance.
+
+        :param view: View instance.
+        :returns: Base model instance.
+        """
+        return self.model.__pydantic_validator__.validate_python(self.data(view))
+
+
+def build_to_plan(view_cls: "type[View[Any]]") -> BuildToPlan:
+    """
+    Return the cached view to model plan of a view class.
+
+    :param view_cls: View class.
+    :returns: Compiled plan.
+    """
+    plans = class_plans(view_cls)
+    try:
+        return plans[BuildToPlan]
+    except KeyError:
+        plan = plans[BuildToPlan] = BuildToPlan(view_cls)
+        return plan
+
+
+class ConstructStep(NamedTuple):
+    """Precomputed handling of one base model field when constructing it from a view without validation."""
+
+    #: Model field name.
+    name: str
+
+    #: Whether the view defines the field.
+    in_view: bool
+
+    #: Field default on the view, or ``PydanticUndefined``.
+    view_default: Any
+
+    #: Field default factory on the view, or ``None``.
+    view_default_factory: Callable[[], Any] | None
+
+    #: Converter turning nested views into their models, or ``None``.
+    convert: Converter | None
+
+    #: Shareable default of the model field, or ``PydanticUndefined``.
+    default: Any
+
+    #: Default getter of the model field receiving the values collected so far, or ``None``.
+    get_default: Callable[[dict[str, Any]], Any] | None
+
+
+class ConstructPlan:
+    """
+    Compiled trusted conversion from a view class to its base model.
+
+    The values set on a view are moved into a new base model instance, as
+    :meth:`~pydantic.BaseModel.model_construct` would do, and nested views are constructed into their
+    models the same way, so no validator runs. Fields set on the view with a non default value are
+    the fields set on the model; the other model fields get their defaults. Views leaving required
+    model fields unset, themselves or in their nested views, are validated instead, so the missing
+    fields are reported as validation errors rather than left out of the model.
+
+    Views with serializers are built through :class:`BuildToPlan` instead, since their serializers
+    change the input of the base model.
+    """
+
+    __slots__ = ("view", "model", "steps", "extra", "fallback")
+
+    def __init__(self, view_cls: "type[View[Any]]") -> None:
+        """
+        :param view_cls: View class to compile.
+        """
+        ensure_complete(view_cls)
+
+        self.view = view_cls
+        self.model: type[BaseModel] = view_cls.view_class_root()
+
+        #: Whether the model keeps extra data.
+        self.extra = self.model.model_config.get("extra") == "allow"
+
+        #: Validating plan used when the view has serializers.
+        self.fallback = build_to_plan(view_cls) if _has_serializers(view_cls) else None
+
+        view_fields = view_cls.model_fields
+        steps: list[ConstructStep] = []
+        for f_name, m_info in self.model.model_fields.items():
+            f_info = view_fields.get(f_name)
+            view_default: Any = PydanticUndefined
+            view_default_factory: Any = None
+            convert = None
+            if f_info is not None:
+                view_default = f_info.default
+                view_default_factory = f_info.default_factory
+                if view_default_factory is not None and (
+                    f_info.default_factory_takes_validated_data or view_default_factory() is MISSING  # type: ignore
+                ):
+                    # ``MISSING`` values are skipped anyway.
+                    view_default_factory = None
+                convert = compile_converter(f_info.annotation, _view_to_model_leaf)
+
+            steps.append(
+                ConstructStep(
+                    name=f_name,
+                    in_view=f_info is not None,
+                    view_default=view_default,
+                    view_default_factory=view_default_factory,
+                    convert=convert,
+                    default=m_info.default if type(m_info.default) in IMMUTABLE_TYPES else PydanticUndefined,
+                    get_default=_default_getter(m_info),
+                )
+            )
+
+        #: Steps of the model fields, in model order.
+        self.steps = tuple(steps)
+
+    def __call__(self, view: BaseModel) -> BaseModel:
+        """
+        Construct the base model instance from a view instance, without validation.
+
+        :param view: View instance.
+        :returns: Base model instance.
+        :raises pydantic.ValidationError: When the view leaves required model fields unset.
+        """
+        if self.fallback is not None:
+            return self.fallback(view)
+
+        view_values = view.__dict__
+        view_fields_set = view.__pydantic_fields_set__
+        values: dict[str, Any] = {}
+        fields_set: set[str] = set()
+        for name, in_view, view_default, view_default_factory, convert, default, get_default in self.steps:
+            if in_view and name in view_fields_set:
+                value = view_values[name]
+                if not (
+                    value is MISSING
+                    or (view_default is not PydanticUndefined and value == view_default)
+                    or (view_default_factory is not None and value == view_default_factory())
+                ):
+                    if convert is None:
+                        values[name] = value
+                    else:
+                        try:
+                            values[name] = convert(value)
+                        except ValidationError:
+                            # Let validation report the errors at their full location.
+                            return build_to_plan(self.view)(view)
+                    fields_set.add(name)
+                    continue
+
+            if get_default is not None:
+                values[name] = get_default(values)
+            elif default is not PydanticUndefined:
+                values[name] = default
+            else:
+                # Let validation report the missing field.
+                return build_to_plan(self.view)(view)
+
+        model = self.model
+        instance = model.__new__(model)
+        object.__setattr__(instance, "__dict__", values)
+        object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+        if not model.__pydantic_root_model__:
+            extra = view.__pydantic_extra__
+            object.__setattr__(instance, "__pydantic_extra__", dict(extra or {}) if self.extra else None)
+            object.__setattr__(instance, "__pydantic_private__", None)
+
+        if model.__pydantic_post_init__:
+            instance.model_post_init(None)
+
+        return instance
+
+
+def construct_plan(view_cls: "type[View[Any]]") -> ConstructPlan:
+    """
+    Return the cached trusted view to model plan of a view class.
+
+    :param view_cls: View class.
+    :returns: Compiled plan.
+    """
+    plans = class_plans(view_cls)
+    try:
+        return plans[ConstructPlan]
+    except KeyError:
+        plan = plans[ConstructPlan] = ConstructPlan(view_cls)
+        return plan
+
+
+class RowPlan:
+    """
+    Compiled conversion from views to the stored rows of their base model.
+
+    Rows hold the model fields as :meth:`pydantic.BaseModel.model_dump` would dump them. When the
+    model declares no model validators, serializers or ``model_post_init``, the validation input of
+    the views is validated and serialized against a ``TypedDict`` schema built from the model field
+    schemas, so no model instance is created for the rows. Otherwise the models are built and
+    dumped.
+    """
+
+    __slots__ = ("model", "fields", "schema", "validator", "serializer")
+
+    def __init__(self, view_cls: "type[View[Any]]") -> None:
+        """
+        :param view_cls: View class to compile.
+        """
+        self.model: type[BaseModel] = view_cls.view_class_root()
+        ensure_complete(self.model)
+
+        #: Stored field names, in model order.
+        self.fields = tuple(f_name for f_name, f_info in self.model.model_fields.items() if not f_info.exclude)
+
+        #: Validator of lists of rows, or ``None`` when models must be built.
+        self.validator: SchemaValidator | None = None
+
+        #: Serializer of lists of rows, or ``None`` when models must be built.
+        self.serializer: SchemaSerializer | None = None
+
+        decorators = self.model.__pydantic_decorators__
+        fields_schema = _model_fields_schema(self.model)
+        if (
+            fields_schema is None
+            or self.model.__pydantic_post_init__
+            or decorators.model_validators
+            or decorators.root_validators
+            or _has_serializers(self.model)
+        ):
+            return
+
+        fields = {
+            f_name: core_schema.typed_dict_field(
+                field["schema"],
+                required=field["schema"]["type"] != "default",
+                validation_alias=field.get("validation_alias"),
+                serialization_alias=field.get("serialization_alias"),
+                serialization_exclude=field.get("serialization_exclude"),
+            )
+            for f_name, field in fields_schema[0]["fields"].items()
+        }
+        schema = core_schema.definitions_schema(
+            core_schema.list_schema(
+                core_schema.typed_dict_schema(
+                    fields,
+                    # Extra data is not stored, it is only checked when forbidden.
+                    extra_behavior="forbid" if fields_schema[0].get("extra_behavior") == "forbid" else "ignore",
+                    config=fields_schema[1],
+                )
+            ),
+            fields_schema[2],
+        )
+        self.validator = SchemaValidator(schema)
+        self.serializer = SchemaSerializer(schema)
+
+    def __call__(
+        self, data: list[Any], *, mode: Literal["json", "python"] = "python", by_alias: bool = False
+    ) -> list[dict[str, Any]]:
+        """
+        Validate and dump the validation input of many base models.
+
+        :param data: Validation inputs of the base models, as collected from views.
+        :param mode: Serialization mode, ``"python"`` or ``"json"``.
+        :param by_alias: Key the rows by field alias.
+        :returns: Rows holding the stored fields.
+        """
+        if self.validator is not None and self.serializer is not None:
+            return self.serializer.to_python(self.validator.validate_python(data), mode=mode, by_alias=by_alias)
+
+        adapter = list_adapter(self.model)
+        keys = [
+            (f_info.serialization_alias or f_info.alias or f_name) if by_alias else f_name
+            for f_name, f_info in self.model.model_fields.items()
+            if not f_info.exclude
+        ]
+        dumped = adapter.dump_python(adapter.validate_python(data), mode=mode, by_alias=by_alias)
+        return [{k: row[k] for k in keys} for row in dumped]
+
+
+def row_plan(view_cls: "type[View[Any]]") -> RowPlan:
+    """
+    Return the cached view to rows plan of a view class.
+
+    :param view_cls: View class.
+    :returns: Compiled plan.
+    """
+    plans = class_plans(view_cls)
+    try:
+        return plans[RowPlan]
+    except KeyError:
+        plan = plans[RowPlan] = RowPlan(view_cls)
+        return plan
+
+
+class JsonToModelPlan:
+    """
+    Compiled validation of view JSON payloads into base model instances.
+
+    The core schema of the view is rewritten so every view class in it validates into a plain
+    dictionary holding only the fields found in the payload, instead of a view instance. Fields
+    holding model computed fields and values equal to the view field defaults are validated but
+    left out, like :meth:`View.view_build_to` does, so the same model fields end up set.
+    Field constraints, validators and extra data handling of the views still apply; plain models are
+    validated into their instances, which the base model then keeps as they are. When a view
+    declares model validators, ``model_post_init`` or a custom ``__init__``, the view is built and
+    converted instead.
+    """
+
+    __slots__ = ("view_cls", "validator")
+
+    def __init__(self, view_cls: "type[View[Any]]") -> None:
+        """
+        :param view_cls: View class to compile.
+        """
+        ensure_complete(view_cls)
+        ensure_complete(view_cls.view_class_root())
+
+        self.view_cls = view_cls
+
+        #: Validator of view payloads into base model validation input, or ``None`` when views must be built.
+        self.validator: SchemaValidator | None = None
+
+        try:
+            schema = _plain_view_schema(view_cls.__pydantic_core_schema__)
+        except _ViewInstanceRequired:
+            return
+        self.validator = SchemaValidator(schema, core_schema.CoreConfig(title=view_cls.__name__))
+
+    def __call__(self, data: str | bytes | bytearray) -> BaseModel:
+        """
+        Validate a view JSON payload into a base model instance.
+
+        :param data: JSON payload.
+        :returns: Base model instance.
+        :raises pydantic.ValidationError: When the payload is not valid for the view or the model.
+        """
+        if self.validator is None:
+            return build_to_plan(self.view_cls)(self.view_cls.model_validate_json(data))
+
+        model = self.view_cls.view_class_root()
+        return model.__pydantic_validator__.validate_python(self.validator.validate_json(data), by_name=True)
+
+
+def json_to_model_plan(view_cls: "type[View[Any]]") -> JsonToModelPlan:
+    """
+    Return the cached JSON to model plan of a view class.
+
+    :param view_cls: View class.
+    :returns: Compiled plan.
+    """
+    plans = class_plans(view_cls)
+    try:
+        return plans[JsonToModelPlan]
+    except KeyError:
+        plan = plans[JsonToModelPlan] = JsonToModelPlan(view_cls)
+        return plan
+
+
+class _ViewInstanceRequired(Exception):
+    pass
+
+
+def _drop_unset(
+    computed: frozenset[str], defaults: tuple[tuple[str, Any, Callable[[], Any] | None], ...], data: dict[str, Any]
+) -> dict[str, Any]:
+    for name in computed:
+        data.pop(name, None)
+    for name, default, default_factory in defaults:
+        if name in data and data[name] == (default if default_factory is None else default_factory()):
+            del data[name]
+    return data
+
+
+def _plain_view_schema(schema: Any) -> Any:
+    from .view import View
+
+    if isinstance(schema, list):
+        return [_plain_view_schema(item) for item in schema]
+    if not isinstance(schema, dict):
+        return schema
+
+    if schema.get("type") == "model" and issubclass(schema["cls"], View):
+        fields_schema = schema["schema"]
+        decorators = schema["cls"].__pydantic_decorators__
+        if (
+            fields_schema["type"] != "model-fields"
+            or decorators.model_validators
+            or decorators.root_validators
+            or schema.get("post_init")
+            or schema.get("custom_init")
+            or schema.get("root_model")
+        ):
+            raise _ViewInstanceRequired()
+
+        # Defaults are left to the base model: fields missing from the payload stay unset.
+        fields = {}
+        defaults: list[tuple[str, Any, Callable[[], Any] | None]] = []
+        for f_name, field in fields_schema["fields"].items():
+            f_schema = field["schema"]
+            required = f_schema["type"] != "default"
+            if not required and not f_schema.get("default_factory_takes_data"):
+                defaults.append((f_name, f_schema.get("default"), f_schema.get("default_factory")))
+            fields[f_name] = core_schema.typed_dict_field(
+                _plain_view_schema(f_schema if required else f_schema["schema"]),
+                required=required,
+                validation_alias=field.get("validation_alias"),
+            )
+
+        # Fields holding model computed fields and values equal to their defaults are validated, but
+        # left out like ``view_build_to`` does.
+        computed = frozenset(schema["cls"].view_class_root().model_computed_fields) & fields.keys()
+        plain = core_schema.typed_dict_schema(
+            fields,
+            cls=schema["cls"],
+            extra_behavior=fields_schema.get("extra_behavior"),
+            config=schema.get("config"),
+            ref=None if computed or defaults else schema.get("ref"),
+        )
+        if not computed and not defaults:
+            return plain
+        return core_schema.no_info_after_validator_function(
+            partial(_drop_unset, computed, tuple(defaults)), plain, ref=schema.get("ref")
+        )
+
+    return {k: v if k == "metadata" else _plain_view_schema(v) for k, v in schema.items()}
+
+
+#: Build from step source: the value is read from a model field.
+FROM_FIELD = 0
+
+#: Build from step source: the value is read from a model computed field.
+FROM_COMPUTED = 1
+
+#: Build from step source: the value is the view field default.
+FROM_DEFAULT = 2
+
+#: Types whose default values can be shared between instances.
+IMMUTABLE_TYPES = frozenset({type(None), bool, int, float, complex, str, bytes, frozenset, type(MISSING)})
+
+
+class BuildFromStep(NamedTuple):
+    """Precomputed handling of one view field when projecting a model."""
+
+    #: View field name.
+    name: str
+
+    #: Where the value comes from: :data:`FROM_FIELD`, :data:`FROM_COMPUTED` or :data:`FROM_DEFAULT`.
+    source: int
+
+    #: Converter turning nested models into their views, or ``None``.
+    convert: Converter | None
+
+    #: Converter turning nested models into their views without validation, or ``None``.
+    trusted_convert: Converter | None
+
+    #: Shareable default value, or ``PydanticUndefined``.
+    default: Any
+
+    #: Default getter receiving the values collected so far, or ``None`` for shareable or missing defaults.
+    get_default: Callable[[dict[str, Any]], Any] | None
+
+
+class BuildFromPlan:
+    """
+    Compiled projection from a base model to a view class.
+
+    Model fields are already validated, so the plan builds view instances straight from the model
+    attributes and ``model_fields_set``. Nested models are only visited when they map to nested
+    views. View fields narrower than their model fields, like the fields of views hiding default
+    ``None`` values, are validated against the view field schemas, in a single ``pydantic-core``
+    call. Views declaring their own validators are not projected: they validate the dumped model
+    data instead.
+
+    Projected views share the values of the model fields, like containers and plain nested models,
+    instead of copies of them.
+    """
+
+    __slots__ = (
+        "view",
+        "steps",
+        "field_names",
+        "computed_names",
+        "extra",
+        "projection",
+        "checked",
+        "check",
+        "project",
+        "trusted_project",
+    )
+
+    def __init__(self, view_cls: "type[View[Any]]") -> None:
+        """
+        :param view_cls: View class to compile.
+        """
+        ensure_complete(view_cls)
+
+        self.view = view_cls
+        self.extra = view_cls.model_config.get("extra") == "allow"
+        self.projection = not has_validators(view_cls) and not view_cls.model_config.get("validate_default", False)
+
+        model = view_cls.view_class_root()
+        same_config = all(model.model_config.get(k) == view_cls.model_config.get(k) for k in VALIDATION_CONFIG)
+        checked: list[str] = []
+        steps: list[BuildFromStep] = []
+        for f_name, f_info in view_cls.model_fields.items():
+            self.projection = self.projection and f_info.validate_default is not True
+
+            if f_name in model.model_fields:
+                source = FROM_FIELD
+                if not (same_config and _same_projection(f_info, model.model_fields[f_name])):
+                    checked.append(f_name)
+            elif f_name in model.model_computed_fields:
+                source = FROM_COMPUTED
+            else:
+                source = FROM_DEFAULT
+
+            steps.append(
+                BuildFromStep(
+                    name=f_name,
+                    source=source,
+                    convert=(
+                        compile_converter(f_info.annotation, _model_to_view_leaf) if source != FROM_DEFAULT else None
+                    ),
+                    trusted_convert=(
+                        compile_converter(f_info.annotation, _trusted_model_to_view_leaf)
+                        if source != FROM_DEFAULT
+                        else None
+                    ),
+                    default=f_info.default if type(f_info.default) in IMMUTABLE_TYPES else PydanticUndefined,
+                    get_default=_default_getter(f_info),
+                )
+            )
+
+        self.steps = tuple(steps)
+        self.field_names = frozenset(s.name for s in steps if s.source == FROM_FIELD)
+        self.computed_names = frozenset(s.name for s in steps if s.source == FROM_COMPUTED)
+
+        #: View fields validated against the view field schemas when projected.
+        self.checked = frozenset(checked)
+
+        #: Validator of the checked fields, or ``None`` when there are none.
+        self.check: SchemaValidator | None = None
+
+        if checked and self.projection:
+            fields_schema = _model_fields_schema(view_cls)
+            if fields_schema is None:
+                self.projection = False
+            else:
+                fields: dict[str, core_schema.TypedDictField] = {}
+                for f_name in checked:
+                    schema = fields_schema[0]["fields"][f_name]["schema"]
+                    if schema["type"] == "default":
+                        schema = schema["schema"]
+                    fields[f_name] = core_schema.typed_dict_field(schema)
+
+                check = core_schema.typed_dict_schema(fields, cls=view_cls, total=False, config=fields_schema[1])
+                self.check = SchemaValidator(core_schema.definitions_schema(check, fields_schema[2]))
+
+        #: Builds a view instance from a model instance.
+        self.project = self._projector(trusted=False) if self.projection else self.validate
+
+        #: Builds a view instance from a model instance, without running the view validators.
+        self.trusted_project = self._projector(trusted=True)
+
+    def __call__(self, model: BaseModel, *, trusted: bool = False) -> BaseModel:
+        """
+        Build a view instance from a model instance, omitting unset fields.
+
+        :param model: Model instance.
+        :param trusted: Project the model even when the view declares its own validators, and
+                        project nested views the same way.
+        :returns: View instance.
+        """
+        return self.trusted_project(model) if trusted else self.project(model)
+
+    def validate(self, model: BaseModel) -> BaseModel:
+        """
+        Build a view instance from a model instance validating the dumped model data.
+
+        :param model: Model instance.
+        :returns: View instance.
+        """
+        return self.view.model_validate(model.model_dump(exclude_unset=True, by_alias=True))
+
+    def _projector(self, *, trusted: bool) -> Callable[[BaseModel], BaseModel]:
+        # Everything the projection needs is bound to the closure, since it runs once per nested
+        # model of large aggregates.
+        view = self.view
+        new = view.__new__
+        field_names = self.field_names
+        computed_names = self.computed_names
+        extra = self.extra
+        root = view.__pydantic_root_model__
+        post_init = bool(view.__pydantic_post_init__)
+        check = self.check if not trusted else None
+        checked = self.checked
+        validate = self.validate
+
+        #: Values of the view fields in field order, holding their shareable defaults, so views keep
+        #: the field order of validated views.
+        template = {s.name: s.default if s.default is not PydanticUndefined else None for s in self.steps}
+        converted = tuple(
+            (s.name, convert)
+            for s in self.steps
+            if s.source == FROM_FIELD and (convert := s.trusted_convert if trusted else s.convert) is not None
+        )
+        computed = tuple(
+            (s.name, s.trusted_convert if trusted else s.convert) for s in self.steps if s.source == FROM_COMPUTED
+        )
+
+        # Fields without shareable default, with their default getter, or ``None`` when required.
+        unshared: list[tuple[str, Callable[[dict[str, Any]], Any] | None]] = []
+        for position, step in enumerate(self.steps):
+            if step.source == FROM_COMPUTED or step.default is not PydanticUndefined:
+                continue
+            get_default = step.get_default
+            f_info = view.model_fields[step.name]
+            if get_default is not None and f_info.default_factory_takes_validated_data:
+                # Factories only see the fields preceding theirs, like in validation.
+                get_default = partial(_default_from_preceding, get_default, [s.name for s in self.steps[:position]])
+            unshared.append((step.name, get_default))
+        unshared_names = frozenset(name for name, _ in unshared)
+
+        def project(model: BaseModel) -> BaseModel:
+            model_values = model.__dict__
+            fields_set = model.__pydantic_fields_set__ & field_names
+            values = template.copy()
+            for name in fields_set:
+                values[name] = model_values[name]
+            for name, convert in converted:
+                if name in fields_set:
+                    values[name] = convert(values[name])
+            for name, convert_computed in computed:
+                value = getattr(model, name)
+                values[name] = value if convert_computed is None else convert_computed(value)
+            if not unshared_names <= fields_set:
+                for name, get_default in unshared:
+                    if name in fields_set:
+                        continue
+                    if get_default is None:
+                        # Let validation report the missing field.
+                        return validate(model)
+                    values[name] = get_default(values)
+
+            if check is not None and (names := fields_set & checked):
+                values.update(check.validate_python({name: values[name] for name in names}))
+
+            instance = new(view)
+            _set_dict(instance, values)
+            _set_fields_set(instance, fields_set | computed_names if computed else fields_set)
+            if not root:
+                _set_extra(instance, dict(model.__pydantic_extra__ or {}) if extra else None)
+                _set_private(instance, None)
+
+            if post_init:
+                instance.model_post_init(None)
+
+            return instance
+
+        return project
+
+
+# Slot setters of model instances, faster than ``object.__setattr__`` for instances built field by field.
+_set_dict = BaseModel.__dict__["__dict__"].__set__
+_set_fields_set = BaseModel.__dict__["__pydantic_fields_set__"].__set__
+_set_extra = BaseModel.__dict__["__pydantic_extra__"].__set__
+_set_private = BaseModel.__dict__["__pydantic_private__"].__set__
+
+
+def build_from_plan(view_cls: "type[View[Any]]") -> BuildFromPlan:
+    """
+    Return the cached model to view plan of a view class.
+
+    :param view_cls: View class.
+    :returns: Compiled plan.
+    """
+    plans = class_plans(view_cls)
+    try:
+        return plans[BuildFromPlan]
+    except KeyError:
+        plan = plans[BuildFromPlan] = BuildFromPlan(view_cls)
+        return plan
+
+
+#: Convert step kind: the source view value is copied as is.
+CONVERT_COPY = 0
+
+#: Convert step kind: the source view value is validated by the base model field.
+CONVERT_VALIDATE = 1
+
+#: Convert step kind: the target view field always gets its default.
+CONVERT_DEFAULT = 2
+
+#: Convert step kind: the nested views of the source view value are converted into the target nested views.
+CONVERT_PROJECT = 3
+
+
+class ConvertStep(NamedTuple):
+    """Precomputed handling of one target view field when converting a view into another view."""
+
+    #: Target view field name.
+    name: str
+
+    #: How the value is obtained: :data:`CONVERT_COPY`, :data:`CONVERT_VALIDATE`, :data:`CONVERT_DEFAULT` or
+    #: :data:`CONVERT_PROJECT`.
+    kind: int
+
+    #: Converter turning nested models into their target views, or the source nested views into their target
+    #: views for :data:`CONVERT_PROJECT` steps, or ``None``.
+    convert: Converter | None
+
+    #: Shareable default value of the target field, or ``PydanticUndefined``.
+    default: Any
+
+    #: Default getter of the target field receiving the values collected so far, or ``None``.
+    get_default: Callable[[dict[str, Any]], Any] | None
+
+
+class ConvertPlan:
+    """
+    Compiled conversion from a view class into another view class of the same base model.
+
+    The result is the same as building the base model from the source view and the target view
+    from that model, but no model instance is created. Fields both views share with the model
+    definition are copied as they are. Nested views of the same nested model on both sides are
+    converted by their own plans, falling back to the model when they fail. The other shared fields,
+    like nested plain models, are validated together against the model field schemas, in a single
+    ``pydantic-core`` call, and projected into the target view, where target fields narrower than
+    the model fields are validated again against the target field schemas. Models declaring
+    validators or ``model_post_init``, and target views exposing computed fields or declaring their
+    own validators, are converted through the model.
+    """
+
+    __slots__ = (
+        "source",
+        "target",
+        "sources",
+        "required",
+        "steps",
+        "keys",
+        "nested",
+        "field_names",
+        "patch",
+        "checked",
+        "check",
+        "convert",
+    )
+
+    def __init__(self, source_cls: "type[View[Any]]", target_cls: "type[View[Any]]") -> None:
+        """
+        :param source_cls: Source view class.
+        :param target_cls: Target view class.
+        :raises TypeError: When the views belong to different base models.
+        """
+        model = source_cls.view_class_root()
+        if target_cls.view_class_root() is not model:
+            raise TypeError(f"{source_cls.__name__} and {target_cls.__name__} are not views of the same model")
+
+        ensure_complete(source_cls)
+        ensure_complete(model)
+
+        self.source = source_cls
+        self.target = target_cls
+
+        #: Defaults of the source view fields defined by the model: values equal to them are not set on the model.
+        self.sources: dict[str, tuple[Any, Callable[[], Any] | None]] = {}
+
+        #: Required model fields.
+        self.required: frozenset[str] = frozenset()
+
+        #: Steps of the target view fields, or ``None`` when views are converted through the model.
+        self.steps: tuple[ConvertStep, ...] | None = None
+
+        #: Validation input keys of the validated fields not holding models.
+        self.keys: dict[str, str] = {}
+
+        #: Validated fields holding models, serialized from the source view.
+        self.nested: frozenset[str] = frozenset()
+
+        #: Target view fields defined by the model.
+        self.field_names: frozenset[str] = frozenset()
+
+        #: Validator of the validated fields, or ``None`` when there are none.
+        self.patch: SchemaValidator | None = None
+
+        #: Target view fields narrower than the model fields.
+        self.checked: frozenset[str] = frozenset()
+
+        #: Validator of the checked fields against the target field schemas, or ``None``.
+        self.check: SchemaValidator | None = None
+
+        #: Compiled conversion, through the model unless views can be converted directly.
+        self.convert: Callable[[BaseModel], BaseModel] = self._through_model
+
+        fields_schema = _model_fields_schema(model)
+        target_plan = build_from_plan(target_cls)
+        if (
+            fields_schema is None
+            or model.__pydantic_post_init__
+            or has_validators(model)
+            or not target_plan.projection
+            or target_plan.computed_names
+        ):
+            return
+
+        model_fields = model.model_fields
+        source_fields = source_cls.model_fields
+        same_config = all(
+            model.model_config.get(k) == source_cls.model_config.get(k) == target_cls.model_config.get(k)
+            for k in VALIDATION_CONFIG
+        )
+        for f_name, f_info in source_fields.items():
+            if f_name in model_fields:
+                default_factory = f_info.default_factory
+                if default_factory is not None and f_info.default_factory_takes_validated_data:
+                    default_factory = None
+                self.sources[f_name] = (f_info.default, default_factory)  # type: ignore
+
+        steps: list[ConvertStep] = []
+        validated: dict[str, core_schema.TypedDictField] = {}
+        nested: set[str] = set()
+        for t_step in target_plan.steps:
+            name = t_step.name
+            kind = CONVERT_DEFAULT
+            convert = t_step.convert
+            if t_step.source == FROM_FIELD and name in self.sources:
+                m_info = model_fields[name]
+                s_info = source_fields[name]
+                t_info = target_cls.model_fields[name]
+                s_view = _nested_view(s_info.annotation)
+                t_view = _nested_view(t_info.annotation)
+                if (
+                    same_config
+                    and not holds_models(m_info.annotation)
+                    and _same_definition(s_info, m_info)
+                    and _same_definition(t_info, m_info)
+                ):
+                    kind = CONVERT_COPY
+                elif (
+                    same_config
+                    and s_view is not None
+                    and t_view is not None
+                    and _same_projection(s_info, m_info)
+                    and _same_projection(t_info, m_info)
+                    and compile_converter(s_info.annotation, partial(_other_model_leaf, s_view)) is None
+                ):
+                    kind = CONVERT_PROJECT
+                    convert = compile_converter(s_info.annotation, partial(_view_convert_leaf, s_view, t_view))
+                else:
+                    kind = CONVERT_VALIDATE
+                    field = fields_schema[0]["fields"][name]
+                    schema = field["schema"]
+                    if schema["type"] == "default":
+                        schema = schema["schema"]
+                    validated[name] = core_schema.typed_dict_field(
+                        schema, required=False, validation_alias=field.get("validation_alias")
+                    )
+                    if holds_models(s_info.annotation):
+                        nested.add(name)
+                    else:
+                        key = validation_key(name, m_info, model)
+                        if key is None:
+                            return
+                        self.keys[name] = key
+
+            steps.append(
+                ConvertStep(
+                    name=name,
+                    kind=kind,
+                    convert=convert,
+                    default=t_step.default,
+                    get_default=t_step.get_default,
+                )
+            )
+
+        if validated:
+            config = core_schema.CoreConfig(**{**(fields_schema[1] or {}), "title": model.__name__})  # type: ignore
+            patch = core_schema.typed_dict_schema(validated, total=False, config=config)
+            self.patch = SchemaValidator(core_schema.definitions_schema(patch, fields_schema[2]))
+
+        self.required = frozenset(f_name for f_name, m_info in model_fields.items() if m_info.is_required())
+        self.nested = frozenset(nested)
+        self.field_names = target_plan.field_names
+        self.checked = target_plan.checked
+        self.check = target_plan.check
+        self.steps = tuple(steps)
+        self.convert = self._converter()
+
+    def __call__(self, view: BaseModel) -> BaseModel:
+        """
+        Convert a source view instance into a target view instance.
+
+        :param view: Source view instance.
+        :returns: Target view instance.
+        :raises pydantic.ValidationError: When the source view data is not valid for the model or the
+                                          target view.
+        """
+        return self.convert(view)
+
+    def _converter(self) -> Callable[[BaseModel], BaseModel]:
+        # Everything the conversion needs is bound to the closure, since it runs once per nested view
+        # of large aggregates.
+        steps = cast(tuple[ConvertStep, ...], self.steps)
+        through = self._through_model
+        target = self.target
+        new = target.__new__
+        root = target.__pydantic_root_model__
+        extra = target.model_config.get("extra") == "allow"
+        post_init = bool(target.__pydantic_post_init__)
+        source_names = frozenset(self.sources)
+        required = self.required
+        field_names = self.field_names
+        check = self.check
+        checked = self.checked
+        patch = self.patch
+        keys = self.keys
+        nested_names = self.nested
+
+        # Source fields whose values may be left out of the model: values equal to their defaults, and
+        # ``MISSING`` values.
+        source_fields = self.source.model_fields
+        compared = tuple(
+            (name, default, default_factory)
+            for name, (default, default_factory) in self.sources.items()
+            if default is not PydanticUndefined
+            or default_factory is not None
+            or _may_be_missing(source_fields[name].annotation)
+        )
+
+        #: Values of the target view fields in field order, holding their shareable defaults.
+        template = {s.name: s.default if s.default is not PydanticUndefined else None for s in steps}
+        copied = frozenset(s.name for s in steps if s.kind == CONVERT_COPY)
+        projected = tuple((s.name, s.convert) for s in steps if s.kind == CONVERT_PROJECT)
+        validated_steps = tuple((s.name, s.convert) for s in steps if s.kind == CONVERT_VALIDATE)
+
+        # Fields without shareable default, with their default getter, or ``None`` when required.
+        target_fields = self.target.model_fields
+        unshared: list[tuple[str, Callable[[dict[str, Any]], Any] | None]] = []
+        for position, step in enumerate(steps):
+            if step.default is not PydanticUndefined:
+                continue
+            get_default = step.get_default
+            if get_default is not None and target_fields[step.name].default_factory_takes_validated_data:
+                # Factories only see the fields preceding theirs, like in validation.
+                get_default = partial(_default_from_preceding, get_default, [s.name for s in steps[:position]])
+            unshared.append((step.name, get_default))
+        unshared_names = frozenset(name for name, _ in unshared)
+
+        def convert(view: BaseModel) -> BaseModel:
+            if view.__pydantic_extra__:
+                return through(view)
+
+            values = view.__dict__
+            provided = view.__pydantic_fields_set__ & source_names
+            for name, default, default_factory in compared:
+                if name in provided:
+                    value = values[name]
+                    if (
+                        value is MISSING
+                        or (default is not PydanticUndefined and value == default)
+                        or (default is PydanticUndefined and default_factory is not None and value == default_factory())
+                    ):
+                        provided.discard(name)
+
+            if not required <= provided:
+                # Let the model report the missing fields.
+                return through(view)
+
+            target_values = template.copy()
+            for name in provided & copied:
+                target_values[name] = values[name]
+            for name, convert_nested in projected:
+                if name in provided:
+                    try:
+                        target_values[name] = convert_nested(values[name])  # type: ignore
+                    except ValidationError:
+                        # Let the model report the errors at their full location.
+                        return through(view)
+
+            if patch is not None:
+                data = {keys[n]: values[n] for n in provided if n in keys}
+                if nested := provided & nested_names:
+                    data.update(
+                        view.__pydantic_serializer__.to_python(
+                            view, include=nested, exclude_unset=True, exclude_defaults=True, by_alias=True
+                        )
+                    )
+                if data:
+                    validated = patch.validate_python(data)
+                    for name, convert_model in validated_steps:
+                        if name in validated:
+                            value = validated[name]
+                            target_values[name] = value if convert_model is None else convert_model(value)
+
+            fields_set = provided & field_names
+            if not unshared_names <= fields_set:
+                for name, get_default in unshared:
+                    if name in fields_set:
+                        continue
+                    if get_default is None:
+                        # Let validation report the missing field.
+                        return through(view)
+                    target_values[name] = get_default(target_values)
+
+            if check is not None and (names := fields_set & checked):
+                target_values.update(check.validate_python({name: target_values[name] for name in names}))
+
+            instance = new(target)
+            _set_dict(instance, target_values)
+            _set_fields_set(instance, fields_set)
+            if not root:
+                _set_extra(instance, {} if extra else None)
+                _set_private(instance, None)
+
+            if post_init:
+                instance.model_post_init(None)
+
+            return instance
+
+        return convert
+
+    def _through_model(self, view: BaseModel) -> BaseModel:
+        return build_from_plan(self.target)(build_to_plan(self.source)(view))
+
+
+def convert_plan(source_cls: "type[View[Any]]", target_cls: "type[View[Any]]") -> ConvertPlan:
+    """
+    Return the cached plan converting a view class into another view class.
+
+    :param source_cls: Source view class.
+    :param target_cls: Target view class.
+    :returns: Compiled plan.
+    :raises TypeError: When the views belong to different base models.
+    """
+    plans = class_plans(source_cls)
+    try:
+        return plans[ConvertPlan, target_cls]
+    except KeyError:
+        plan = plans[ConvertPlan, target_cls] = ConvertPlan(source_cls, target_cls)
+        return plan
+
+
+#: Configuration keys changing how field values are serialized.
+SERIALIZATION_CONFIG = (
+    "ser_json_timedelta",
+    "ser_json_temporal",
+    "ser_json_bytes",
+    "ser_json_inf_nan",
+    "serialize_by_alias",
+)
+
+
+class Projection(NamedTuple):
+    """Model fields exposed by a view class, nested views included."""
+
+    #: Nested ``include`` structure accepted by :meth:`pydantic.BaseModel.model_dump`. Items of
+    #: sequences and mappings are described under ``"__all__"``, and recursive views reference their
+    #: own structure.
+    include: dict[Any, Any]
+
+    #: Dotted paths of the exposed model fields. Nested fields of recursive views are not expanded.
+    paths: tuple[str, ...]
+
+
+def projection(view_cls: "type[View[Any]]") -> Projection:
+    """
+    Return the cached projection of a view class.
+
+    Projections of all the nested views reachable from ``view_cls`` are computed at once, as they may
+    reference each other.
+
+    :param view_cls: View class.
+    :returns: Model fields exposed by the view.
+    """
+    plans = class_plans(view_cls)
+    try:
+        return plans[Projection]
+    except KeyError:
+        _ProjectionWalker(view_cls)
+        return cast(Projection, plans[Projection])
+
+
+class StoragePlan:
+    """
+    Compiled storage projection of a view class.
+
+    Lists the stored model fields a view needs, so data access layers fetch nothing else. Computed
+    fields are not stored: a view exposing computed fields of a model needs all the fields of that
+    model, as their dependencies are unknown.
+    """
+
+    __slots__ = ("view", "columns", "paths", "alias_columns", "alias_paths")
+
+    def __init__(self, view_cls: "type[View[Any]]") -> None:
+        """
+        :param view_cls: View class to compile.
+        """
+        self.view = view_cls
+
+        walker = _ProjectionWalker(view_cls)
+        owners = {id(include): cls for cls, include in walker.includes.items()}
+        include = walker.includes[view_cls]
+        model = view_cls.view_class_root()
+        names = model.model_fields if _exposes_computed(model, include) else include
+
+        #: Top level stored field names.
+        self.columns = tuple(names)
+
+        #: Top level stored field validation aliases.
+        self.alias_columns = tuple(_storage_key(model, n) for n in names)
+
+        #: Dotted paths of the stored fields, nested views included.
+        self.paths = tuple(_storage_paths(include, walker, owners, [], "", by_alias=False))
+
+        #: Dotted paths of the stored fields, made of validation aliases.
+        self.alias_paths = tuple(_storage_paths(include, walker, owners, [], "", by_alias=True))
+
+
+def storage_plan(view_cls: "type[View[Any]]") -> StoragePlan:
+    """
+    Return the cached storage projection of a view class.
+
+    :param view_cls: View class.
+    :returns: Compiled plan.
+    """
+    plans = class_plans(view_cls)
+    try:
+        return plans[StoragePlan]
+    except KeyError:
+        plan = plans[StoragePlan] = StoragePlan(view_cls)
+        return plan
+
+
+def _storage_paths(
+    include: dict[Any, Any],
+    walker: "_ProjectionWalker",
+    owners: "dict[int, type[View[Any]]]",
+    parents: list[dict[Any, Any]],
+    prefix: str,
+    *,
+    by_alias: bool,
+) -> Iterator[str]:
+    model = owners[id(include)].view_class_root()
+    # Nested fields are only expanded when the view does not expose computed fields.
+    expand = not _exposes_computed(model, include)
+
+    parents.append(include)
+    for name in include if expand else model.model_fields:
+        path = f"{prefix}{_storage_key(model, name) if by_alias else name}"
+        # Mapping keys are data, so mappings are stored whole.
+        item = include[name] if expand else True
+        views = list(_include_views(item)) if item is True or id(item) not in walker.mappings else []
+        if not views or None in views or any(v is p for v in views for p in parents):
+            yield path
+            continue
+
+        nested = [
+            p
+            for v in views
+            for p in _storage_paths(cast(dict, v), walker, owners, parents, f"{path}.", by_alias=by_alias)
+        ]
+        yield from dict.fromkeys(nested) if nested else (path,)
+    parents.pop()
+
+
+def _exposes_computed(model: type[BaseModel], include: dict[Any, Any]) -> bool:
+    return any(n in model.model_computed_fields for n in include)
+
+
+def _storage_key(model: type[BaseModel], name: str) -> str:
+    return validation_key(name, model.model_fields[name], model) or name
+
+
+class DumpPlan:
+    """
+    Compiled serialization of base models through a view class.
+
+    When the view, and every nested view reachable from it, serializes its fields exactly like its
+    base model does, the plan holds the ``include`` structure of the view projection. Dumping the
+    model with it produces the same data as dumping the view built from the model, without building
+    it.
+    """
+
+    __slots__ = ("view", "include", "exclude_unset")
+
+    def __init__(self, view_cls: "type[View[Any]]") -> None:
+        """
+        :param view_cls: View class to compile.
+        """
+        self.view = view_cls
+
+        walker = _ProjectionWalker(view_cls)
+        exclude_unset = _dump_exclude_unset(walker)
+
+        #: Nested ``include`` mask, or ``None`` when the view must be built to be dumped.
+        self.include = walker.includes[view_cls] if exclude_unset is not None else None
+
+        #: Whether unset fields are left out, like the ``MISSING`` defaults of views with all fields
+        #: optional.
+        self.exclude_unset = bool(exclude_unset)
+
+
+def dump_plan(view_cls: "type[View[Any]]") -> DumpPlan:
+    """
+    Return the cached dump plan of a view class.
+
+    :param view_cls: View class.
+    :returns: Compiled plan.
+    """
+    plans = class_plans(view_cls)
+    try:
+        return plans[DumpPlan]
+    except KeyError:
+        plan = plans[DumpPlan] = DumpPlan(view_cls)
+        return plan
+
+
+class _ProjectionWalker:
+    """Collect the ``include`` structures of a view class and every nested view reachable from it."""
+
+    def __init__(self, view_cls: "type[View[Any]]") -> None:
+        self.includes: dict[type[View[Any]], dict[Any, Any]] = {}
+        self.pending: list[type[View[Any]]] = []
+
+        #: Whether plain models (or ``Self`` values, which are not projected) are reachable.
+        self.plain_models = False
+
+        #: Whether some union holds several nested views, which can not be described by one structure.
+        self.ambiguous = False
+
+        #: Identities of the structures describing mapping items.
+        self.mappings: set[int] = set()
+
+        self.view_include(view_cls)
+        while self.pending:
+            cls = self.pending.pop()
+            model = cls.view_class_root()
+            include = self.includes[cls]
+            for f_name, f_info in cls.model_fields.items():
+                if f_name in model.model_fields or f_name in model.model_computed_fields:
+                    include[f_name] = self.annotation_include(f_info.annotation, cls)
+
+        for cls, include in self.includes.items():
+            class_plans(cls).setdefault(Projection, Projection(include, tuple(_include_paths(include, []))))
+
+    def view_include(self, cls: "type[View[Any]]") -> dict[Any, Any]:
+        try:
+            return self.includes[cls]
+        except KeyError:
+            self.pending.append(cls)
+            include: dict[Any, Any] = {}
+            self.includes[cls] = include
+            return include
+
+    def annotation_include(self, annotation: Any, owner: "type[View[Any]]") -> Any:
+        from .view import View
+
+        origin = get_origin(annotation)
+        if origin is Annotated:
+            return self.annotation_include(get_args(annotation)[0], owner)
+
+        if origin is None:
+            if annotation is Self:
+                # Views hold ``Self`` values as they are, serializing them with their own fields.
+                self.plain_models = True
+                return self.view_include(owner)
+            if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+                if issubclass(annotation, View):
+                    return self.view_include(annotation)
+                self.plain_models = True
+            return True
+
+        args = get_args(annotation)
+        if origin is Union or origin is UnionType:
+            branches = [b for b in (self.annotation_include(a, owner) for a in args) if b is not True]
+            if not branches:
+                return True
+            if any(b is not branches[0] for b in branches):
+                self.ambiguous = True
+                return True
+            return branches[0]
+
+        if not isinstance(origin, type) or not issubclass(origin, Iterable):
+            return True
+
+        if issubclass(origin, tuple) and not (len(args) == 2 and args[1] is Ellipsis):
+            items = [self.annotation_include(a, owner) for a in args]
+            return dict(enumerate(items)) if any(i is not True for i in items) else True
+
+        if issubclass(origin, Mapping):
+            item = self.annotation_include(args[1], owner) if len(args) == 2 else True
+            if item is True:
+                return True
+            mapping_include = {"__all__": item}
+            self.mappings.add(id(mapping_include))
+            return mapping_include
+
+        item = self.annotation_include(args[0], owner) if args else True
+        return {"__all__": item} if item is not True else True
+
+
+def _include_paths(include: dict[Any, Any], parents: list[dict[Any, Any]], prefix: str = "") -> Iterator[str]:
+    parents.append(include)
+    for name, item in include.items():
+        path = f"{prefix}{name}"
+        views = list(_include_views(item))
+        if not views or None in views or any(v is p for v in views for p in parents):
+            yield path
+            continue
+
+        nested = [p for v in views for p in _include_paths(cast(dict, v), parents, f"{path}.")]
+        yield from dict.fromkeys(nested) if nested else (path,)
+    parents.pop()
+
+
+def _include_views(item: Any) -> Iterator[dict[Any, Any] | None]:
+    # Yield the ``include`` structures of the views reachable from a field ``include`` item, skipping
+    # sequence and mapping levels. ``None`` stands for values included as a whole.
+    if item is True:
+        return
+    if "__all__" in item:
+        yield from _include_views(item["__all__"])
+    elif all(isinstance(k, int) for k in item):
+        # Fixed-length tuples describe each of their positions.
+        for position in item.values():
+            yield from _include_views(position) if position is not True else (None,)
+    else:
+        yield item
+
+
+def _dump_exclude_unset(walker: _ProjectionWalker) -> bool | None:
+    # Return the ``exclude_unset`` flag reproducing the serialization of the views reachable by the
+    # walker, or ``None`` when some view can not be reproduced from its model.
+    if walker.ambiguous:
+        return None
+
+    exclude_unset: bool | None = None
+    for cls in walker.includes:
+        if not _dumps_like_model(cls):
+            return None
+
+        model = cls.view_class_root()
+        for f_name, f_info in cls.model_fields.items():
+            if f_name in model.model_computed_fields:
+                if _serialized_name(f_name, f_info) != (model.model_computed_fields[f_name].alias or f_name):
+                    return None
+                continue
+
+            m_info = model.model_fields.get(f_name)
+            if m_info is None:
+                return None
+            if _serialized_name(f_name, f_info) != _serialized_name(f_name, m_info) or f_info.exclude != m_info.exclude:
+                return None
+
+            unset = _unset_mode(f_info, m_info)
+            if unset is None:
+                return None
+            if unset is not _NO_DEFAULT:
+                if exclude_unset is None:
+                    exclude_unset = unset is MISSING
+                elif exclude_unset != (unset is MISSING):
+                    return None
+
+    # Unset fields of plain nested models would be left out too.
+    if exclude_unset and walker.plain_models:
+        return None
+
+    return bool(exclude_unset)
+
+
+#: Unset mode of fields without default value.
+_NO_DEFAULT = object()
+
+
+def _unset_mode(f_info: FieldInfo, m_info: FieldInfo) -> Any:
+    # ``MISSING`` when the view leaves unset fields out, ``PydanticUndefined`` when it holds the
+    # same default as the model, ``_NO_DEFAULT`` when both are required and ``None`` otherwise.
+    if f_info.is_required():
+        return _NO_DEFAULT if m_info.is_required() else None
+
+    if f_info.default_factory is not None:
+        if f_info.default_factory is m_info.default_factory:
+            return PydanticUndefined
+        if f_info.default_factory_takes_validated_data:
+            return None
+        default = f_info.default_factory()  # type: ignore
+    else:
+        default = f_info.default
+
+    if default is MISSING:
+        return MISSING
+
+    if m_info.default_factory is None and m_info.default is not PydanticUndefined and m_info.default == default:
+        return PydanticUndefined
+    return None
+
+
+def _dumps_like_model(view_cls: "type[View[Any]]") -> bool:
+    model = view_cls.view_class_root()
+    return not (
+        view_cls.__pydantic_root_model__
+        or not build_from_plan(view_cls).projection
+        # Values of narrower view fields must be validated, like building the view does.
+        or build_from_plan(view_cls).checked
+        or view_cls.model_config.get("extra") == "allow"
+        or view_cls.model_computed_fields
+        or _has_serializers(view_cls)
+        or _has_serializers(model)
+        or any(view_cls.model_config.get(k) != model.model_config.get(k) for k in SERIALIZATION_CONFIG)
+    )
+
+
+def _serialized_name(name: str, f_info: FieldInfo) -> str:
+    return f_info.serialization_alias or f_info.alias or name
+
+
+def _has_serializers(model: type[BaseModel]) -> bool:
+    decorators = model.__pydantic_decorators__
+    return bool(decorators.field_serializers or decorators.model_serializers)
+
+
+#: Apply step kind: the view value replaces the model value.
+APPLY_VALUE = 0
+
+#: Apply step kind: the view mapping is merged into the model mapping.
+APPLY_MAPPING = 1
+
+#: Apply step kind: the view value may hold models merged into the model value.
+APPLY_MODEL = 2
+
+#: Apply step kind: the view list elements are merged into the model list elements sharing their key.
+APPLY_KEYED = 3
+
+#: Apply step validation: the value was already validated by an identical view field.
+TRUSTED = 0
+
+#: Apply step validation: the value is validated along with the other changed fields.
+BATCHED = 1
+
+#: Apply step validation: the value is validated by assignment on the resulting model.
+ASSIGNED = 2
+
+#: Apply step validation: only the changed entries of the merged mapping are validated.
+ENTRIES = 3
+
+#: Configuration keys changing how field values are validated.
+VALIDATION_CONFIG = (
+    "strict",
+    "str_strip_whitespace",
+    "str_to_lower",
+    "str_to_upper",
+    "str_min_length",
+    "str_max_length",
+    "coerce_numbers_to_str",
+    "allow_inf_nan",
+    "use_enum_values",
+    "arbitrary_types_allowed",
+    "regex_engine",
+    "val_json_bytes",
+)
+
+
+class ApplyStep(NamedTuple):
+    """Precomputed handling of one view field when applying a view to a model."""
+
+    #: How the value is merged: :data:`APPLY_VALUE`, :data:`APPLY_MAPPING`, :data:`APPLY_MODEL` or
+    #: :data:`APPLY_KEYED`.
+    kind: int
+
+    #: How the value is validated: :data:`TRUSTED`, :data:`BATCHED`, :data:`ASSIGNED` or :data:`ENTRIES`.
+    validation: int
+
+    #: Validator of the changed entries of a mapping, keyed by field name, for :data:`ENTRIES` steps.
+    entries: SchemaValidator | None = None
+
+    #: Element key field, for :data:`APPLY_KEYED` steps.
+    key: str | None = None
+
+
+class ApplyPlan:
+    """
+    Compiled application of a view class to a model class.
+
+    Every view field is classified once: how its value is merged into the model value, and how the
+    result is validated. Values of view fields sharing the model field definition are already
+    valid and are used as is. Dictionaries are merged entry by entry, and only their changed entries
+    are validated. Lists annotated with :class:`~pydantic_views.annotations.KeyedBy` are merged
+    element by element. The other changed fields are validated together, in a single ``pydantic-core``
+    call, against the model field schemas. Only frozen fields, fields with field validators and
+    models with model validators fall back to per field assignment validation.
+    """
+
+    __slots__ = ("steps", "patch")
+
+    def __init__(self, model: type[BaseModel], view_cls: type[BaseModel]) -> None:
+        """
+        :param model: Model class the view is applied to.
+        :param view_cls: View (or model) class to compile.
+        """
+        ensure_complete(model)
+        ensure_complete(view_cls)
+
+        #: Steps by view field name. Fields missing here are validated by assignment.
+        self.steps: dict[str, ApplyStep] = {}
+
+        #: Validator of the batched fields, or ``None`` when there are none.
+        self.patch: SchemaValidator | None = None
+
+        decorators = model.__pydantic_decorators__
+        fields_schema = _model_fields_schema(model)
+        if (
+            fields_schema is None
+            or model.model_config.get("frozen", False)
+            or decorators.model_validators
+            or decorators.root_validators
+        ):
+            return
+
+        validated_fields = {f for d in decorators.field_validators.values() for f in d.info.fields}
+        validated_fields.update(f for d in decorators.validators.values() for f in d.info.fields)
+
+        model_fields = model.model_fields
+        same_config = all(model.model_config.get(k) == view_cls.model_config.get(k) for k in VALIDATION_CONFIG)
+        batched: dict[str, core_schema.TypedDictField] = {}
+        for f_name, f_info in view_cls.model_fields.items():
+            try:
+                m_info = model_fields[f_name]
+            except KeyError:
+                continue
+
+            keyed_by = next((m for m in (*f_info.metadata, *m_info.metadata) if isinstance(m, KeyedBy)), None)
+            if holds_models(f_info.annotation):
+                kind = APPLY_KEYED if keyed_by is not None else APPLY_MODEL
+            elif _is_mapping(f_info.annotation):
+                kind = APPLY_MAPPING
+            else:
+                kind = APPLY_VALUE
+
+            key = keyed_by.key if kind == APPLY_KEYED and keyed_by is not None else None
+            schema = fields_schema[0]["fields"][f_name]["schema"]
+            if schema["type"] == "default":
+                # Unset fields must be left out, not filled with their default.
+                schema = schema["schema"]
+
+            if m_info.frozen or "*" in validated_fields or f_name in validated_fields:
+                validation = ASSIGNED
+            elif kind == APPLY_VALUE and same_config and _same_definition(f_info, m_info):
+                validation = TRUSTED
+            elif kind == APPLY_KEYED and schema["type"] == "list" and _holds_plain_models(schema):
+                # Merged elements are model instances, either original, applied or built from views.
+                validation = TRUSTED
+            else:
+                validation = BATCHED
+                batched[f_name] = core_schema.typed_dict_field(schema)
+
+                if schema["type"] == "dict" and not _has_length_constraints(schema):
+                    self.steps[f_name] = ApplyStep(
+                        kind=kind,
+                        validation=ENTRIES,
+                        entries=SchemaValidator(
+                            core_schema.definitions_schema(
+                                core_schema.typed_dict_schema(
+                                    {f_name: core_schema.typed_dict_field(schema)}, config=fields_schema[1]
+                                ),
+                                fields_schema[2],
+                            )
+                        ),
+                    )
+                    continue
+
+            self.steps[f_name] = ApplyStep(kind=kind, validation=validation, key=key)
+
+        if batched:
+            patch = core_schema.typed_dict_schema(batched, total=False, config=fields_schema[1])
+            self.patch = SchemaValidator(core_schema.definitions_schema(patch, fields_schema[2]))
+
+
+def apply_plan(model: type[BaseModel], view_cls: type[BaseModel]) -> ApplyPlan:
+    """
+    Return the cached plan applying a view class to a model class.
+
+    :param model: Model class the view is applied to.
+    :param view_cls: View (or model) class.
+    :returns: Compiled plan.
+    """
+    plans = class_plans(view_cls)
+    try:
+        return plans[ApplyPlan, model]
+    except KeyError:
+        plan = plans[ApplyPlan, model] = ApplyPlan(model, view_cls)
+        return plan
+
+
+def _model_fields_schema(
+    model: type[BaseModel],
+) -> tuple[core_schema.ModelFieldsSchema, core_schema.CoreConfig | None, list[core_schema.CoreSchema]] | None:
+    if model.__pydantic_root_model__:
+        return None
+
+    schema: Any = model.__pydantic_core_schema__
+    definitions: list[core_schema.CoreSchema] = []
+    if schema["type"] == "definitions":
+        definitions = schema["definitions"]
+        schema = schema["schema"]
+        if schema["type"] == "definition-ref":
+            schema = next((d for d in definitions if d.get("ref") == schema["schema_ref"]), None)
+
+    if schema is None or schema["type"] != "model" or schema["schema"]["type"] != "model-fields":
+        return None
+    return schema["schema"], schema.get("config"), definitions
+
+
+def _has_length_constraints(schema: Mapping[str, Any]) -> bool:
+    return schema.get("min_length") is not None or schema.get("max_length") is not None
+
+
+def _holds_plain_models(schema: Mapping[str, Any]) -> bool:
+    return not _has_length_constraints(schema) and schema["items_schema"]["type"] in ("model", "definition-ref")
+
+
+def _is_mapping(annotation: Any) -> bool:
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _is_mapping(get_args(annotation)[0])
+    if origin is Union or origin is UnionType:
+        return any(_is_mapping(a) for a in get_args(annotation))
+    return isinstance(origin, type) and issubclass(origin, Mapping)
+
+
+def _same_definition(f_info: FieldInfo, m_info: FieldInfo) -> bool:
+    return (
+        f_info.annotation == m_info.annotation
+        and _is_resolved(f_info.annotation)
+        and f_info.metadata == [m for m in m_info.metadata if not isinstance(m, (AccessMode, AccessTag))]
+    )
+
+
+def _same_projection(f_info: FieldInfo, m_info: FieldInfo) -> bool:
+    """Whether a view field accepts every value of a model field once nested models are projected into views."""
+    return (
+        _is_resolved(f_info.annotation)
+        and _model_annotation(f_info.annotation) == m_info.annotation
+        and f_info.metadata == [m for m in m_info.metadata if not isinstance(m, (AccessMode, AccessTag))]
+    )
+
+
+def _model_annotation(annotation: Any) -> Any:
+    """Replace the views in an annotation by their base models."""
+    from .view import View
+
+    if isinstance(annotation, type) and issubclass(annotation, View):
+        return annotation.view_class_root()
+
+    args = get_args(annotation)
+    origin = get_origin(annotation)
+    if not args or origin is Literal:
+        return annotation
+
+    mapped = tuple(_model_annotation(a) for a in args)
+    if mapped == args:
+        return annotation
+    if origin is Annotated:
+        return Annotated[mapped[0], *annotation.__metadata__]
+    if origin is Union or origin is UnionType:
+        return Union[mapped]  # type: ignore  # noqa: UP007
+    return origin[mapped]
+
+
+def _may_be_missing(annotation: Any) -> bool:
+    """Whether an annotation accepts the ``MISSING`` sentinel."""
+    return annotation is MISSING or any(_may_be_missing(a) for a in get_args(annotation))
+
+
+def _is_resolved(annotation: Any) -> bool:
+    if isinstance(annotation, (str, ForwardRef)):
+        return False
+    return all(_is_resolved(a) for a in get_args(annotation))
+
+
+class DiffStep(NamedTuple):
+    """Precomputed handling of one view field when diffing two models."""
+
+    #: View field name.
+    name: str
+
+    #: Converter turning nested models into their views, or ``None``.
+    convert: Converter | None
+
+    #: View class of nested models, mapping values or keyed list elements, or ``None``.
+    nested: "type[View[Any]] | None"
+
+    #: Element key field of keyed lists, or ``None``.
+    key: str | None
+
+
+class DiffPlan:
+    """
+    Compiled comparison of two base model instances through a view class.
+
+    Only fields exposed by both the view and the base model are compared. Nested models mapped to
+    nested views are compared field by field, so their differences are expressed as nested views too.
+    """
+
+    __slots__ = ("view", "steps")
+
+    def __init__(self, view_cls: "type[View[Any]]") -> None:
+        """
+        :param view_cls: View class to compile.
+        """
+        ensure_complete(view_cls)
+
+        self.view = view_cls
+
+        model_fields = view_cls.view_class_root().model_fields
+        steps: list[DiffStep] = []
+        for f_name, f_info in view_cls.model_fields.items():
+            if f_name not in model_fields:
+                continue
+
+            keyed_by = next(
+                (m for m in (*f_info.metadata, *model_fields[f_name].metadata) if isinstance(m, KeyedBy)), None
+            )
+            steps.append(
+                DiffStep(
+                    name=f_name,
+                    convert=compile_converter(f_info.annotation, _model_to_view_leaf),
+                    nested=_nested_view(f_info.annotation),
+                    key=keyed_by.key if keyed_by is not None else None,
+                )
+            )
+
+        #: Steps of the fields exposed by both the view and the base model.
+        self.steps = tuple(steps)
+
+
+def diff_plan(view_cls: "type[View[Any]]") -> DiffPlan:
+    """
+    Return the cached diff plan of a view class.
+
+    :param view_cls: View class.
+    :returns: Compiled plan.
+    """
+    plans = class_plans(view_cls)
+    try:
+        return plans[DiffPlan]
+    except KeyError:
+        plan = plans[DiffPlan] = DiffPlan(view_cls)
+        return plan
+
+
+def _nested_view(annotation: Any) -> "type[View[Any]] | None":
+    from .view import View
+
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _nested_view(get_args(annotation)[0])
+
+    if origin is None:
+        return annotation if isinstance(annotation, type) and issubclass(annotation, View) else None
+
+    args = get_args(annotation)
+    if origin is Union or origin is UnionType:
+        views = {v for v in (_nested_view(a) for a in args) if v is not None}
+        return views.pop() if len(views) == 1 else None
+
+    if isinstance(origin, type) and issubclass(origin, Mapping):
+        return _nested_view(args[1]) if len(args) == 2 else None
+
+    if origin is list and len(args) == 1:
+        return _nested_view(args[0])
+
+    return None
+
+
+def has_validators(model: type[BaseModel]) -> bool:
+    """
+    Whether ``model`` declares validators through decorators.
+
+    :param model: Model class.
+    :returns: ``True`` when any field or model validator is defined.
+    """
+    decorators = model.__pydantic_decorators__
+    return bool(
+        decorators.validators
+        or decorators.field_validators
+        or decorators.root_validators
+        or decorators.model_validators
+    )
+
+
+#: Container shapes of the cached type adapters.
+type ContainerShape = Literal["list", "tuple", "dict", "optional"]
+
+#: Default maximum number of type adapters cached per class.
+ADAPTER_CACHE_SIZE = 16
+
+
+class AdapterCacheInfo(NamedTuple):
+    """Statistics of an :class:`AdapterCache`."""
+
+    #: Number of lookups answered from the cache.
+    hits: int
+
+    #: Number of lookups creating a type adapter.
+    misses: int
+
+    #: Maximum number of cached type adapters.
+    maxsize: int
+
+    #: Number of cached type adapters.
+    currsize: int
+
+
+class AdapterCache:
+    """
+    Bounded cache of the container type adapters of a model or view class.
+
+    Type adapters are created on first use, and the least recently used one is dropped when the
+    cache is full.
+    """
+
+    __slots__ = ("cls", "maxsize", "adapters", "hits", "misses")
+
+    def __init__(self, cls: type[BaseModel], maxsize: int = ADAPTER_CACHE_SIZE) -> None:
+        """
+        :param cls: Model or view class held by the containers.
+        :param maxsize: Maximum number of cached type adapters.
+        """
+        self.cls = cls
+        self.maxsize = maxsize
+        self.adapters: dict[tuple[ContainerShape, Any], TypeAdapter[Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, shape: ContainerShape, key: Any = str) -> TypeAdapter[Any]:
+        """
+        Return the type adapter of a container of ``cls`` instances.
+
+        :param shape: Container shape: ``list[cls]``, ``tuple[cls, ...]``, ``dict[key, cls]`` or
+                      ``cls | None``.
+        :param key: Key type of ``dict`` containers.
+        :returns: Cached type adapter.
+        """
+        cache_key = (shape, key if shape == "dict" else None)
+        adapters = self.adapters
+        try:
+            adapter = adapters.pop(cache_key)
+        except KeyError:
+            adapter = TypeAdapter(_container_type(self.cls, shape, key))
+            self.misses += 1
+            if len(adapters) >= self.maxsize:
+                del adapters[next(iter(adapters))]
+        else:
+            self.hits += 1
+
+        adapters[cache_key] = adapter
+        return adapter
+
+    def cache_info(self) -> AdapterCacheInfo:
+        """
+        Return the cache statistics.
+
+        :returns: Hits, misses, maximum and current size of the cache.
+        """
+        return AdapterCacheInfo(self.hits, self.misses, self.maxsize, len(self.adapters))
+
+    def clear(self) -> None:
+        """Drop the cached type adapters and reset the statistics."""
+        self.adapters.clear()
+        self.hits = self.misses = 0
+
+
+def adapter_cache(cls: type[BaseModel]) -> AdapterCache:
+    """
+    Return the container type adapter cache owned by a model or view class.
+
+    :param cls: Model or view class.
+    :returns: Adapter cache.
+    """
+    plans = class_plans(cls)
+    try:
+        return plans[AdapterCache]
+    except KeyError:
+        cache = plans[AdapterCache] = AdapterCache(cls)
+        return cache
+
+
+def list_adapter[M: BaseModel](cls: type[M]) -> TypeAdapter[list[M]]:
+    """
+    Return the cached ``list`` type adapter of a model or view class.
+
+    :param cls: Model or view class.
+    :returns: Type adapter validating and serializing lists of ``cls`` instances.
+    """
+    return adapter_cache(cls).get("list")
+
+
+def _container_type(cls: type[BaseModel], shape: ContainerShape, key: Any) -> Any:
+    if shape == "list":
+        return list[cls]  # type: ignore
+    if shape == "tuple":
+        return tuple[cls, ...]  # type: ignore
+    if shape == "dict":
+        return dict[key, cls]  # type: ignore
+    if shape == "optional":
+        return cls | None
+    raise ValueError(f"Unknown container shape {shape!r}")
+
+
+def holds_models(annotation: Any) -> bool:
+    """
+    Whether values of ``annotation`` may hold model (or view) instances.
+
+    :param annotation: Field annotation.
+    :returns: ``True`` when a model class is reachable from ``annotation``.
+    """
+    return compile_converter(annotation, _model_leaf) is not None
+
+
+def _model_leaf(cls: type[Any]) -> tuple[type[Any], Converter] | None:
+    if issubclass(cls, BaseModel):
+        return cls, _identity
+    return None
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _model_to_view_leaf(cls: type[Any], *, trusted: bool = False) -> tuple[type[Any], Converter] | None:
+    from .view import View
+
+    if not issubclass(cls, View):
+        return None
+
+    project: Converter | None = None
+
+    def convert(model: BaseModel) -> BaseModel:
+        nonlocal project
+        if project is None:
+            plan = build_from_plan(cls)
+            project = plan.trusted_project if trusted else plan.project
+        return project(model)
+
+    return cls.view_class_root(), convert
+
+
+def _trusted_model_to_view_leaf(cls: type[Any]) -> tuple[type[Any], Converter] | None:
+    return _model_to_view_leaf(cls, trusted=True)
+
+
+def _view_to_model_leaf(cls: type[Any]) -> tuple[type[Any], Converter] | None:
+    from .view import View
+
+    if cls is BaseModel:
+        # ``Self`` values are instances of the view owning the field.
+        return View, _construct_model
+    if not issubclass(cls, View):
+        return None
+
+    plan: ConstructPlan | None = None
+
+    def convert(view: BaseModel) -> BaseModel:
+        nonlocal plan
+        if type(view) is not cls:
+            return _construct_model(view)
+        if plan is None:
+            plan = construct_plan(cls)
+        return plan(view)
+
+    return cls, convert
+
+
+def _other_model_leaf(view_cls: type[Any], cls: type[Any]) -> tuple[type[Any], Converter] | None:
+    if issubclass(cls, BaseModel) and cls is not view_cls:
+        return cls, _identity
+    return None
+
+
+def _view_convert_leaf(
+    source_cls: "type[View[Any]]", target_cls: "type[View[Any]]", cls: type[Any]
+) -> tuple[type[Any], Converter] | None:
+    if cls is not source_cls:
+        return None
+
+    convert_view: Converter | None = None
+
+    def convert(view: BaseModel) -> BaseModel:
+        nonlocal convert_view
+        if type(view) is not source_cls:
+            return convert_plan(cast("type[View[Any]]", type(view)), target_cls).convert(view)
+        if convert_view is None:
+            convert_view = convert_plan(source_cls, target_cls).convert
+        return convert_view(view)
+
+    return source_cls, convert
+
+
+def _construct_model(view: BaseModel) -> BaseModel:
+    return construct_plan(cast("type[View[Any]]", type(view)))(view)
+
+
+def _default_from_preceding(
+    get_default: Callable[[dict[str, Any]], Any], names: list[str], values: dict[str, Any]
+) -> Any:
+    return get_default({name: values[name] for name in names})
+
+
+def _default_getter(f_info: FieldInfo) -> Callable[[dict[str, Any]], Any] | None:
+    if f_info.is_required() or type(f_info.default) in IMMUTABLE_TYPES:
+        return None
+
+    default_factory = f_info.default_factory
+    if default_factory is None:
+
+        def get_default(values: dict[str, Any]) -> Any:
+            return f_info.get_default()
+
+        return get_default
+
+    # Inspecting the factory signature is slow, so it is only done once.
+    if f_info.default_factory_takes_validated_data:
+        return cast(Callable[[dict[str, Any]], Any], default_factory)
+    return lambda values: default_factory()  # type: ignore
@@ -0,0 +1,243 @@
+"""
+Incremental JSON decoding used by :class:`~pydantic_views.view.View` stream helpers.
+
+Records are split out of a binary stream and validated one by one by ``pydantic-core``, straight
+from their JSON text. Only the record being read is kept in memory, whatever the size of the
+stream.
+"""
+
+import codecs
+import re
+from collections.abc import Iterator
+from typing import Protocol
+
+#: Default number of bytes read from streams at once.
+CHUNK_SIZE = 1 << 16
+
+_SPACE = re.compile(r"[ \t\n\r]*")
+
+#: Skips any text up to the next structural character of a top level element, strings included. The
+#: group is the structural character, or the opening quote of a string not fully read yet.
+_STRUCTURE = re.compile(r'[^"\[\]{},]*+(?:"(?:[^"\\]++|\\.)*+"[^"\[\]{},]*+)*+([\[\]{},"])', re.DOTALL)
+
+#: Same as :data:`_STRUCTURE` inside nested arrays and objects, where commas do not matter.
+_NESTED_STRUCTURE = re.compile(r'[^"\[\]{}]*+(?:"(?:[^"\\]++|\\.)*+"[^"\[\]{}]*+)*+([\[\]{}"])', re.DOTALL)
+
+#: Skips the rest of a string, up to its closing quote or to the end of the text read so far.
+_STRING_REST = re.compile(r'(?:[^"\\]++|\\.)*+', re.DOTALL)
+
+_STRING = r'"[^"\\]*+(?:\\.[^"\\]*+)*+"'
+_FLAT = rf'[^"\[\]{{}}]*+(?:{_STRING}[^"\[\]{{}}]*+)*+'
+_NESTED = rf'[^"\[\]{{}}]*+(?:(?:{_STRING}|[\[{{]{_FLAT}[\]}}])[^"\[\]{{}}]*+)*+'
+
+#: Matches a whole top level element nesting up to two levels of arrays and objects, the common
+#: case, followed by the separator ending it, in a single call. Deeper or incomplete elements do not
+#: match.
+_ELEMENT = re.compile(rf'([^"\[\]{{}},]*+(?:(?:{_STRING}|[\[{{]{_NESTED}[\]}}])[^"\[\]{{}},]*+)*+)([,\]])', re.DOTALL)
+
+
+class BinaryStream(Protocol):
+    """Binary file object, like an open file, a :class:`io.BytesIO` or a :class:`mmap.mmap`."""
+
+    def read(self, size: int = ..., /) -> bytes: ...
+
+    def readline(self, size: int = ..., /) -> bytes: ...
+
+
+def iter_ndjson(stream: BinaryStream) -> Iterator[bytes]:
+    """
+    Iterate the records of a newline delimited JSON stream.
+
+    Blank lines are skipped.
+
+    :param stream: Binary stream.
+    :returns: Iterator of the JSON bytes of each record.
+    """
+    for line in iter(stream.readline, b""):
+        record = line.strip()
+        if record:
+            yield record
+
+
+def iter_json_array(stream: BinaryStream, *, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """
+    Iterate the elements of a JSON array stream.
+
+    The stream is read in chunks of ``chunk_size`` bytes. Elements are delimited by their
+    structural characters only, tracking the nesting depth and strings, without decoding them.
+    Malformed elements are yielded as they are, so they are reported when validated.
+
+    :param stream: Binary stream holding a JSON array, encoded in UTF-8.
+    :param chunk_size: Number of bytes read at once.
+    :returns: Iterator of the JSON text of each element.
+    :raises ValueError: When the stream does not hold a single JSON array.
+    """
+    return _ArrayReader(stream, chunk_size).elements()
+
+
+class _ArrayReader:
+    def __init__(self, stream: BinaryStream, chunk_size: int) -> None:
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.decoder = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Read the next chunk, dropping the consumed text. Returns ``False`` at the end of the stream."""
+        if self.eof:
+            return False
+
+        chunk = self.stream.read(self.chunk_size)
+        self.eof = not chunk
+        self.text = self.text[self.pos :] + self.decoder.decode(chunk, final=self.eof)
+        self.pos = 0
+        return not self.eof
+
+    def next_char(self) -> str:
+        """Skip whitespace and return the next character, or an empty string at the end of the stream."""
+        while True:
+            self.pos = _SPACE.match(self.text, self.pos).end()  # type: ignore
+            if self.pos < len(self.text) or not self.fill():
+                return self.text[self.pos : self.pos + 1]
+
+    def elements(self) -> Iterator[str]:
+        if self.next_char() != "[":
+            raise ValueError("JSON stream does not hold an array")
+        self.pos += 1
+
+        if self.next_char() == "]":
+            self.pos += 1
+        else:
+            while True:
+                match = _ELEMENT.match(self.text, self.pos)
+                if match is not None:
+                    self.pos = match.end()
+                    yield match.group(1).strip()
+                    if match.group(2) == "]":
+                        break
+                    continue
+
+                yield self.element()
+
+                char = self.next_char()
+                self.pos += 1
+                if char == "]":
+                    break
+                if char != ",":
+                    raise ValueError("JSON array stream ended before the array was closed")
+
+        if self.next_char():
+            raise ValueError("JSON stream does not hold a single array")
+
+    def element(self) -> str:
+        self.next_char()
+        # The scan resumes where it stopped after reading more text, so each character is only
+        # scanned once, and no value is decoded.
+        scanned, depth, in_string = 0, 0, False
+        while True:
+            boundary, scanned, depth, in_string = self.scan(self.pos + scanned, depth, in_string)
+            if boundary is not None:
+                start = self.pos
+                self.pos = boundary
+                return self.text[start:boundary].rstrip()
+
+            scanned -= self.pos
+            if not self.fill():
+                raise ValueError("JSON array stream ended before the array was closed")
+
+    def scan(self, pos: int, depth: int, in_string: bool) -> tuple[int | None, int, int, bool]:
+        """
+        Find where the element being read ends, by its structure only.
+
+        :param pos: Position to resume the scan from.
+        :param depth: Nesting depth of arrays and objects at ``pos``.
+        :param in_string: Whether ``pos`` is inside a string.
+        :returns: Position of the element end, or ``None`` when more text is needed, followed by the
+                  position, depth and string state to resume the scan from.
+        """
+        text = self.text
+        while True:
+            if in_string:
+                pos = _STRING_REST.match(text, pos).end()  # type: ignore
+                if pos == len(text) or text[pos] != '"':
+                    # The string, or its last escape sequence, goes on in the next chunk.
+                    return None, pos, depth, True
+                pos += 1
+                in_string = False
+
+            match = (_NESTED_STRUCTURE if depth else _STRUCTURE).match(text, pos)
+            if match is None:
+                # Everything up to the end of the text read so far was skipped.
+                return None, len(text), depth, False
+
+            char = match.group(1)
+            pos = match.end()
+            if char == '"':
+                in_string = True
+            elif char in "[{":
+                depth += 1
+            elif depth:
+                depth -= 1
+            elif char in ",]":
+                return match.start(1), pos, depth, False
+
+
+class JsonChunker:
+    """
+    Join the JSON texts of many records into chunks of a JSON array, or of newline delimited JSON.
+
+    Records are buffered until at least ``chunk_size`` bytes are pending, so the chunks are big enough
+    to be written efficiently while only one chunk is kept in memory.
+    """
+
+    __slots__ = ("ndjson", "chunk_size", "pending", "size", "started")
+
+    def __init__(self, *, ndjson: bool = False, chunk_size: int = CHUNK_SIZE) -> None:
+        """
+        :param ndjson: Write one record per line instead of the elements of a JSON array.
+        :param chunk_size: Minimum number of bytes of the chunks, but the last one.
+        """
+        self.ndjson = ndjson
+        self.chunk_size = chunk_size
+        self.pending: list[bytes] = []
+        self.size = 0
+        self.started = False
+
+    def add(self, record: bytes) -> bytes | None:
+        """
+        Add the JSON text of a record.
+
+        :param record: JSON text of the record.
+        :returns: Next chunk when enough bytes are pending, otherwise ``None``.
+        """
+        if self.ndjson:
+            self.pending.append(record)
+            self.pending.append(b"\n")
+        else:
+            self.pending.append(b"," if self.started else b"[")
+            self.pending.append(record)
+            self.started = True
+
+        self.size += len(record) + 1
+        if self.size < self.chunk_size:
+            return None
+
+        chunk = b"".join(self.pending)
+        self.pending.clear()
+        self.size = 0
+        return chunk
+
+    def close(self) -> bytes:
+        """
+        Return the last chunk, closing the JSON array.
+
+        :returns: Pending bytes, possibly empty for newline delimited JSON.
+        """
+        if not self.ndjson:
+            self.pending.append(b"]" if self.started else b"[]")
+        chunk = b"".join(self.pending)
+        self.pending.clear()
+        self.size = 0
+        return chunk
@@ -1,10 +1,52 @@
-from collections.abc import Mapping
-from typing import Any, ClassVar, cast, overload
+from collections import defaultdict
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Generator, Iterable, Iterator, Mapping, Sequence
+from itertools import batched
+from operator import itemgetter
+from typing import Any, ClassVar, Literal, NamedTuple, Self, cast, overload
 from weakref import ReferenceType
 
-from pydantic import BaseModel, RootModel
+from pydantic import BaseModel, RootModel, TypeAdapter, ValidationError
+from pydantic_core import MISSING, PydanticUndefined, SchemaValidator
 
 from .metaclass import ViewMetaClass
+from .plans import (
+    APPLY_KEYED,
+    APPLY_VALUE,
+    BATCHED,
+    ENTRIES,
+    TRUSTED,
+    AdapterCache,
+    ApplyPlan,
+    DiffPlan,
+    Projection,
+    adapter_cache,
+    apply_plan,
+    build_from_plan,
+    build_to_plan,
+    construct_plan,
+    convert_plan,
+    diff_plan,
+    dump_plan,
+    json_to_model_plan,
+    list_adapter,
+    projection,
+    row_plan,
+    storage_plan,
+)
+from .streams import CHUNK_SIZE, BinaryStream, JsonChunker, iter_json_array, iter_ndjson
+
+
+class StreamResult[M: BaseModel](NamedTuple):
+    """Outcome of decoding one record with :meth:`View.view_validate_json_iter`."""
+
+    #: Record position in the stream.
+    position: int
+
+    #: Decoded instance, or ``None`` when the record is not valid.
+    value: M | None
+
+    #: Validation error raised while decoding the record, or ``None``.
+    error: ValidationError | None
 
 
 class View[T: BaseModel](BaseModel, metaclass=ViewMetaClass):
@@ -12,12 +54,26 @@ class View[T: BaseModel](BaseModel, metaclass=ViewMetaClass):
 
     __model_class_root__: ClassVar[ReferenceType[type[BaseModel]]]
 
+    #: Whether conversions skip validation when no ``trusted`` argument is given. Set it with the
+    #: ``trusted`` option of builders, presets and view class keywords.
+    __view_trusted__: ClassVar[bool] = False
+
     model_config = {
         "protected_namespaces": (
             "view_class_root",
+            "view_convert",
             "view_build_to",
             "view_apply_to",
             "view_build_from",
+            "view_adapter",
+            "view_build_rows",
+            "view_build_row_dicts",
+            "view_validate_json",
+            "view_diff",
+            "view_dump",
+            "view_projection",
+            "view_select_columns",
+            "view_document_projection",
         )
     }
 
@@ -37,35 +93,567 @@ class View[T: BaseModel](BaseModel, metaclass=ViewMetaClass):
         return cast(type[T], root)
 
     @classmethod
-    def view_build_from(cls, model: T):
+    def view_build_from(cls, model: T, *, validate: bool = False, trusted: bool | None = None) -> Self:
         """
         Create a view instance from a model instance, omitting unset fields.
 
+        By default the view is projected from the model: it is built straight from the model
+        attributes and ``model_fields_set``, recursing only into nested models that map to nested
+        views. Model data was already validated, so it is not validated again. Views declaring their
+        own validators are validated, unless trusted.
+
+        Projected views share the model values: containers and plain nested models are not copied,
+        so mutating them mutates the model. Validated views hold copies.
+
         :param model: Model instance to build the view from.
+        :param validate: Validate the dumped model data instead of projecting it.
+        :param trusted: Project views declaring their own validators too, without running them.
+                        Defaults to :attr:`__view_trusted__`.
         :returns: View populated with the model data.
         """
-        return cls.model_validate(model.model_dump(exclude_unset=True, by_alias=True))
+        if validate:
+            return cls.model_validate(model.model_dump(exclude_unset=True, by_alias=True))
+        return cast(Self, build_from_plan(cls)(model, trusted=_is_trusted(cls, trusted)))
+
+    @classmethod
+    def view_build_from_many(
+        cls, models: Iterable[T], *, validate: bool = False, trusted: bool | None = None
+    ) -> list[Self]:
+        """
+        Create view instances from many model instances, omitting unset fields.
+
+        Projected views never enter ``pydantic-core``. When validating, all models are dumped and
+        validated through the cached ``list`` type adapters of the model and the view, so
+        ``pydantic-core`` is entered twice for the whole batch instead of twice per model.
+
+        :param models: Model instances to build the views from.
+        :param validate: Validate the dumped model data instead of projecting it.
+        :param trusted: Project views declaring their own validators too (see :meth:`view_build_from`).
+        :returns: Views populated with the models data, in the same order.
+        """
+        plan = build_from_plan(cls)
+        trusted = _is_trusted(cls, trusted)
+        if not validate and (plan.projection or trusted):
+            project = plan.trusted_project if trusted else plan.project
+            return cast(list[Self], [project(m) for m in models])
+
+        data = list_adapter(cls.view_class_root()).dump_python(list(models), exclude_unset=True, by_alias=True)
+        return list_adapter(cls).validate_python(data)
+
+    @classmethod
+    def view_build_from_iter(
+        cls, models: Iterable[T], *, chunk_size: int = 1000, validate: bool = False, trusted: bool | None = None
+    ) -> Iterator[Self]:
+        """
+        Lazily create view instances from many model instances.
+
+        Models are converted in chunks of ``chunk_size`` with :meth:`view_build_from_many`, so
+        memory usage is bounded whatever the number of models.
+
+        :param models: Model instances to build the views from.
+        :param chunk_size: Number of models converted at once.
+        :param validate: Validate the dumped model data instead of projecting it.
+        :param trusted: Project views declaring their own validators too (see :meth:`view_build_from`).
+        :returns: Iterator of views, in the same order.
+        """
+        for chunk in batched(models, chunk_size, strict=False):
+            yield from cls.view_build_from_many(chunk, validate=validate, trusted=trusted)
+
+    @overload
+    @classmethod
+    def view_adapter(cls, shape: Literal["list"] = "list") -> TypeAdapter[list[Self]]: ...
+
+    @overload
+    @classmethod
+    def view_adapter(cls, shape: Literal["tuple"]) -> TypeAdapter[tuple[Self, ...]]: ...
+
+    @overload
+    @classmethod
+    def view_adapter(cls, shape: Literal["dict"], *, key: Any = str) -> TypeAdapter[dict[Any, Self]]: ...
+
+    @overload
+    @classmethod
+    def view_adapter(cls, shape: Literal["optional"]) -> TypeAdapter[Self | None]: ...
+
+    @classmethod
+    def view_adapter(
+        cls, shape: Literal["list", "tuple", "dict", "optional"] = "list", *, key: Any = str
+    ) -> TypeAdapter[Any]:
+        """
+        Return the type adapter of a container of view instances.
+
+        Type adapters are created on first use and kept in a bounded cache owned by the view class
+        (see :meth:`view_adapter_cache`), so their core schemas are built once instead of on every
+        ``TypeAdapter(list[View])`` call.
+
+        :param shape: Container shape: ``list[View]``, ``tuple[View, ...]``, ``dict[key, View]`` or
+                      ``View | None``.
+        :param key: Key type of ``dict`` containers.
+        :returns: Cached type adapter.
+        """
+        return adapter_cache(cls).get(shape, key)
+
+    @classmethod
+    def view_adapter_cache(cls) -> AdapterCache:
+        """
+        Return the container type adapter cache of the view class.
+
+        Use its ``cache_info()`` method to read the cache hits and misses.
+
+        :returns: Adapter cache.
+        """
+        return adapter_cache(cls)
+
+    @classmethod
+    def view_projection(cls) -> Projection:
+        """
+        Return the model fields exposed by this view, nested views included.
+
+        The projection is computed once per view class. Its ``include`` structure can be given to
+        :meth:`pydantic.BaseModel.model_dump` of base model instances, and its ``paths`` list the
+        exposed fields as dotted paths, like ``"items.name"``.
+
+        :returns: Projection of the view.
+        """
+        return projection(cls)
+
+    @classmethod
+    def view_select_columns(cls, *, by_alias: bool = True) -> tuple[str, ...]:
+        """
+        Return the stored model fields this view needs, like the columns of a SQL ``SELECT``.
+
+        Nested views are stored in their parent field, so only top level fields are listed.
+        Computed fields are not stored: when the view exposes any, all the model fields are
+        returned. Rows holding these columns can be validated by the view straight away.
+
+        :param by_alias: Return the validation aliases of the fields instead of their names.
+        :returns: Field names, in model order.
+        """
+        plan = storage_plan(cls)
+        return plan.alias_columns if by_alias else plan.columns
+
+    @classmethod
+    def view_document_projection(cls, *, by_alias: bool = True) -> dict[str, int]:
+        """
+        Return the stored model fields this view needs, as a MongoDB style projection document.
+
+        Fields of nested views are given as dotted paths, so only the fields they expose are
+        fetched. Fields of models whose computed fields are exposed are fetched whole (see
+        :meth:`view_select_columns`).
+
+        :param by_alias: Use the validation aliases of the fields instead of their names.
+        :returns: Projection document mapping dotted paths to ``1``.
+        """
+        plan = storage_plan(cls)
+        return dict.fromkeys(plan.alias_paths if by_alias else plan.paths, 1)
+
+    @classmethod
+    def view_dump_python(
+        cls,
+        model: T,
+        *,
+        mode: Literal["json", "python"] = "python",
+        by_alias: bool | None = None,
+        exclude_none: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Serialize a model instance as the view built from it would be serialized.
+
+        It is equivalent to ``cls.view_build_from(model).model_dump(...)``, without building the
+        view. Whenever the view and its nested views serialize their fields like their base models,
+        the model is dumped straight away using a nested ``include`` mask of the view fields,
+        computed once per view class. Otherwise the view is built and dumped.
 
-    def view_build_to(self) -> T:
+        :param model: Model instance to serialize.
+        :param mode: Serialization mode, ``"python"`` or ``"json"``.
+        :param by_alias: Use field aliases as keys.
+        :param exclude_none: Leave out fields holding ``None``.
+        :returns: Serialized data.
+        """
+        plan = dump_plan(cls)
+        if plan.include is None or type(model) is not cls.view_class_root():
+            return build_from_plan(cls)(model).model_dump(mode=mode, by_alias=by_alias, exclude_none=exclude_none)
+
+        return model.model_dump(
+            mode=mode,
+            include=plan.include,
+            by_alias=by_alias,
+            exclude_unset=plan.exclude_unset,
+            exclude_none=exclude_none,
+        )
+
+    @classmethod
+    def view_dump_json(
+        cls, model: T, *, indent: int | None = None, by_alias: bool | None = None, exclude_none: bool = False
+    ) -> str:
+        """
+        Serialize a model instance to JSON as the view built from it would be serialized.
+
+        It is equivalent to ``cls.view_build_from(model).model_dump_json(...)``, without building
+        the view (see :meth:`view_dump_python`).
+
+        :param model: Model instance to serialize.
+        :param indent: Indentation of the JSON output.
+        :param by_alias: Use field aliases as keys.
+        :param exclude_none: Leave out fields holding ``None``.
+        :returns: JSON string.
+        """
+        plan = dump_plan(cls)
+        if plan.include is None or type(model) is not cls.view_class_root():
+            return build_from_plan(cls)(model).model_dump_json(
+                indent=indent, by_alias=by_alias, exclude_none=exclude_none
+            )
+
+        return model.model_dump_json(
+            indent=indent,
+            include=plan.include,
+            by_alias=by_alias,
+            exclude_unset=plan.exclude_unset,
+            exclude_none=exclude_none,
+        )
+
+    @classmethod
+    def view_dump_json_iter(
+        cls,
+        models: Iterable[T],
+        *,
+        ndjson: bool = False,
+        by_alias: bool | None = None,
+        exclude_none: bool = False,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """
+        Lazily serialize many model instances, as their views would be, into JSON chunks.
+
+        Each model is serialized as :meth:`view_dump_json` does, and the results are joined into
+        chunks of a JSON array, or of newline delimited JSON, of at least ``chunk_size`` bytes. Only
+        one chunk is kept in memory, and the first one is ready as soon as its models are serialized,
+        so it suits streaming responses.
+
+        :param models: Model instances to serialize.
+        :param ndjson: Write one model per line instead of the elements of a JSON array.
+        :param by_alias: Use field aliases as keys.
+        :param exclude_none: Leave out fields holding ``None``.
+        :param chunk_size: Minimum number of bytes of the chunks, but the last one.
+        :returns: Iterator of JSON chunks.
+        """
+        encode = _json_encoder(cls, by_alias=by_alias, exclude_none=exclude_none)
+        chunker = JsonChunker(ndjson=ndjson, chunk_size=chunk_size)
+        for model in models:
+            chunk = chunker.add(encode(model))
+            if chunk is not None:
+                yield chunk
+
+        last = chunker.close()
+        if last:
+            yield last
+
+    @classmethod
+    async def view_dump_json_aiter(
+        cls,
+        models: AsyncIterable[T] | Iterable[T],
+        *,
+        ndjson: bool = False,
+        by_alias: bool | None = None,
+        exclude_none: bool = False,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """
+        Asynchronous version of :meth:`view_dump_json_iter`, reading models from an asynchronous
+        iterable, like a database cursor, and suited to ASGI streaming responses.
+
+        :param models: Model instances to serialize.
+        :param ndjson: Write one model per line instead of the elements of a JSON array.
+        :param by_alias: Use field aliases as keys.
+        :param exclude_none: Leave out fields holding ``None``.
+        :param chunk_size: Minimum number of bytes of the chunks, but the last one.
+        :returns: Asynchronous iterator of JSON chunks.
+        """
+        if not isinstance(models, AsyncIterable):
+            for sync_chunk in cls.view_dump_json_iter(
+                models, ndjson=ndjson, by_alias=by_alias, exclude_none=exclude_none, chunk_size=chunk_size
+            ):
+                yield sync_chunk
+            return
+
+        encode = _json_encoder(cls, by_alias=by_alias, exclude_none=exclude_none)
+        chunker = JsonChunker(ndjson=ndjson, chunk_size=chunk_size)
+        async for model in models:
+            chunk = chunker.add(encode(model))
+            if chunk is not None:
+                yield chunk
+
+        last = chunker.close()
+        if last:
+            yield last
+
+    def view_build_to(self, *, trusted: bool | None = None) -> T:
         """
         Build the associated model instance using only fields set on the view.
 
+        Fields holding their default value are skipped. The conversion plan is compiled once per
+        view class: set values are moved straight into the model validation input, and only views
+        holding nested models are serialized, in a single pass.
+
+        Trusted views are constructed instead: the model and the models of nested views are built
+        with :meth:`~pydantic.BaseModel.model_construct`, and no validator runs. Only use it for
+        data validated by a view already, as inside a service boundary. Views leaving required model
+        fields unset, like partial ``Update`` views, are validated anyway, so the missing fields are
+        reported.
+
+        :param trusted: Construct the model without validation. Defaults to :attr:`__view_trusted__`.
         :returns: Model instance created from the view data.
+        :raises pydantic.ValidationError: When the view data is not valid for the model, or when a
+                                          trusted view leaves required model fields unset.
+        """
+        if _is_trusted(type(self), trusted):
+            return cast(T, construct_plan(type(self))(self))
+        return cast(T, build_to_plan(type(self))(self))
+
+    @classmethod
+    def view_build_to_many(cls, views: Iterable[Self], *, trusted: bool | None = None) -> list[T]:
         """
+        Build model instances from many views, using only fields set on each view.
 
-        return self.view_class_root().model_validate(
-            self.model_dump(exclude_unset=True, exclude_defaults=True, by_alias=True)
+        The validation input of every view is collected first and validated through the cached
+        ``list`` type adapter of the model, in a single ``pydantic-core`` call.
+
+        :param views: View instances.
+        :param trusted: Construct the models without validation (see :meth:`view_build_to`).
+        :returns: Model instances, in the same order.
+        """
+        if _is_trusted(cls, trusted):
+            plan = construct_plan(cls)
+            return [cast(T, plan(v)) for v in views]
+        return list_adapter(cls.view_class_root()).validate_python(_build_to_data(cls, views))
+
+    @classmethod
+    def view_validate_json_to_model(cls, data: str | bytes | bytearray) -> T:
+        """
+        Validate a view JSON payload straight into a model instance.
+
+        The payload is validated against the view, so fields the view does not accept are handled as
+        :meth:`pydantic.BaseModel.model_validate_json` would, but no view instance is created: nested
+        views are validated into plain data and the model is built from it, keeping nested plain
+        model instances as they are. The result matches ``cls.model_validate_json(data).view_build_to()``.
+
+        :param data: JSON payload.
+        :returns: Model instance.
+        :raises pydantic.ValidationError: When the payload is not valid for the view or the model.
+        """
+        return cast(T, json_to_model_plan(cls)(data))
+
+    @classmethod
+    def view_validate_json_iter(
+        cls, stream: BinaryStream, *, ndjson: bool = False, chunk_size: int = CHUNK_SIZE
+    ) -> Iterator[StreamResult[Self]]:
+        """
+        Lazily validate view instances from a JSON array, or newline delimited JSON, binary stream.
+
+        Records are split out of the stream without decoding them, and each one is validated from
+        its JSON bytes by ``pydantic-core``. Only the record being read is kept in memory, so memory
+        usage stays flat whatever the stream size. A record failing validation does not stop the
+        iteration: its result holds the ``ValidationError`` instead of a view.
+
+        :param stream: Binary stream, like an open file or a memory-mapped file.
+        :param ndjson: Read one record per line instead of the elements of a JSON array.
+        :param chunk_size: Number of bytes read at once from JSON array streams.
+        :returns: Iterator of one :class:`StreamResult` per record, in stream order.
+        :raises ValueError: When a JSON array stream does not hold a single array.
+        """
+        records: Iterator[str | bytes] = (
+            iter_ndjson(stream) if ndjson else iter_json_array(stream, chunk_size=chunk_size)
         )
+        validate_json = cls.__pydantic_validator__.validate_json
+        for index, record in enumerate(records):
+            try:
+                yield StreamResult(index, validate_json(record), None)
+            except ValidationError as ex:
+                yield StreamResult(index, None, ex)
+
+    @classmethod
+    def view_build_to_json_iter(
+        cls, stream: BinaryStream, *, ndjson: bool = False, chunk_size: int = CHUNK_SIZE
+    ) -> Iterator[StreamResult[T]]:
+        """
+        Lazily build model instances from a JSON array, or newline delimited JSON, binary stream.
+
+        Each record is validated with :meth:`view_validate_json_to_model`, without creating view
+        instances. Validation errors, of the view or of the model, are reported in the record result.
+
+        :param stream: Binary stream, like an open file or a memory-mapped file.
+        :param ndjson: Read one record per line instead of the elements of a JSON array.
+        :param chunk_size: Number of bytes read at once from JSON array streams.
+        :returns: Iterator of one :class:`StreamResult` per record, in stream order.
+        :raises ValueError: When a JSON array stream does not hold a single array.
+        """
+        plan = json_to_model_plan(cls)
+        records: Iterator[str | bytes] = (
+            iter_ndjson(stream) if ndjson else iter_json_array(stream, chunk_size=chunk_size)
+        )
+        for index, record in enumerate(records):
+            try:
+                yield StreamResult(index, cast(T, plan(record)), None)
+            except ValidationError as ex:
+                yield StreamResult(index, None, ex)
+
+    @classmethod
+    def view_build_rows(
+        cls,
+        views: Iterable[Self],
+        columns: Sequence[str] | None = None,
+        *,
+        mode: Literal["json", "python"] = "python",
+    ) -> list[tuple[Any, ...]]:
+        """
+        Build the stored rows of the models built from many views, ready for ``executemany``.
+
+        Rows hold the same values as ``model.model_dump(mode=mode)`` of the models built by
+        :meth:`view_build_to_many`. When the base model declares no model validators, serializers
+        or ``model_post_init``, the views data is validated and dumped in two ``pydantic-core``
+        calls for the whole batch, without creating the model instances.
+
+        :param views: View instances.
+        :param columns: Model field names, in row order. Defaults to all the model fields not
+                        excluded from serialization, in model order.
+        :param mode: Serialization mode, ``"python"`` or ``"json"``.
+        :returns: Parameter tuples, in the same order as the views.
+        :raises ValueError: When ``columns`` is empty.
+        """
+        plan = row_plan(cls)
+        names = tuple(columns) if columns is not None else plan.fields
+        if not names:
+            raise ValueError("Rows must hold at least one column")
+
+        rows = plan(_build_to_data(cls, views), mode=mode)
+        if len(names) == 1:
+            # ``itemgetter`` of a single item returns the value, not a tuple.
+            name = names[0]
+            return [(row[name],) for row in rows]
+        getter = itemgetter(*names)
+        return [getter(row) for row in rows]
+
+    @classmethod
+    def view_build_row_dicts(
+        cls, views: Iterable[Self], *, mode: Literal["json", "python"] = "python", by_alias: bool = False
+    ) -> list[dict[str, Any]]:
+        """
+        Build the stored rows of the models built from many views, as dictionaries.
 
-    def view_apply_to(self, model: T) -> T:
+        See :meth:`view_build_rows`.
+
+        :param views: View instances.
+        :param mode: Serialization mode, ``"python"`` or ``"json"``.
+        :param by_alias: Key the rows by field alias instead of field name.
+        :returns: Rows holding the model fields not excluded from serialization.
+        """
+        return row_plan(cls)(_build_to_data(cls, views), mode=mode, by_alias=by_alias)
+
+    @classmethod
+    def view_build_to_iter(
+        cls, views: Iterable[Self], *, chunk_size: int = 1000, trusted: bool | None = None
+    ) -> Iterator[T]:
+        """
+        Lazily build model instances from many views.
+
+        Views are converted in chunks of ``chunk_size`` with :meth:`view_build_to_many`, so memory
+        usage is bounded whatever the number of views.
+
+        :param views: View instances.
+        :param chunk_size: Number of views converted at once.
+        :param trusted: Construct the models without validation (see :meth:`view_build_to`).
+        :returns: Iterator of model instances, in the same order.
+        """
+        for chunk in batched(views, chunk_size, strict=False):
+            yield from cls.view_build_to_many(chunk, trusted=trusted)
+
+    def view_convert[V: View[Any]](self, view_cls: type[V]) -> V:
+        """
+        Convert the view into another view of the same base model.
+
+        The result is the same as ``view_cls.view_build_from(self.view_build_to())``, but no model
+        instance is created: fields sharing the model definition in both views are copied, and only
+        the other ones, like nested views, are validated by the model field schemas. The conversion
+        plan is compiled once per pair of view classes. Models declaring validators, and target views
+        exposing computed fields, are still converted through the model.
+
+        :param view_cls: Target view class.
+        :returns: Target view instance.
+        :raises TypeError: When ``view_cls`` is not a view of the same model.
+        :raises pydantic.ValidationError: When the view data is not valid for the model.
+        """
+        return cast(V, convert_plan(type(self), view_cls)(self))
+
+    def view_apply_to(self, model: T, *, copy_on_write: bool = False, trusted: bool | None = None) -> T:
         """
         Merge the view data into an existing model instance, returning a copy.
 
         :param model: Model instance used as the base.
+        :param copy_on_write: Share untouched values with ``model`` instead of deep copying them
+                              (see :func:`model_apply`).
+        :param trusted: Merge the view data without validation (see :func:`model_apply`).
+                        Defaults to :attr:`__view_trusted__`.
         :returns: New model instance with the view data applied.
         """
 
-        return model_apply(model, self)
+        return model_apply(model, self, copy_on_write=copy_on_write, trusted=trusted)
+
+    @classmethod
+    def view_diff(cls, orig: T, new: T) -> Self:
+        """
+        Create the smallest view turning ``orig`` into ``new`` when applied.
+
+        It is the inverse of :meth:`view_apply_to`: ``cls.view_diff(orig, new).view_apply_to(orig)``
+        equals ``new`` on every field exposed by the view. Only fields holding different values are
+        set. Nested models mapped to nested views, mapping entries and elements of keyed lists (see
+        :class:`~pydantic_views.annotations.KeyedBy`) are diffed too, so they hold only their own
+        changes. Values are compared by identity before falling back to equality. Fields not exposed
+        by the view are ignored.
+
+        :param orig: Model instance used as the base.
+        :param new: Model instance holding the target values.
+        :returns: View holding the differences, with no fields set when there are none.
+        :raises ValueError: When a difference can not be expressed as a view to be applied, like a
+                            removed mapping entry or a removed or reordered keyed list element.
+        """
+        diff = _diff(diff_plan(cls), orig, new)
+        return cast(Self, diff if diff is not None else cls.model_construct(_fields_set=set()))
+
+
+def _json_encoder[T: BaseModel](
+    view_cls: type[View[T]], *, by_alias: bool | None, exclude_none: bool
+) -> Callable[[T], bytes]:
+    plan = dump_plan(view_cls)
+    root = view_cls.view_class_root()
+    build_from = build_from_plan(view_cls)
+
+    def encode(model: T) -> bytes:
+        if plan.include is None or type(model) is not root:
+            view = build_from(model)
+            return view.__pydantic_serializer__.to_json(view, by_alias=by_alias, exclude_none=exclude_none)
+
+        return model.__pydantic_serializer__.to_json(
+            model,
+            include=plan.include,
+            by_alias=by_alias,
+            exclude_unset=plan.exclude_unset,
+            exclude_none=exclude_none,
+        )
+
+    return encode
+
+
+def _is_trusted(cls: type[BaseModel], trusted: bool | None) -> bool:
+    if trusted is None:
+        return getattr(cls, "__view_trusted__", False)
+    return trusted
+
+
+def _build_to_data(view_cls: type[View[Any]], views: Iterable[View[Any]]) -> list[Any]:
+    plan = build_to_plan(view_cls)
+    if plan.steps is None:
+        return list_adapter(view_cls).dump_python(list(views), exclude_unset=True, exclude_defaults=True, by_alias=True)
+    return [plan.data(v) for v in views]
 
 
 class RootView[R](RootModel[R], View[RootModel[R]]):  # type: ignore
@@ -74,53 +662,427 @@ class RootView[R](RootModel[R], View[RootModel[R]]):  # type: ignore
     pass
 
 
-def model_apply[T: BaseModel](orig: T, view: View[T] | T) -> T:
+def model_apply[T: BaseModel](
+    orig: T, view: View[T] | T, *, copy_on_write: bool = False, trusted: bool | None = None
+) -> T:
     """
     Return a copy of ``orig`` updated with fields set on ``view`` (model or view).
 
+    By default the result is a deep copy. In copy-on-write mode only the path from the root to
+    each changed field is copied: untouched nested models, lists and dicts are shared between
+    ``orig`` and the result, so neither of them should be mutated in place afterwards.
+
+    The apply plan of the model and view classes is compiled once: values already validated by
+    the view are used as is and the other changed fields are validated together, so the cost
+    depends on the number of fields set on ``view``, not on the width of the model.
+
+    Nested models and mappings are merged without recursion, so the depth of the merged values is
+    not bounded by the interpreter recursion limit (the final deep copy still is). Nested values
+    identical to the original ones, and branches left unchanged by the merge, are reused as is.
+
+    In trusted mode the merged values are used as they are: no field, assignment or model
+    validator runs, and nested views are constructed into their models (see
+    :meth:`View.view_build_to`). Only use it for views validated already, as inside a service
+    boundary.
+
     :param orig: Original model instance to update.
     :param view: View or model supplying updated values.
+    :param copy_on_write: Share untouched values with ``orig`` instead of deep copying them.
+    :param trusted: Merge without validation. Defaults to the ``__view_trusted__`` flag of the
+                    view class.
     :returns: New model instance with merged data.
     """
 
-    update_data: dict[str, Any] = {}
+    trusted = _is_trusted(type(view), trusted)
+    result = _run_merge(_apply_task(apply_plan(type(orig), type(view)), orig, view, trusted=trusted), trusted=trusted)
+    if copy_on_write:
+        return result
 
-    for field in view.model_fields_set:
-        value = _merge_values(
-            getattr(orig, field),
-            getattr(view, field),
-        )
-        update_data[field] = getattr(orig.__pydantic_validator__.validate_assignment(orig, field, value), field)
-    return orig.model_copy(
-        update=update_data,
-        deep=True,
-    )
+    return result.model_copy(deep=True)
 
 
-@overload
-def _merge_values[T: BaseModel](orig_value: None, new_value: T) -> T | dict[str, Any]: ...
+class ApplyResult[K, T: BaseModel](NamedTuple):
+    """Outcome of applying one view with :func:`model_apply_many`."""
+
+    #: Item key: the mapping key, or the item position.
+    key: K
+
+    #: New model instance, or ``None`` when the view could not be applied.
+    model: T | None
+
+    #: Validation error raised while applying the view, or ``None``.
+    error: ValidationError | None
 
 
 @overload
-def _merge_values[A](orig_value: None, new_value: A) -> A: ...
+def model_apply_many[K, T: BaseModel](  # type: ignore
+    items: Mapping[K, tuple[T, View[T] | T]], *, copy_on_write: bool = False, trusted: bool | None = None
+) -> Iterator[ApplyResult[K, T]]: ...
 
 
 @overload
-def _merge_values[T: BaseModel](orig_value: T, new_value: View[T]) -> T | dict[str, Any]: ...
+def model_apply_many[T: BaseModel](
+    items: Iterable[tuple[T, View[T] | T]], *, copy_on_write: bool = False, trusted: bool | None = None
+) -> Iterator[ApplyResult[int, T]]: ...
+
+
+def model_apply_many[K, T: BaseModel](
+    items: Mapping[K, tuple[T, View[T] | T]] | Iterable[tuple[T, View[T] | T]],
+    *,
+    copy_on_write: bool = False,
+    trusted: bool | None = None,
+) -> Iterator[ApplyResult[Any, T]]:
+    """
+    Lazily apply many views (or models) to many model instances.
+
+    Items are ``(model, view)`` pairs, or a mapping of keys to pairs. The apply plan of each pair
+    of classes is looked up once for the whole batch, and items are applied one by one as the
+    iterator is consumed, so memory usage is bounded whatever the number of items. A view that
+    cannot be applied does not abort the batch: its result holds the validation error instead of
+    a model.
+
+    :param items: ``(model, view)`` pairs, or mapping of keys to ``(model, view)`` pairs.
+    :param copy_on_write: Share untouched values with the original models (see :func:`model_apply`).
+    :param trusted: Merge without validation (see :func:`model_apply`). Defaults to the
+                    ``__view_trusted__`` flag of each view class.
+    :returns: Iterator of results keyed by mapping key or by item position, in the same order.
+    """
+    pairs: Iterable[tuple[Any, tuple[T, View[T] | T]]] = (
+        items.items() if isinstance(items, Mapping) else enumerate(items)
+    )
+    plans: dict[tuple[type[BaseModel], type[BaseModel]], ApplyPlan] = {}
+    for key, (orig, view) in pairs:
+        classes = (type(orig), type(view))
+        try:
+            plan = plans[classes]
+        except KeyError:
+            plan = plans[classes] = apply_plan(*classes)
 
+        trusted_item = _is_trusted(classes[1], trusted)
+        try:
+            result = _run_merge(_apply_task(plan, orig, view, trusted=trusted_item), trusted=trusted_item)
+        except ValidationError as ex:
+            yield ApplyResult(key, None, ex)
+            continue
+
+        yield ApplyResult(key, result if copy_on_write else result.model_copy(deep=True), None)
+
+
+#: Merge task: a generator yielding ``(orig_value, new_value)`` pairs to merge, receiving each merged
+#: value back, and returning its own merged value.
+type MergeTask = Generator[tuple[Any, Any], Any, Any]
+
+
+def _run_merge(task: MergeTask, *, trusted: bool = False) -> Any:
+    """
+    Run a merge task to completion using an explicit stack.
+
+    Nested models and mappings are merged by child tasks pushed on the stack instead of recursive
+    calls, so the depth of the merged values is not bounded by the interpreter recursion limit.
+    """
+    stack = [task]
+    value: Any = None
+    while True:
+        try:
+            orig_value, new_value = stack[-1].send(value)
+        except StopIteration as stop:
+            stack.pop()
+            if not stack:
+                return stop.value
+            value = stop.value
+            continue
+
+        value, child = _merge_step(orig_value, new_value, trusted)
+        if child is not None:
+            stack.append(child)
+
+
+def _merge_step(orig_value: Any, new_value: Any, trusted: bool) -> tuple[Any, MergeTask | None]:
+    if new_value is orig_value:
+        return orig_value, None
 
-def _merge_values[T: BaseModel, A](orig_value: T | None, new_value: View[T] | A) -> T | A | dict[str, Any]:
     if isinstance(new_value, BaseModel):
         if isinstance(orig_value, BaseModel):
-            return cast(T, model_apply(orig_value, new_value))
+            plan = apply_plan(type(orig_value), type(new_value))
+            return None, _apply_task(plan, orig_value, new_value, nested=True, trusted=trusted)
         if isinstance(new_value, View):
-            return cast(View[T], new_value).view_build_to()
-        return new_value.model_dump(exclude_unset=True, exclude_defaults=True, by_alias=True)
-    elif isinstance(new_value, Mapping) and isinstance(orig_value, Mapping):
-        data: dict[str, Any] = dict(cast(Mapping[str, Any], orig_value))
-        for k, v in cast(Mapping[str, Any], new_value).items():
-            data[k] = _merge_values(data.get(k), v)
-
-        return cast(T, cast(Mapping[str, Any], orig_value).__class__(**data))
+            return new_value.view_build_to(trusted=trusted), None
+        if trusted:
+            return new_value, None
+        return new_value.model_dump(exclude_unset=True, exclude_defaults=True, by_alias=True), None
+
+    if isinstance(new_value, Mapping) and isinstance(orig_value, Mapping):
+        return None, _merge_mapping_task(orig_value, new_value)
+
+    if type(new_value) in (list, tuple) and any(isinstance(v, View) for v in new_value):
+        # Replaced sequences of views hold the models built from them.
+        return type(new_value)(v.view_build_to(trusted=trusted) if isinstance(v, View) else v for v in new_value), None
+
+    return new_value, None
+
+
+def _apply_task[T: BaseModel](
+    plan: ApplyPlan, orig: T, view: BaseModel, *, nested: bool = False, trusted: bool = False
+) -> MergeTask:
+    steps = plan.steps
+    orig_values = orig.__dict__
+    orig_fields_set = orig.__pydantic_fields_set__
+    view_values = view.__dict__
+
+    update: dict[str, Any] = {}
+    batched_values: dict[str, Any] = {}
+    assigned: dict[str, Any] = {}
+    for field in view.model_fields_set:
+        step = steps.get(field)
+        if step is None:
+            value = yield getattr(orig, field), getattr(view, field)
+            if trusted and field in orig_values:
+                update[field] = value
+            else:
+                assigned[field] = value
+            continue
+
+        value = view_values[field]
+        if step.validation == ENTRIES:
+            current = orig_values.get(field)
+            if isinstance(current, Mapping) and isinstance(value, Mapping):
+                changes = yield from _mapping_changes(current, value)
+                if changes:
+                    if not trusted:
+                        changes = cast(SchemaValidator, step.entries).validate_python({field: changes})[field]
+                    update[field] = _mapping_update(current, changes)
+                elif field not in orig_fields_set:
+                    update[field] = current
+                continue
+
+        if step.kind == APPLY_KEYED and isinstance(value, list):
+            current = orig_values.get(field)
+            if isinstance(current, list):
+                value = yield from _merge_keyed_list(current, value, cast(str, step.key), trusted)
+            else:
+                value = yield current, value
+        elif step.kind != APPLY_VALUE:
+            value = yield orig_values.get(field), value
+
+        if value is orig_values.get(field) and field in orig_fields_set:
+            continue
+
+        if trusted or step.validation == TRUSTED:
+            update[field] = value
+        elif step.validation in (BATCHED, ENTRIES):
+            batched_values[field] = value
+        else:
+            assigned[field] = value
+
+    if nested and not (update or batched_values or assigned):
+        return orig
+
+    if batched_values:
+        update.update(cast(SchemaValidator, plan.patch).validate_python(batched_values))
+
+    return _apply_finish(orig, update, assigned)
+
+
+def _merge_mapping_task(orig_value: Mapping[Any, Any], new_value: Mapping[Any, Any]) -> MergeTask:
+    changes = yield from _mapping_changes(orig_value, new_value)
+    if not changes:
+        return orig_value
+
+    return _mapping_update(orig_value, changes)
+
+
+def _mapping_changes(orig_value: Mapping[Any, Any], new_value: Mapping[Any, Any]) -> MergeTask:
+    changes: dict[Any, Any] = {}
+    for k, v in new_value.items():
+        current = orig_value.get(k)
+        merged = yield current, v
+        if merged is not current or k not in orig_value:
+            changes[k] = merged
+
+    return changes
+
+
+def _merge_keyed_list(orig_value: list[Any], new_value: list[Any], key: str, trusted: bool) -> MergeTask:
+    index: dict[Any, int] = {}
+    for i, element in enumerate(orig_value):
+        if isinstance(element, BaseModel):
+            index.setdefault(element.__dict__.get(key), i)
+
+    result: list[Any] | None = None
+    appended: list[Any] = []
+    for element in new_value:
+        if not isinstance(element, BaseModel):
+            appended.append(element)
+            continue
+
+        position = index.get(element.__dict__.get(key, MISSING))
+        if position is None:
+            appended.append(element.view_build_to(trusted=trusted) if isinstance(element, View) else element)
+            continue
+
+        current = orig_value[position]
+        merged = yield current, element
+        if merged is not current:
+            if result is None:
+                result = list(orig_value)
+            result[position] = merged
+
+    if appended:
+        return [*(result if result is not None else orig_value), *appended]
+
+    return result if result is not None else orig_value
+
+
+def _diff(plan: DiffPlan, orig: BaseModel, new: BaseModel) -> View[Any] | None:
+    if orig is new:
+        return None
+
+    orig_values = orig.__dict__
+    new_values = new.__dict__
+    values: dict[str, Any] = {}
+    for step in plan.steps:
+        orig_value = orig_values.get(step.name, MISSING)
+        new_value = new_values.get(step.name, MISSING)
+        if new_value is orig_value:
+            continue
+
+        if step.key is not None and isinstance(orig_value, list) and isinstance(new_value, list):
+            value = _diff_keyed_list(step.nested, orig_value, new_value, step.key)
+        else:
+            value = _diff_value(step.nested, step.convert, orig_value, new_value)
+
+        if value is not MISSING:
+            values[step.name] = value
+
+    if not values:
+        return None
+
+    return plan.view.model_construct(_fields_set=set(values), **values)
+
+
+def _diff_value(
+    nested: type[View[Any]] | None, convert: Callable[[Any], Any] | None, orig_value: Any, new_value: Any
+) -> Any:
+    if new_value is orig_value:
+        return MISSING
+
+    if (
+        nested is not None
+        and isinstance(orig_value, BaseModel)
+        and type(orig_value) is type(new_value)
+        and isinstance(orig_value, nested.view_class_root())
+    ):
+        diff = _diff(diff_plan(nested), orig_value, new_value)
+        return diff if diff is not None else MISSING
+
+    if isinstance(orig_value, Mapping) and isinstance(new_value, Mapping):
+        if not orig_value.keys() <= new_value.keys():
+            raise ValueError("Removed mapping entries can not be applied")
+
+        changes: dict[Any, Any] = {}
+        for k, v in new_value.items():
+            if k not in orig_value:
+                changes[k] = _view_of(nested, v)
+                continue
+
+            change = _diff_value(nested, None, orig_value[k], v)
+            if change is not MISSING:
+                changes[k] = change
+        # Keep the container type of the field, so the diff view dumps like the model.
+        return _mapping_build(new_value, changes) if changes else MISSING
+
+    if new_value == orig_value:
+        return MISSING
+
+    return convert(new_value) if convert is not None else new_value
+
+
+def _diff_keyed_list(
+    nested: type[View[Any]] | None, orig_value: list[Any], new_value: list[Any], key: str
+) -> list[Any] | Any:
+    if len(new_value) < len(orig_value) or any(
+        not isinstance(o, BaseModel) or not isinstance(n, BaseModel) or o.__dict__.get(key) != n.__dict__.get(key)
+        for o, n in zip(orig_value, new_value, strict=False)
+    ):
+        raise ValueError("Removed or reordered keyed list elements can not be applied")
+
+    changes: list[Any] = []
+    for o, n in zip(orig_value, new_value, strict=False):
+        change = _diff_value(nested, None, o, n)
+        if change is MISSING:
+            continue
+        if isinstance(change, View) and change is not n and key not in change.model_fields_set:
+            # Elements are matched by key, so it must be set on changed elements.
+            change.__dict__[key] = n.__dict__[key]
+            change.__pydantic_fields_set__.add(key)
+        changes.append(change)
+
+    changes.extend(_view_of(nested, n) for n in new_value[len(orig_value) :])
+    return changes if changes else MISSING
+
+
+def _view_of(nested: type[View[Any]] | None, value: Any) -> Any:
+    if nested is not None and isinstance(value, nested.view_class_root()):
+        return build_from_plan(nested)(value)
+    return value
+
+
+type MappingConstructor = Callable[[Mapping[Any, Any], dict[Any, Any]], Mapping[Any, Any]]
+
+_mapping_constructors: dict[type[Mapping[Any, Any]], MappingConstructor] = {
+    dict: lambda orig, data: data,
+    defaultdict: lambda orig, data: defaultdict(cast(defaultdict[Any, Any], orig).default_factory, data),
+}
+
+
+def register_mapping_type(cls: type[Mapping[Any, Any]], constructor: MappingConstructor):
+    """
+    Register how merged mappings of a concrete type are built when applying views.
+
+    Mapping types not registered are built calling ``cls(data)``.
+
+    :param cls: Concrete mapping type.
+    :param constructor: Callable receiving the original mapping and a ``dict`` with the merged
+                        entries, and returning the merged mapping of type ``cls``.
+    """
+    _mapping_constructors[cls] = constructor
+
+
+def _mapping_update[M: Mapping[Any, Any]](orig: M, changes: Mapping[Any, Any]) -> M:
+    data = dict(orig)
+    data.update(changes)
+    return _mapping_build(orig, data)
+
+
+def _mapping_build[M: Mapping[Any, Any]](orig: M, data: dict[Any, Any]) -> M:
+    cls = type(orig)
+    try:
+        constructor = _mapping_constructors[cls]
+    except KeyError:
+        return cast(M, cls(data))  # type: ignore
+    return cast(M, constructor(orig, data))
+
+
+def _apply_finish[T: BaseModel](orig: T, update: dict[str, Any], assigned: dict[str, Any]) -> T:
+    if update:
+        # Same as ``orig.model_copy(update=update)``, knowing ``update`` only holds model fields.
+        cls = type(orig)
+        result = cls.__new__(cls)
+        object.__setattr__(result, "__dict__", {**orig.__dict__, **update})
+        object.__setattr__(result, "__pydantic_fields_set__", orig.__pydantic_fields_set__ | update.keys())
+        extra = orig.__pydantic_extra__
+        object.__setattr__(result, "__pydantic_extra__", dict(extra) if extra is not None else None)
+        private = getattr(orig, "__pydantic_private__", None)
+        object.__setattr__(
+            result,
+            "__pydantic_private__",
+            {k: v for k, v in private.items() if v is not PydanticUndefined} if private is not None else None,
+        )
     else:
-        return cast(T, new_value)
+        result = orig.model_copy()
+
+    validator = orig.__pydantic_validator__
+    for field, value in assigned.items():
+        validator.validate_assignment(result, field, value)
+
+    return result
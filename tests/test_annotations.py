@@ -1,5 +1,6 @@
 import pytest
 
+from pydantic_views.annotations import AccessMode
 from pydantic_views.metaclass import AccessTag
 
 
@@ -52,3 +53,15 @@ def test_access_tag_equality():
     assert tag1a == tag1b
     assert tag1a != tag2
     assert tag1b != tag2
+
+
+def test_access_mode_mask():
+    bits = [mode.bit for mode in AccessMode]
+
+    assert len(set(bits)) == len(bits)
+    assert all(bit and not bit & (bit - 1) for bit in bits)
+
+    assert AccessMode.mask(()) == 0
+    assert (
+        AccessMode.mask((AccessMode.READ_ONLY, AccessMode.HIDDEN)) == AccessMode.READ_ONLY.bit | AccessMode.HIDDEN.bit
+    )
@@ -1,17 +1,21 @@
 import contextlib
+import sys
+import types
 from collections.abc import Callable, Mapping
 from itertools import chain, combinations
 from types import NoneType, UnionType
-from typing import Any, Literal, get_args, get_origin  # type: ignore
+from typing import Annotated, Any, Literal, get_args, get_origin  # type: ignore
 
 import pytest
-from pydantic import BaseModel, Field, RootModel, computed_field
+from pydantic import BaseModel, Field, RootModel, computed_field, create_model
 from pydantic_core import MISSING, PydanticUndefined
 
-from pydantic_views import RootView
+import pydantic_views
+from pydantic_views import FieldAccess, RootView
 from pydantic_views.annotations import (
     AccessMode,
     Hidden,
+    KeyedBy,
     ReadAndWrite,
     ReadOnly,
     ReadOnlyOnCreation,
@@ -24,6 +28,9 @@ from pydantic_views.builder import (
     BuilderCreateResult,
     BuilderLoad,
     BuilderUpdate,
+    CreatePreset,
+    UpdatePreset,
+    build_views,
     ensure_model_views,
 )
 from pydantic_views.view import View
@@ -118,6 +125,20 @@ class ModelInnerCircular(BaseModel):
 ModelCircular.model_rebuild()
 ModelInnerCircular.model_rebuild()
 
+
+class DeferredLine(BaseModel):
+    id: ReadOnly[int] = 0
+    sku: str
+    bundles: list["DeferredOrder"] = Field(default_factory=list)
+
+
+class DeferredOrder(BaseModel):
+    id: ReadOnly[int] = 0
+    lines: list[DeferredLine] = Field(default_factory=list)
+
+
+DeferredLine.model_rebuild()
+
 _groups = [
     (
         "ReadOnly",
@@ -259,6 +280,10 @@ def reset_model_views():
         del DictRootModel.model_views  # type: ignore
     with contextlib.suppress(AttributeError):
         del ModelCircular.model_views  # type: ignore
+    with contextlib.suppress(AttributeError):
+        del DeferredOrder.model_views  # type: ignore
+    with contextlib.suppress(AttributeError):
+        del DeferredLine.model_views  # type: ignore
     yield
 
 
@@ -769,3 +794,229 @@ def test_standard_builders(builder: Callable[[], Builder], view_name: str, expec
 
     assert ensure_model_views(Model)[view_name] == view
     assert set(view.model_fields.keys()) == expected_fields
+
+
+class Line(BaseModel):
+    id: ReadOnly[int] = 0
+    sku: str
+    children: list["Line"] = Field(default_factory=list)
+
+
+class Invoice(BaseModel):
+    lines: Annotated[list[Line], KeyedBy("id")] = Field(default_factory=list)
+    by_sku: Annotated[list[Line], KeyedBy("sku")] = Field(default_factory=list)
+
+
+def test_keyed_list_element_view():
+    view = BuilderUpdate().build_view(Invoice)
+
+    line_update = ensure_model_views(Line)["Update"]
+    line_update_by_id = ensure_model_views(Line)["UpdateById"]
+    assert view.model_fields["lines"].annotation == list[line_update_by_id]  # type: ignore
+    assert view.model_fields["by_sku"].annotation == list[line_update]  # type: ignore
+    assert set(line_update_by_id.model_fields.keys()) == {"id", "sku", "children"}
+    assert set(line_update.model_fields.keys()) == {"sku", "children"}
+    assert line_update_by_id.model_fields["children"].annotation == list[line_update]  # type: ignore
+
+
+def test_recurrent_view_rebuilt_once_complete(monkeypatch: pytest.MonkeyPatch):
+    builder = Builder("PendingRebuild", access_modes=(AccessMode.READ_AND_WRITE,))
+
+    rebuilt: list[type[BaseModel]] = []
+    model_rebuild = BaseModel.model_rebuild.__func__  # type: ignore
+
+    def spy(cls: type[BaseModel], **kwargs: Any):
+        if cls.__name__.endswith("PendingRebuild"):
+            rebuilt.append(cls)
+        return model_rebuild(cls, **kwargs)
+
+    monkeypatch.setattr(BaseModel, "model_rebuild", classmethod(spy))
+
+    view_cls = builder.build_view(ModelCircular)
+    inner_view_cls = ModelInnerCircular.model_views["PendingRebuild"]  # type: ignore
+
+    assert rebuilt == [inner_view_cls]
+    assert not builder._pending.views
+    assert view_cls.__pydantic_complete__
+    assert inner_view_cls.__pydantic_complete__
+
+    assert builder.build_view(ModelInnerCircular) is inner_view_cls
+    assert rebuilt == [inner_view_cls]
+
+
+def test_defer_view():
+    builder = BuilderCreate()
+
+    builder.defer_view(DeferredOrder)
+    builder.defer_view(DeferredLine)
+
+    module = sys.modules[__name__]
+    assert "DeferredOrderCreate" not in vars(module)
+    assert "DeferredLineCreate" not in vars(module)
+
+    view_cls = DeferredOrder.model_views["Create"]  # type: ignore
+
+    assert view_cls.__name__ == "DeferredOrderCreate"
+    assert vars(module)["DeferredOrderCreate"] is view_cls
+    assert vars(module)["DeferredLineCreate"] is DeferredLine.model_views["Create"]  # type: ignore
+    assert module.DeferredLineCreate.model_fields["bundles"].annotation == list[view_cls]  # type: ignore
+    assert view_cls.__pydantic_complete__
+    assert module.DeferredLineCreate.__pydantic_complete__  # type: ignore
+
+    assert builder.build_view(DeferredOrder) is view_cls
+    view_cls.model_validate({"lines": [{"sku": "a", "bundles": [{"lines": []}]}]})
+
+
+def test_defer_view_module_attribute():
+    builder = Builder("Deferred", access_modes=(AccessMode.READ_AND_WRITE,))
+
+    builder.defer_view(DeferredLine)
+
+    module = sys.modules[__name__]
+    assert "DeferredLineDeferred" not in vars(module)
+
+    view_cls = module.DeferredLineDeferred  # type: ignore
+
+    assert view_cls is DeferredLine.model_views["Deferred"]  # type: ignore
+    assert vars(module)["DeferredLineDeferred"] is view_cls
+    assert set(view_cls.model_fields) == {"sku", "bundles"}
+
+    with pytest.raises(AttributeError, match="DeferredUnknown"):
+        module.DeferredUnknown  # type: ignore  # noqa: B018
+
+
+def test_defer_view_already_built():
+    builder = Builder("DeferredBuilt", access_modes=(AccessMode.READ_AND_WRITE,))
+
+    view_cls = builder.build_view(DeferredOrder)
+    builder.defer_view(DeferredOrder)
+
+    assert DeferredOrder.model_views["DeferredBuilt"] is view_cls  # type: ignore
+    assert sys.modules[__name__].DeferredOrderDeferredBuilt is view_cls  # type: ignore
+
+
+def test_defer_build():
+    builder = Builder("DeferBuild", access_modes=(AccessMode.READ_AND_WRITE,), defer_build=True)
+
+    view_cls = builder.build_view(ModelCircular)
+    inner_view_cls = ModelInnerCircular.model_views["DeferBuild"]  # type: ignore
+
+    assert view_cls.model_config.get("defer_build")
+    assert not view_cls.__pydantic_complete__
+    assert not inner_view_cls.__pydantic_complete__
+    assert not builder._pending.views
+
+    builder.warm(ModelCircular)
+
+    assert view_cls.__pydantic_complete__
+    assert not inner_view_cls.__pydantic_complete__
+
+    builder.warm()
+
+    assert inner_view_cls.__pydantic_complete__
+
+
+def test_defer_build_first_use():
+    builder = Builder("DeferBuildUse", access_modes=(AccessMode.READ_AND_WRITE,), defer_build=True)
+
+    view_cls = builder.build_view(DeferredOrder)
+
+    assert not view_cls.__pydantic_complete__
+
+    view = view_cls.model_validate({"lines": [{"sku": "a", "bundles": [{}]}]})
+
+    assert view_cls.__pydantic_complete__
+    assert view.model_dump() == {"lines": [{"sku": "a", "bundles": [{"lines": []}]}]}
+
+
+def test_defer_build_class_keyword():
+    class DeferredOrderDeferBuildClass(
+        View[DeferredOrder],
+        view_name="DeferBuildClass",
+        access_modes=(AccessMode.READ_AND_WRITE,),
+        defer_build=True,
+    ):
+        pass
+
+    assert not DeferredOrderDeferBuildClass.__pydantic_complete__
+    assert not DeferredLine.model_views["DeferBuildClass"].__pydantic_complete__  # type: ignore
+
+    assert DeferredOrderDeferBuildClass(lines=[{"sku": "a"}]).lines[0].sku == "a"  # type: ignore
+
+
+def test_build_views():
+    presets = (CreatePreset._replace(view_name="FusedCreate"), UpdatePreset._replace(view_name="FusedUpdate"))
+
+    views = build_views([DeferredOrder, DeferredLine], presets)
+
+    assert views == {
+        DeferredOrder: {
+            "FusedCreate": DeferredOrder.model_views["FusedCreate"],  # type: ignore
+            "FusedUpdate": DeferredOrder.model_views["FusedUpdate"],  # type: ignore
+        },
+        DeferredLine: {
+            "FusedCreate": DeferredLine.model_views["FusedCreate"],  # type: ignore
+            "FusedUpdate": DeferredLine.model_views["FusedUpdate"],  # type: ignore
+        },
+    }
+    assert all(view.__pydantic_complete__ for model_views in views.values() for view in model_views.values())
+
+    order_update = views[DeferredOrder]["FusedUpdate"]
+    line_update = views[DeferredLine]["FusedUpdate"]
+    assert set(order_update.model_fields) == {"lines"}
+    assert order_update.model_fields["lines"].annotation == list[line_update]
+    assert line_update.model_fields["bundles"].annotation == list[order_update]
+    assert order_update.model_validate({}).lines is MISSING
+
+    assert build_views(DeferredOrder, presets) == {DeferredOrder: views[DeferredOrder]}
+
+
+def test_build_views_module():
+    module = types.ModuleType("fused_models")
+    sys.modules[module.__name__] = module
+    try:
+        module.Item = create_model("Item", __module__=module.__name__, id=(ReadOnly[int], 0), name=(str, ...))  # type: ignore
+        module.Basket = create_model("Basket", __module__=module.__name__, items=(list[module.Item], ...))  # type: ignore
+        module.Model = Model  # type: ignore
+
+        views = build_views(module)
+
+        assert set(views) == {module.Item, module.Basket}  # type: ignore
+        assert set(views[module.Item]) == {"Create", "CreateResult", "Update", "Load"}  # type: ignore
+        assert module.BasketLoad is views[module.Basket]["Load"]  # type: ignore
+        assert set(module.ItemCreate.model_fields) == {"name"}  # type: ignore
+        assert set(module.ItemLoad.model_fields) == {"id", "name"}  # type: ignore
+    finally:
+        del sys.modules[module.__name__]
+
+
+def test_field_access():
+    manager = ensure_model_views(Model)
+    field_access = manager.field_access
+
+    assert field_access["field_int"] == FieldAccess(modes=0, tags=frozenset())
+    assert field_access["read_only_field_int"] == FieldAccess(modes=AccessMode.READ_ONLY.bit, tags=frozenset())
+    assert set(field_access) == set(Model.model_fields)
+    assert manager.field_access is field_access
+
+    with pytest.raises(TypeError):
+        field_access["field_int"] = FieldAccess(modes=0, tags=frozenset())  # type: ignore
+
+
+@pytest.mark.parametrize(
+    ("builder", "view_name"),
+    [
+        (BuilderCreate, "Create"),
+        (BuilderCreateResult, "CreateResult"),
+        (BuilderUpdate, "Update"),
+        (BuilderLoad, "Load"),
+    ],
+)
+def test_visible_fields(builder: Callable[[], Builder], view_name: str):
+    manager = ensure_model_views(Model)
+
+    visible = manager.visible_fields(builder())
+
+    assert view_name not in manager._views
+    assert visible == tuple(builder().build_view(Model).model_fields)
+    assert manager.visible_fields(getattr(pydantic_views, f"{view_name}Preset")) == visible
@@ -0,0 +1,74 @@
+import io
+import json
+
+import pytest
+
+from pydantic_views.streams import JsonChunker, iter_json_array, iter_ndjson
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 1 << 16])
+def test_iter_json_array(chunk_size: int):
+    data = [{"a,]": 'x\\"', "b": ",]}"}, [1, [2, {}]], 12345, "ü€", None, [], {}]
+    raw = json.dumps(data, ensure_ascii=False, indent=2).encode()
+
+    assert [json.loads(e) for e in iter_json_array(io.BytesIO(raw), chunk_size=chunk_size)] == data
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 16])
+def test_iter_json_array_long_elements(chunk_size: int):
+    # Elements deeper than the single call pattern, and strings longer than the chunks.
+    data = [{"a": [[["x" * 100, {"b": '\\"]' * 50}]]]}, "y" * 300, [[[[]]]], {"c": 1}]
+    raw = json.dumps(data).encode()
+
+    assert [json.loads(e) for e in iter_json_array(io.BytesIO(raw), chunk_size=chunk_size)] == data
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1 << 16])
+def test_iter_json_array_malformed_elements(chunk_size: int):
+    raw = b'[1, , {"a" 1}, {"b": 2}}, tru, 3 4]'
+
+    assert list(iter_json_array(io.BytesIO(raw), chunk_size=chunk_size)) == [
+        "1",
+        "",
+        '{"a" 1}',
+        '{"b": 2}}',
+        "tru",
+        "3 4",
+    ]
+
+
+@pytest.mark.parametrize("raw", [b"", b"{}", b"x[1]", b"[1]x", b"[1", b"[1] [2]", b'["a', b'[{"a": [1,'])
+def test_iter_json_array_not_an_array(raw: bytes):
+    with pytest.raises(ValueError):
+        list(iter_json_array(io.BytesIO(raw), chunk_size=2))
+
+
+def test_iter_json_array_empty():
+    assert list(iter_json_array(io.BytesIO(b" [ ] \n"))) == []
+
+
+def test_iter_ndjson():
+    raw = b'{"a": 1}\n\n  {"b": 2}  \r\n{"c"'
+
+    assert list(iter_ndjson(io.BytesIO(raw))) == [b'{"a": 1}', b'{"b": 2}', b'{"c"']
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 1 << 16])
+def test_json_chunker(chunk_size: int):
+    records = [b'{"a":1}', b"[2]", b'"x"']
+
+    chunker = JsonChunker(chunk_size=chunk_size)
+    chunks = [c for c in map(chunker.add, records) if c is not None]
+    chunks.append(chunker.close())
+    assert json.loads(b"".join(chunks)) == [{"a": 1}, [2], "x"]
+    assert all(len(c) >= chunk_size for c in chunks[:-1])
+
+    chunker = JsonChunker(ndjson=True, chunk_size=chunk_size)
+    chunks = [c for c in map(chunker.add, records) if c is not None]
+    chunks.append(chunker.close())
+    assert b"".join(chunks) == b'{"a":1}\n[2]\n"x"\n'
+
+
+def test_json_chunker_empty():
+    assert JsonChunker().close() == b"[]"
+    assert JsonChunker(ndjson=True).close() == b""
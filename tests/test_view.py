@@ -1,13 +1,39 @@
-from collections.abc import Callable
-from typing import Self, cast
+import asyncio
+import io
+import json
+import mmap
+import sys
+import warnings
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable, Mapping
+from typing import Annotated, Any, Self, cast
 
 import pytest
-from pydantic import BaseModel, Field
+from pydantic import (
+    BaseModel,
+    Field,
+    RootModel,
+    ValidationError,
+    computed_field,
+    field_serializer,
+    field_validator,
+    model_validator,
+)
 from pydantic.alias_generators import to_camel
 
-from pydantic_views.annotations import WriteOnly
-from pydantic_views.builder import BuilderLoad, BuilderUpdate, ensure_model_views
-from pydantic_views.view import View, model_apply
+from pydantic_views.annotations import AccessMode, KeyedBy, ReadOnly, WriteOnly
+from pydantic_views.builder import Builder, BuilderCreate, BuilderLoad, BuilderUpdate, ensure_model_views
+from pydantic_views.plans import (
+    CONVERT_COPY,
+    CONVERT_PROJECT,
+    CONVERT_VALIDATE,
+    AdapterCache,
+    convert_plan,
+    dump_plan,
+    json_to_model_plan,
+    row_plan,
+)
+from pydantic_views.view import View, model_apply, model_apply_many, register_mapping_type
 
 
 class Model(BaseModel):
@@ -151,3 +177,1100 @@ def test_no_view[T: Model](model_cls: type[T], alias_gen: Callable[[str], str]):
     assert isinstance(new_model.field_dict["test2"], model_cls)
     assert new_model.field_dict["test2"].field_int == 9
     assert new_model.field_dict["test2"].field_str == "default str"
+
+
+class Item(BaseModel):
+    name: str
+    quantity: int = Field(default=1, alias="qty")
+    tags: list[str] = Field(default_factory=list)
+
+
+class Order(BaseModel):
+    id: ReadOnly[int] = 0
+    items: list[Item]
+    main_item: Item | None = None
+    by_name: dict[str, Item] = Field(default_factory=dict)
+    pair: tuple[Item, int] | None = None
+
+    @computed_field
+    def total(self) -> int:
+        return sum(i.quantity for i in self.items)
+
+
+class ItemList(RootModel[list[Item]]):
+    pass
+
+
+OrderCreate = BuilderCreate().build_view(Order)
+OrderLoad = BuilderLoad().build_view(Order)
+ItemListCreate = BuilderCreate().build_view(ItemList)
+
+
+def test_build_to_nested_views():
+    view = OrderCreate.model_validate(
+        {
+            "items": [{"name": "a", "qty": 2}, {"name": "b"}],
+            "main_item": {"name": "c", "qty": 1, "tags": []},
+            "by_name": {"d": {"name": "d", "tags": ["x"]}},
+            "pair": [{"name": "e"}, 3],
+        }
+    )
+
+    model = view.view_build_to()
+
+    assert isinstance(model, Order)
+    assert model.items == [Item(name="a", qty=2), Item(name="b")]
+    assert model.main_item is not None
+    assert model.main_item.model_fields_set == {"name"}
+    assert model.by_name["d"].tags == ["x"]
+    assert model.pair == (Item(name="e"), 3)
+    assert model.model_fields_set == {"items", "main_item", "by_name", "pair"}
+
+
+def test_build_to_skips_defaults():
+    model = OrderCreate(items=[], by_name={}).view_build_to()  # type: ignore
+
+    assert model.model_fields_set == {"items"}
+
+
+def test_build_to_ignores_computed_fields():
+    view = OrderLoad.view_build_from(Order(id=3, items=[Item(name="a", qty=4)]))
+
+    model = view.view_build_to()
+
+    assert model.id == 3
+    assert model.total == 4  # type: ignore
+
+
+def test_build_to_view_with_serializers():
+    class ItemShout(View[Item], view_name="Shout", access_modes=(AccessMode.READ_AND_WRITE,)):
+        @field_serializer("name")
+        def shout(self, value: str) -> str:
+            return value.upper()
+
+    view = ItemShout(name="hello")  # type: ignore
+
+    assert view.view_build_to().name == "HELLO"
+    assert view.view_build_to(trusted=True).name == "HELLO"
+
+
+def test_build_to_root_view():
+    view = ItemListCreate.model_validate([{"name": "a", "qty": 2}])
+
+    model = view.view_build_to()
+
+    assert isinstance(model, ItemList)
+    assert model.root == [Item(name="a", qty=2)]
+
+
+def test_build_from_projection():
+    order = Order(id=3, items=[Item(name="a", qty=4)], by_name={"b": Item(name="b", tags=["x"])})
+
+    view = OrderLoad.view_build_from(order)
+
+    assert view == OrderLoad.view_build_from(order, validate=True)
+    assert view.model_fields_set == {"id", "items", "by_name", "total"}
+    assert isinstance(view.items[0], ensure_model_views(Item)["Load"])  # type: ignore
+    assert view.items[0].model_fields_set == {"name", "quantity"}  # type: ignore
+    assert view.by_name["b"].tags == ["x"]  # type: ignore
+    assert view.total == 4  # type: ignore
+    assert view.main_item is None  # type: ignore
+
+
+def test_build_from_projection_shares_values():
+    order = Order(items=[Item(name="a", tags=["x"])])
+
+    view = OrderLoad.view_build_from(order)
+
+    # Projected views share the model values, like ``model_construct`` would.
+    assert view.items[0].tags is order.items[0].tags  # type: ignore
+    view.items[0].tags.append("y")  # type: ignore
+    assert order.items[0].tags == ["x", "y"]
+
+    assert OrderLoad.view_build_from(order, validate=True).items[0].tags is not order.items[0].tags  # type: ignore
+
+
+def test_build_from_projection_root_view():
+    items = ItemList([Item(name="a")])
+
+    view = BuilderLoad().build_view(ItemList).view_build_from(items)
+
+    assert view.root[0].name == "a"  # type: ignore
+    assert isinstance(view.root[0], ensure_model_views(Item)["Load"])  # type: ignore
+
+
+def test_build_from_view_with_validators():
+    class ItemUpper(View[Item], view_name="Upper", access_modes=(AccessMode.READ_AND_WRITE,)):
+        @field_validator("name")
+        @classmethod
+        def upper(cls, value: str) -> str:
+            return value.upper()
+
+    assert ItemUpper.view_build_from(Item(name="a")).name == "A"  # type: ignore
+
+
+def test_build_from_narrower_view():
+    order = Order(items=[Item(name="a")], main_item=Item(name="b"))
+    view = OrderCreate.view_build_from(order)
+
+    assert view == OrderCreate.view_build_from(order, validate=True)
+
+    with pytest.raises(ValidationError) as exc_info:
+        OrderCreate.view_build_from(Order(items=[], main_item=None))
+    assert exc_info.value.title == "OrderCreate"
+    assert [e["loc"] for e in exc_info.value.errors()] == [("main_item",)]
+
+    with pytest.raises(ValidationError):
+        OrderCreate.view_build_from(Order(items=[], main_item=None), validate=True)
+
+
+def test_build_from_tighter_view():
+    class ItemShort(View[Item], view_name="Short", access_modes=(AccessMode.READ_AND_WRITE,), str_max_length=2):
+        pass
+
+    assert ItemShort.view_build_from(Item(name="ab")).name == "ab"  # type: ignore
+    with pytest.raises(ValidationError):
+        ItemShort.view_build_from(Item(name="abc"))
+
+
+def test_build_from_missing_required():
+    with pytest.raises(ValidationError):
+        BuilderLoad().build_view(Item).view_build_from(Item.model_construct(qty=2))
+
+
+def test_build_from_many():
+    orders = [Order(id=i, items=[Item(name=str(i))]) for i in range(5)]
+
+    views = OrderLoad.view_build_from_many(orders)
+    validated = OrderLoad.view_build_from_many(orders, validate=True)
+
+    assert views == validated == [OrderLoad.view_build_from(o) for o in orders]
+    assert list(OrderLoad.view_build_from_iter(iter(orders), chunk_size=2)) == views
+
+
+def test_build_to_many():
+    views = [OrderCreate.model_validate({"items": [{"name": str(i), "qty": i}]}) for i in range(5)]
+
+    models = OrderCreate.view_build_to_many(views)
+
+    assert models == [v.view_build_to() for v in views]
+    assert list(OrderCreate.view_build_to_iter(iter(views), chunk_size=2)) == models
+
+
+def test_build_to_many_flat():
+    ItemCreate = ensure_model_views(Item)["Create"]
+    views = [ItemCreate.model_validate({"name": str(i), "qty": i}) for i in range(5)]
+
+    models = ItemCreate.view_build_to_many(views)  # type: ignore
+
+    assert models == [Item(name=str(i), qty=i) for i in range(5)]
+    assert [m.model_fields_set for m in models][:2] == [{"name", "quantity"}, {"name"}]
+
+
+def test_build_many_root_view():
+    lists = [ItemList([Item(name=str(i))]) for i in range(3)]
+    ItemListLoad = BuilderLoad().build_view(ItemList)
+
+    views = ItemListLoad.view_build_from_many(lists, validate=True)
+
+    assert [v.root[0].name for v in views] == ["0", "1", "2"]  # type: ignore
+    assert ItemListCreate.view_build_to_many([ItemListCreate.model_validate([{"name": "a"}])]) == [
+        ItemList([Item(name="a")])
+    ]
+
+
+def test_build_to_many_errors():
+    ItemCreate = ensure_model_views(Item)["Create"]
+
+    with pytest.raises(ValidationError) as exc_info:
+        ItemCreate.view_build_to_many([ItemCreate.model_construct(name="a"), ItemCreate.model_construct()])  # type: ignore
+
+    assert exc_info.value.errors()[0]["loc"] == (1, "name")
+
+
+def test_apply_does_not_mutate_original():
+    orig = Model(field_int=1, field_recurrent=Model(field_int=2))
+    update = ModelUpdate.model_validate({"field_int": 5, "field_recurrent": {"field_int": 6}})
+
+    for copy_on_write in (False, True):
+        new_model = update.view_apply_to(orig, copy_on_write=copy_on_write)  # type: ignore
+
+        assert new_model.field_int == 5
+        assert new_model.field_recurrent.field_int == 6  # type: ignore
+        assert orig.field_int == 1
+        assert orig.field_recurrent.field_int == 2  # type: ignore
+
+
+def test_apply_copy_on_write_shares_untouched_values():
+    orig = Model(
+        field_recurrent=Model(field_int=2, field_dict={"a": Model()}),
+        field_dict={"b": Model(field_int=3), "c": Model(field_int=4)},
+    )
+    update = ModelUpdate.model_validate({"field_recurrent": {"field_int": 7}, "field_dict": {"b": {"field_int": 8}}})
+
+    new_model = model_apply(orig, update, copy_on_write=True)  # type: ignore
+
+    assert new_model is not orig
+    assert new_model.field_recurrent is not orig.field_recurrent
+    assert new_model.field_recurrent.field_int == 7  # type: ignore
+    assert new_model.field_recurrent.field_dict is orig.field_recurrent.field_dict  # type: ignore
+    assert new_model.field_dict is not orig.field_dict
+    assert new_model.field_dict["b"].field_int == 8
+    assert new_model.field_dict["c"] is orig.field_dict["c"]
+    assert orig.field_dict["b"].field_int == 3
+
+    deep_model = model_apply(orig, update)  # type: ignore
+
+    assert deep_model == new_model
+    assert deep_model.field_dict["c"] is not orig.field_dict["c"]
+
+
+class Settings(BaseModel):
+    name: str = ""
+    level: int = Field(default=0, ge=0)
+    labels: dict[str, int] = Field(default_factory=dict, max_length=2)
+    code: str = Field(default="a", frozen=True)
+    slug: str = ""
+
+    @field_validator("slug")
+    @classmethod
+    def lower_slug(cls, value: str) -> str:
+        return value.lower()
+
+
+SettingsUpdate = BuilderUpdate().build_view(Settings)
+
+
+def test_apply_plan_validation():
+    orig = Settings(name="a", labels={"x": 1})
+
+    new_model = SettingsUpdate.model_validate({"level": 3, "labels": {"y": 2}, "slug": "ABC"}).view_apply_to(orig)  # type: ignore
+
+    assert new_model.level == 3
+    assert new_model.labels == {"x": 1, "y": 2}
+    assert new_model.slug == "abc"
+    assert new_model.name == "a"
+    assert new_model.model_fields_set == {"name", "labels", "level", "slug"}
+
+    with pytest.raises(ValidationError) as exc_info:
+        SettingsUpdate.model_validate({"labels": {"y": 2, "z": 3}}).view_apply_to(orig)  # type: ignore
+
+    assert exc_info.value.errors()[0]["loc"] == ("labels",)
+
+    with pytest.raises(ValidationError) as exc_info:
+        SettingsUpdate.model_validate({"code": "b"}).view_apply_to(orig)  # type: ignore
+
+    assert exc_info.value.errors()[0]["type"] == "frozen_field"
+
+
+def test_apply_many():
+    models = [Settings(name=str(i), labels={"x": i}) for i in range(5)]
+    updates = [SettingsUpdate.model_validate({"level": i, "labels": {"y": i}}) for i in range(5)]
+    updates[3] = SettingsUpdate.model_validate({"labels": {"y": 1, "z": 2}})
+
+    results = list(model_apply_many(zip(models, updates, strict=True)))  # type: ignore
+
+    assert [r.key for r in results] == [0, 1, 2, 3, 4]
+    assert [r.model for r in results] == [
+        model_apply(m, u) if i != 3 else None  # type: ignore
+        for i, (m, u) in enumerate(zip(models, updates, strict=True))
+    ]
+    assert results[3].error is not None
+    assert results[3].error.errors()[0]["loc"] == ("labels",)
+    assert all(r.error is None for i, r in enumerate(results) if i != 3)
+
+
+def test_apply_many_mapping():
+    results = list(
+        model_apply_many(
+            {
+                "a": (Settings(), SettingsUpdate.model_validate({"slug": "ABC"})),
+                "b": (Settings(), SettingsUpdate.model_validate({"code": "b"})),
+            }
+        )  # type: ignore
+    )
+
+    assert results[0].key == "a"
+    assert results[0].model == Settings(slug="abc")
+    assert results[1].key == "b"
+    assert results[1].model is None
+    assert results[1].error.errors()[0]["type"] == "frozen_field"  # type: ignore
+
+
+class Document(BaseModel):
+    config: dict[str, Any] = Field(default_factory=dict)
+    settings: Settings = Field(default_factory=Settings)
+
+
+DocumentUpdate = BuilderUpdate().build_view(Document)
+
+
+def _nested_config(depth: int, leaf: dict[str, Any]) -> dict[str, Any]:
+    for i in range(depth):
+        leaf = {"child": leaf, "level": i}
+    return leaf
+
+
+def test_apply_deeply_nested_mapping():
+    depth = sys.getrecursionlimit() * 2
+    orig = Document(config=_nested_config(depth, {"value": 1, "other": 2}))
+    update = DocumentUpdate(config=_nested_config(depth, {"value": 3}))  # type: ignore
+
+    new_model = update.view_apply_to(orig, copy_on_write=True)  # type: ignore
+
+    config = new_model.config
+    for _ in range(depth):
+        config = config["child"]
+    assert config == {"value": 3, "other": 2}
+
+
+def test_apply_shares_identical_values():
+    orig = Document(config={"a": {"b": 1}, "c": {"d": 2}}, settings=Settings(name="a"))
+    update = DocumentUpdate(config={"a": orig.config["a"], "c": {"d": 3}}, settings={"name": "a"})  # type: ignore
+
+    new_model = update.view_apply_to(orig, copy_on_write=True)  # type: ignore
+
+    assert new_model.config == {"a": {"b": 1}, "c": {"d": 3}}
+    assert new_model.config["a"] is orig.config["a"]
+    assert new_model.settings is orig.settings
+
+
+class FrozenMapping(Mapping[str, Any]):
+    def __init__(self, data: Mapping[str, Any]):
+        self._data = dict(data)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class Inventory(BaseModel):
+    by_id: dict[int, Item] = Field(default_factory=dict)
+    extra: dict[str, Any] = Field(default_factory=dict)
+
+
+InventoryUpdate = BuilderUpdate().build_view(Inventory)
+
+
+def test_apply_mapping_entries():
+    orig = Inventory(by_id={1: Item(name="a"), 2: Item(name="b")})
+    update = InventoryUpdate.model_validate({"by_id": {2: {"qty": 5}, 3: {"name": "c"}}})
+
+    new_model = update.view_apply_to(orig, copy_on_write=True)  # type: ignore
+
+    assert new_model.by_id == {1: Item(name="a"), 2: Item(name="b", qty=5), 3: Item(name="c")}
+    assert new_model.by_id[1] is orig.by_id[1]
+    assert orig.by_id[2].quantity == 1
+
+    with pytest.raises(ValidationError):
+        InventoryUpdate.model_validate({"by_id": {4: {"qty": 5}}}).view_apply_to(orig)  # type: ignore
+
+
+def test_apply_registered_mapping_type():
+    register_mapping_type(FrozenMapping, lambda orig, data: FrozenMapping(data))
+    orig = Inventory(extra={"nested": FrozenMapping({"a": 1, "b": 2}), "counts": defaultdict(int, {"x": 1})})
+    update = InventoryUpdate.model_validate({"extra": {"nested": {"b": 3}, "counts": {"y": 2}}})
+
+    new_model = update.view_apply_to(orig, copy_on_write=True)  # type: ignore
+
+    assert isinstance(new_model.extra["nested"], FrozenMapping)
+    assert dict(new_model.extra["nested"]) == {"a": 1, "b": 3}
+    assert isinstance(new_model.extra["counts"], defaultdict)
+    assert new_model.extra["counts"] == {"x": 1, "y": 2}
+    assert new_model.extra["counts"]["z"] == 0
+
+
+class Line(BaseModel):
+    id: ReadOnly[int] = 0
+    sku: str
+    qty: int = 1
+
+
+class Invoice(BaseModel):
+    lines: Annotated[list[Line], KeyedBy("id")] = Field(default_factory=list)
+    tags: list[Line] = Field(default_factory=list)
+
+
+InvoiceUpdate = BuilderUpdate().build_view(Invoice)
+
+
+def test_apply_keyed_list():
+    orig = Invoice(
+        lines=[Line(id=1, sku="a"), Line(id=2, sku="b"), Line(id=3, sku="c")],
+        tags=[Line(id=1, sku="t")],
+    )
+    update = InvoiceUpdate.model_validate(
+        {"lines": [{"id": 2, "qty": 5}, {"sku": "d"}, {"id": 9, "sku": "e"}], "tags": [{"sku": "u"}]}
+    )
+
+    new_model = update.view_apply_to(orig, copy_on_write=True)  # type: ignore
+
+    assert new_model.lines == [
+        Line(id=1, sku="a"),
+        Line(id=2, sku="b", qty=5),
+        Line(id=3, sku="c"),
+        Line(sku="d"),
+        Line(id=9, sku="e"),
+    ]
+    assert new_model.lines[0] is orig.lines[0]
+    assert new_model.lines[2] is orig.lines[2]
+    assert orig.lines[1].qty == 1
+    assert new_model.tags == [Line(sku="u")]
+
+
+def test_apply_keyed_list_unchanged():
+    orig = Invoice(lines=[Line(id=1, sku="a")])
+
+    new_model = InvoiceUpdate.model_validate({"lines": [{"id": 1, "sku": "a"}]}).view_apply_to(orig, copy_on_write=True)  # type: ignore
+
+    assert new_model.lines is orig.lines
+
+
+def test_diff_round_trip():
+    orig = Inventory(by_id={1: Item(name="a"), 2: Item(name="b")}, extra={"x": {"y": 1, "z": 2}})
+    new = Inventory(
+        by_id={1: Item(name="a"), 2: Item(name="b", qty=5), 3: Item(name="c")}, extra={"x": {"y": 1, "z": 3}}
+    )
+
+    diff = InventoryUpdate.view_diff(orig, new)  # type: ignore
+
+    assert diff.model_fields_set == {"by_id", "extra"}
+    assert set(diff.by_id) == {2, 3}  # type: ignore
+    assert diff.by_id[2].model_fields_set == {"quantity"}  # type: ignore
+    assert diff.extra == {"x": {"z": 3}}  # type: ignore
+    assert diff.view_apply_to(orig) == new  # type: ignore
+
+
+def test_diff_unchanged():
+    orig = Document(config={"a": 1}, settings=Settings(name="a"))
+
+    assert DocumentUpdate.view_diff(orig, orig).model_fields_set == set()  # type: ignore
+    assert DocumentUpdate.view_diff(orig, orig.model_copy(deep=True)).model_fields_set == set()  # type: ignore
+
+
+class Ranking(BaseModel):
+    scores: OrderedDict[str, int] = Field(default_factory=OrderedDict)
+
+
+def test_diff_keeps_mapping_type():
+    orig = Ranking(scores=OrderedDict(a=1, b=2))
+    new = Ranking(scores=OrderedDict(a=1, b=3, c=4))
+    ranking_update = BuilderUpdate().build_view(Ranking)
+
+    diff = ranking_update.view_diff(orig, new)
+
+    assert isinstance(diff.scores, OrderedDict)  # type: ignore
+    assert diff.scores == {"b": 3, "c": 4}  # type: ignore
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert diff.model_dump_json() == '{"scores":{"b":3,"c":4}}'
+    assert diff.view_apply_to(orig) == new  # type: ignore
+
+
+def test_diff_skips_unexposed_fields():
+    orig = Invoice(lines=[Line(id=1, sku="a"), Line(id=2, sku="b")])
+    new = Invoice(lines=[Line(id=1, sku="a"), Line(id=2, sku="b", qty=3), Line(id=7, sku="c")])
+
+    diff = InvoiceUpdate.view_diff(orig, new)  # type: ignore
+
+    assert diff.model_fields_set == {"lines"}
+    assert [line.model_dump(exclude_unset=True) for line in diff.lines] == [  # type: ignore
+        {"id": 2, "qty": 3},
+        {"id": 7, "sku": "c"},
+    ]
+    assert diff.view_apply_to(orig) == new  # type: ignore
+
+    with pytest.raises(ValueError):
+        InvoiceUpdate.view_diff(new, orig)  # type: ignore
+
+    line_update = BuilderUpdate().build_view(Line)
+    assert line_update.view_diff(Line(id=1, sku="a"), Line(id=2, sku="a")).model_fields_set == set()
+
+
+@pytest.mark.parametrize(
+    ("view_cls", "model"),
+    [
+        (
+            OrderLoad,
+            Order(
+                id=3, items=[Item(name="a", qty=4)], by_name={"b": Item(name="b", tags=["x"])}, pair=(Item(name="p"), 2)
+            ),
+        ),
+        (ModelLoad, Model(field_int=3, field_recurrent=Model(field_int=2), field_dict={"t": Model(field_str="n")})),
+        (ModelUpdate, Model(field_int=3, field_dict={"t": Model(field_str="n")})),
+        (InventoryUpdate, Inventory(by_id={1: Item(name="a", tags=["x"])})),
+        (InvoiceUpdate, Invoice(lines=[Line(id=1, sku="a")], tags=[Line(sku="b", qty=2)])),
+    ],
+)
+def test_dump_like_view(view_cls: type[View[Any]], model: BaseModel):
+    view = view_cls.view_build_from(model)
+
+    for by_alias in (False, True):
+        assert view_cls.view_dump_python(model, by_alias=by_alias) == view.model_dump(by_alias=by_alias)
+        assert view_cls.view_dump_python(model, mode="json", exclude_none=True) == view.model_dump(
+            mode="json", exclude_none=True
+        )
+        assert view_cls.view_dump_json(model, by_alias=by_alias) == view.model_dump_json(by_alias=by_alias)
+
+
+def test_dump_masks():
+    assert dump_plan(OrderLoad).include == OrderLoad.view_projection().include
+    assert dump_plan(InventoryUpdate).exclude_unset is True
+
+    # ``Self`` values are not projected, so unset fields of nested models can not be left out.
+    assert dump_plan(ModelUpdate).include is None
+
+
+def test_view_projection():
+    item = {"name": True, "quantity": True, "tags": True}
+    assert OrderLoad.view_projection().include == {
+        "id": True,
+        "items": {"__all__": item},
+        "main_item": True,
+        "by_name": {"__all__": item},
+        "pair": True,
+        "total": True,
+    }
+    assert OrderCreate.view_projection().paths == (
+        "items.name",
+        "items.quantity",
+        "items.tags",
+        "main_item",
+        "by_name.name",
+        "by_name.quantity",
+        "by_name.tags",
+        "pair",
+    )
+    assert OrderLoad.view_projection() is OrderLoad.view_projection()
+
+
+def test_view_projection_recursive():
+    include = ModelLoad.view_projection().include
+
+    assert include["field_dict"]["__all__"] is include
+    assert ModelLoad.view_projection().paths == ("field_int", "field_dict")
+
+    model = Model(field_int=3, field_dict={"t": Model(field_str="n", field_dict={"u": Model()})})
+    assert model.model_dump(include=include) == {
+        "field_int": 3,
+        "field_dict": {"t": {"field_int": 1, "field_dict": {"u": {"field_int": 1, "field_dict": {}}}}},
+    }
+
+
+class Counter(BaseModel):
+    secret: WriteOnly[str] = ""
+    count: int = 0
+
+    @computed_field
+    def double(self) -> int:
+        return self.count * 2
+
+
+CounterLoad = BuilderLoad().build_view(Counter)
+
+
+def test_view_select_columns():
+    assert OrderCreate.view_select_columns() == ("items", "main_item", "by_name", "pair")
+    assert ModelAliasLoad.view_select_columns() == ("fieldInt", "fieldDict")
+    assert ModelAliasLoad.view_select_columns(by_alias=False) == ("field_int", "field_dict")
+
+    # Computed fields may depend on any field.
+    assert CounterLoad.view_select_columns() == ("secret", "count")
+    assert CounterLoad.view_projection().paths == ("count", "double")
+
+
+def test_view_document_projection():
+    assert OrderCreate.view_document_projection() == {
+        "items.name": 1,
+        "items.qty": 1,
+        "items.tags": 1,
+        "main_item": 1,
+        "by_name": 1,
+        "pair": 1,
+    }
+    assert OrderCreate.view_document_projection(by_alias=False)["items.quantity"] == 1
+    assert InvoiceUpdate.view_document_projection() == {
+        "lines.id": 1,
+        "lines.sku": 1,
+        "lines.qty": 1,
+        "tags.sku": 1,
+        "tags.qty": 1,
+    }
+    assert ModelLoad.view_document_projection() == {"field_int": 1, "field_dict": 1}
+
+
+def test_view_build_rows():
+    views = [
+        OrderCreate.model_validate({"items": [{"name": "a", "qty": 2}], "by_name": {"x": {"name": "x"}}}),
+        OrderCreate.model_validate({"items": [], "pair": [{"name": "p"}, 3]}),
+    ]
+    models = OrderCreate.view_build_to_many(views)
+
+    assert row_plan(OrderCreate).validator is not None
+    assert OrderCreate.view_build_rows(views) == [
+        tuple(m.model_dump(include=set(Order.model_fields)).values()) for m in models
+    ]
+    assert OrderCreate.view_build_rows(views, ["pair"], mode="json") == [
+        (None,),
+        ([{"name": "p", "quantity": 1, "tags": []}, 3],),
+    ]
+    assert OrderCreate.view_build_row_dicts(views, by_alias=True)[0]["items"] == [{"name": "a", "qty": 2, "tags": []}]
+
+
+def test_view_build_rows_validation():
+    views = [SettingsUpdate.model_validate({"slug": "ABC", "level": 2})]
+
+    assert SettingsUpdate.view_build_row_dicts(views) == [
+        {"name": "", "level": 2, "labels": {}, "code": "a", "slug": "abc"}
+    ]
+
+    with pytest.raises(ValidationError):
+        SettingsUpdate.view_build_rows([SettingsUpdate.model_construct(level=-1)])
+
+
+class Stamped(BaseModel):
+    name: str
+    stamp: str = ""
+
+    @model_validator(mode="after")
+    def set_stamp(self) -> Self:
+        self.stamp = self.name.upper()
+        return self
+
+
+StampedCreate = BuilderCreate().build_view(Stamped)
+
+
+def test_view_build_rows_model_validators():
+    assert row_plan(StampedCreate).validator is None
+    assert StampedCreate.view_build_rows([StampedCreate(name="a")]) == [("a", "A")]  # type: ignore
+
+
+class Tag(BaseModel):
+    label: str
+
+
+TagCreate = BuilderCreate().build_view(Tag)
+
+
+def test_view_build_rows_single_field():
+    views = [TagCreate(label="a"), TagCreate(label="b")]  # type: ignore
+
+    assert TagCreate.view_build_rows(views) == [("a",), ("b",)]
+    assert TagCreate.view_build_rows(views, ("label",)) == [("a",), ("b",)]
+
+    with pytest.raises(ValueError):
+        TagCreate.view_build_rows(views, [])
+
+
+def test_view_validate_json_iter():
+    item_create = ensure_model_views(Item)["Create"]
+    stream = io.BytesIO(b'[{"name": "a", "qty": 2}, {"qty": "x"}, {"name": "b, [c]", "tags": ["\\"]"]}]')
+
+    results = list(item_create.view_validate_json_iter(stream, chunk_size=4))
+
+    assert [r.position for r in results] == [0, 1, 2]
+    assert results[0].value == item_create.model_validate({"name": "a", "qty": 2})
+    assert results[1].value is None
+    assert {e["loc"] for e in results[1].error.errors()} == {("name",), ("qty",)}  # type: ignore
+    assert results[2].value.tags == ['"]']  # type: ignore
+
+    with pytest.raises(ValueError):
+        list(item_create.view_validate_json_iter(io.BytesIO(b'{"name": "a"}')))
+
+
+@pytest.mark.parametrize(
+    ("view_cls", "payload"),
+    [
+        (
+            OrderCreate,
+            {
+                "items": [{"name": "a", "qty": 2}, {"name": "b"}],
+                "main_item": {"name": "c", "tags": ["x"]},
+                "by_name": {"d": {"name": "d"}},
+                "pair": [{"name": "e"}, 3],
+                "id": 5,
+            },
+        ),
+        (ModelUpdate, {"field_int": 3, "field_recurrent": {"field_str": "x", "field_dict": {"a": {"field_int": 2}}}}),
+        (ModelAliasUpdate, {"fieldInt": 3, "fieldRecurrent": {"fieldStr": "x"}}),
+        (StampedCreate, {"name": "a"}),
+    ],
+)
+def test_view_validate_json_to_model(view_cls: type[View[Any]], payload: dict[str, Any]):
+    data = json.dumps(payload)
+    expected = view_cls.model_validate_json(data).view_build_to()
+
+    model = view_cls.view_validate_json_to_model(data)
+
+    assert type(model) is type(expected)
+    assert model == expected
+    assert model.model_fields_set == expected.model_fields_set
+
+
+def test_view_validate_json_to_model_errors():
+    with pytest.raises(ValidationError) as exc_info:
+        OrderCreate.view_validate_json_to_model(b'{"items": [{"name": "a", "qty": "x"}], "main_item": {}}')
+
+    assert exc_info.value.title == "OrderCreate"
+    assert {e["loc"] for e in exc_info.value.errors()} == {("items", 0, "qty"), ("main_item", "name")}
+
+
+class Box(BaseModel, extra="forbid"):
+    x: int
+
+    @computed_field
+    def c(self) -> int:
+        return self.x * 2
+
+
+class Bag(Box, extra="allow"):
+    pass
+
+
+BoxLoad = BuilderLoad().build_view(Box)
+BagLoad = BuilderLoad().build_view(Bag)
+
+
+def test_view_validate_json_to_model_computed_fields():
+    assert json_to_model_plan(BoxLoad).validator is not None
+    assert BoxLoad.view_validate_json_to_model('{"x": 1, "c": 2}') == Box(x=1)
+
+    bag = BagLoad.view_validate_json_to_model('{"x": 1, "c": 2}')
+    assert bag.model_extra == {}
+    assert bag.model_dump_json() == '{"x":1,"c":2}'
+
+    with pytest.raises(ValidationError):
+        BoxLoad.view_validate_json_to_model('{"x": 1, "c": "z"}')
+
+
+def test_view_validate_json_to_model_default_values():
+    data = '{"id": 3, "items": [{"name": "a", "qty": 1}], "main_item": null, "total": 1}'
+    expected = OrderLoad.model_validate_json(data).view_build_to()
+
+    model = OrderLoad.view_validate_json_to_model(data)
+
+    assert model == expected
+    assert model.model_fields_set == expected.model_fields_set == {"id", "items"}
+    assert model.items[0].model_fields_set == expected.items[0].model_fields_set == {"name"}  # type: ignore
+
+
+class StampedChecked(View[Stamped], view_name="Checked", no_process=True):
+    name: str
+
+    @model_validator(mode="after")
+    def check_name(self) -> Self:
+        if not self.name:
+            raise ValueError("empty name")
+        return self
+
+
+def test_view_validate_json_to_model_view_validators():
+    assert json_to_model_plan(StampedChecked).validator is None
+    assert StampedChecked.view_validate_json_to_model('{"name": "a"}') == Stamped(name="a", stamp="A")
+    with pytest.raises(ValidationError):
+        StampedChecked.view_validate_json_to_model('{"name": ""}')
+
+
+def test_view_build_to_json_iter_ndjson(tmp_path):
+    item_create = ensure_model_views(Item)["Create"]
+    path = tmp_path / "items.ndjson"
+    path.write_bytes(b'{"name": "a"}\n\n{"name": "b", "qty": 3}\n{"name":\n')
+
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as stream:
+        results = list(item_create.view_build_to_json_iter(stream, ndjson=True))
+
+    assert [r.value for r in results[:2]] == [Item(name="a"), Item(name="b", qty=3)]
+    assert results[2].position == 2
+    assert results[2].error.errors()[0]["type"] == "json_invalid"  # type: ignore
+
+
+def _orders() -> list[Order]:
+    return [Order(id=i, items=[Item(name=f"i{i}", qty=i)], main_item=None) for i in range(5)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 50, 1 << 16])
+def test_view_dump_json_iter(chunk_size: int):
+    orders = _orders()
+    order_load = cast(type[View[Order]], OrderLoad)
+
+    data = b"".join(order_load.view_dump_json_iter(orders, chunk_size=chunk_size, exclude_none=True))
+    assert json.loads(data) == [json.loads(order_load.view_dump_json(o, exclude_none=True)) for o in orders]
+
+    lines = b"".join(order_load.view_dump_json_iter(orders, ndjson=True, chunk_size=chunk_size)).splitlines()
+    assert lines == [order_load.view_dump_json(o).encode() for o in orders]
+
+    assert b"".join(order_load.view_dump_json_iter([])) == b"[]"
+    assert list(order_load.view_dump_json_iter([], ndjson=True)) == []
+
+
+def test_view_dump_json_aiter():
+    orders = _orders()
+    order_load = cast(type[View[Order]], OrderLoad)
+
+    async def models():
+        for order in orders:
+            yield order
+
+    async def collect(source: Any) -> bytes:
+        return b"".join([c async for c in order_load.view_dump_json_aiter(source, chunk_size=1, by_alias=True)])
+
+    expected = b"".join(order_load.view_dump_json_iter(orders, by_alias=True))
+    assert asyncio.run(collect(models())) == expected
+    assert asyncio.run(collect(orders)) == expected
+
+
+def test_view_adapter():
+    item_load = ensure_model_views(Item)["Load"]
+    cache = item_load.view_adapter_cache()
+    cache.clear()
+
+    assert item_load.view_adapter() is item_load.view_adapter("list")
+    assert item_load.view_adapter("tuple").validate_python([{"name": "a"}]) == (item_load(name="a"),)
+    assert item_load.view_adapter("dict").validate_python({"a": {"name": "a"}}) == {"a": item_load(name="a")}
+    assert item_load.view_adapter("dict", key=int).validate_python({"1": {"name": "a"}}) == {1: item_load(name="a")}
+    assert item_load.view_adapter("optional").validate_python(None) is None
+
+    assert cache.cache_info() == (1, 5, 16, 5)
+
+    with pytest.raises(ValueError):
+        item_load.view_adapter("set")  # type: ignore
+
+
+def test_adapter_cache_bounded():
+    cache = AdapterCache(Item, maxsize=2)
+
+    list_adapter = cache.get("list")
+    cache.get("tuple")
+    assert cache.get("list") is list_adapter
+    cache.get("optional")
+
+    assert cache.get("list") is list_adapter
+    assert cache.cache_info() == (2, 3, 2, 2)
+    assert ("tuple", None) not in cache.adapters
+
+
+def _assert_same_model(model: BaseModel, expected: BaseModel):
+    assert type(model) is type(expected)
+    assert model == expected
+    assert model.model_fields_set == expected.model_fields_set
+    for name, value in model.__dict__.items():
+        if isinstance(value, BaseModel):
+            _assert_same_model(value, expected.__dict__[name])
+
+
+@pytest.mark.filterwarnings("ignore::UserWarning")
+def test_view_build_to_trusted():
+    view = OrderCreate.model_validate(
+        {
+            "items": [{"name": "a", "qty": 2}, {"name": "b"}],
+            "main_item": {"name": "c", "tags": ["x"]},
+            "by_name": {"d": {"name": "d"}},
+        }
+    )
+    update = ModelUpdate.model_validate({"field_int": 3, "field_recurrent": {"field_dict": {"a": {"field_int": 2}}}})
+
+    _assert_same_model(view.view_build_to(trusted=True), view.view_build_to())
+    _assert_same_model(update.view_build_to(trusted=True), update.view_build_to())
+    assert OrderCreate.view_build_to_many([view], trusted=True) == [view.view_build_to()]
+
+    # Nothing is validated again.
+    invalid = OrderCreate.model_construct(items=[ensure_model_views(Item)["Create"].model_construct(name=1)])
+    assert invalid.view_build_to(trusted=True).items[0].name == 1
+    with pytest.raises(ValidationError):
+        invalid.view_build_to()
+
+
+class Member(BaseModel):
+    name: str
+    nick: str = ""
+    friends: list["Member"] = Field(default_factory=list)
+
+    @computed_field
+    def label(self) -> str:
+        return f"{self.name} ({self.nick})"
+
+
+MemberUpdate = BuilderUpdate().build_view(Member)
+
+
+def test_view_build_to_trusted_incomplete():
+    update = MemberUpdate.model_validate({"nick": "q"})
+    with pytest.raises(ValidationError) as exc_info:
+        update.view_build_to(trusted=True)
+    assert exc_info.value.errors()[0]["loc"] == ("name",)
+    with pytest.raises(ValidationError):
+        MemberUpdate.view_build_to_many([update], trusted=True)
+
+    update = MemberUpdate.model_validate({"name": "a", "friends": [{"nick": "q"}]})
+    with pytest.raises(ValidationError) as exc_info:
+        update.view_build_to(trusted=True)
+    assert exc_info.value.errors()[0]["loc"] == ("friends", 0, "name")
+
+    update = MemberUpdate.model_validate({"name": "a", "friends": [{"name": "b"}]})
+    _assert_same_model(update.view_build_to(trusted=True), update.view_build_to())
+    assert update.view_build_to(trusted=True).friends[0].label == "b ()"
+
+
+def test_view_apply_to_trusted():
+    orig = Model(field_int=1, field_recurrent=Model(field_str="y"), field_dict={"a": Model()})
+    update = ModelUpdate.model_validate(
+        {"field_int": 3, "field_recurrent": {"field_str": "x"}, "field_dict": {"b": {"field_int": 2}}}
+    )
+
+    _assert_same_model(update.view_apply_to(orig, trusted=True), update.view_apply_to(orig))
+    assert [r.model for r in model_apply_many([(orig, update)], trusted=True)] == [update.view_apply_to(orig)]
+
+    # Neither constraints nor validators run.
+    settings = SettingsUpdate.model_construct(level=-1, slug="ABC", labels={"a": 1, "b": 2, "c": 3})
+    new_settings = settings.view_apply_to(Settings(), trusted=True)
+    assert (new_settings.level, new_settings.slug, len(new_settings.labels)) == (-1, "ABC", 3)
+    with pytest.raises(ValidationError):
+        settings.view_apply_to(Settings())
+
+
+def test_view_build_from_trusted():
+    assert StampedChecked.view_build_from(Stamped(name=""), trusted=True).name == ""
+    assert StampedChecked.view_build_from_many([Stamped(name="")], trusted=True)[0].name == ""
+    with pytest.raises(ValidationError):
+        StampedChecked.view_build_from(Stamped(name=""))
+
+
+@pytest.mark.filterwarnings("ignore::UserWarning")
+def test_builder_trusted():
+    builder = Builder(view_name="Internal", access_modes=(AccessMode.READ_AND_WRITE,), trusted=True)
+    order_internal = builder.build_view(Order)
+    item_internal = ensure_model_views(Item)["Internal"]
+
+    assert order_internal.__view_trusted__ and item_internal.__view_trusted__
+    assert not OrderCreate.__view_trusted__
+
+    view = order_internal.model_construct(items=[item_internal.model_construct(name=1)])
+    assert view.view_build_to().items[0].name == 1
+    with pytest.raises(ValidationError):
+        view.view_build_to(trusted=False)
+
+
+OrderUpdate = BuilderUpdate().build_view(Order)
+ModelCreate = BuilderCreate().build_view(Model)
+
+
+@pytest.mark.parametrize(
+    ("view", "target_cls"),
+    [
+        (
+            OrderCreate.model_validate(
+                {"items": [{"name": "a", "qty": 2}], "by_name": {"d": {"name": "d"}}, "pair": [{"name": "e"}, 3]}
+            ),
+            OrderUpdate,
+        ),
+        (OrderCreate.model_validate({"items": [{"name": "a", "qty": 2}]}), OrderLoad),
+        (ModelUpdate.model_validate({"field_int": 3, "field_recurrent": {"field_dict": {"a": {}}}}), ModelLoad),
+        (ModelLoad.model_validate({"field_int": 3}), ModelUpdate),
+        (ModelCreate.model_validate({"field_int": 1, "field_str": "x"}), ModelUpdate),
+        (ModelAliasLoad.model_validate({"fieldInt": 3}), ModelAliasUpdate),
+        (SettingsUpdate.model_validate({"level": 3, "slug": "ABC"}), BuilderLoad().build_view(Settings)),
+    ],
+)
+def test_view_convert(view: View[Any], target_cls: type[View[Any]]):
+    expected = target_cls.view_build_from(view.view_build_to())
+
+    converted = view.view_convert(target_cls)
+
+    assert type(converted) is target_cls
+    assert converted == expected
+    assert converted.model_fields_set == expected.model_fields_set
+
+
+def test_view_convert_plan():
+    assert convert_plan(ModelUpdate, ModelLoad).steps is not None
+    # Computed fields and model validators need the model.
+    assert convert_plan(OrderCreate, OrderLoad).steps is None
+    assert convert_plan(SettingsUpdate, BuilderLoad().build_view(Settings)).steps is None
+
+    with pytest.raises(TypeError):
+        ModelLoad.model_validate({}).view_convert(OrderLoad)
+
+    item_update = ensure_model_views(Item)["Update"]
+    item_load = ensure_model_views(Item)["Load"]
+    assert convert_plan(item_update, item_load).steps is not None
+    with pytest.raises(ValidationError):
+        # ``name`` is required by the model.
+        item_update.model_validate({"tags": ["a"]}).view_convert(item_load)
+
+
+class Profile(BaseModel):
+    name: str
+    nick: str | None = "anonymous"
+
+
+ProfileCreate = BuilderCreate().build_view(Profile)
+ProfileLoad = BuilderLoad().build_view(Profile)
+
+
+def test_view_convert_narrower_target():
+    assert convert_plan(ProfileLoad, ProfileCreate).steps is not None
+
+    view = ProfileLoad.model_validate({"name": "a", "nick": None})
+    with pytest.raises(ValidationError):
+        ProfileCreate.view_build_from(view.view_build_to())
+    with pytest.raises(ValidationError) as exc_info:
+        view.view_convert(ProfileCreate)
+    assert exc_info.value.title == "ProfileCreate"
+
+    view = ProfileLoad.model_validate({"name": "a", "nick": "b"})
+    assert view.view_convert(ProfileCreate) == ProfileCreate.view_build_from(view.view_build_to())
+
+
+class Place(BaseModel):
+    street: str
+    city: str = "Springfield"
+    tags: list[str] = Field(default_factory=list)
+
+
+class Resident(BaseModel):
+    name: str
+    home: Place | None = None
+    places: list[Place] = Field(default_factory=list)
+
+
+ResidentLoad = BuilderLoad().build_view(Resident)
+ResidentUpdate = BuilderUpdate().build_view(Resident)
+
+
+def test_view_convert_nested_views():
+    plan = convert_plan(ResidentLoad, ResidentUpdate)
+    assert plan.steps is not None
+    assert [s.kind for s in plan.steps] == [CONVERT_COPY, CONVERT_VALIDATE, CONVERT_PROJECT]
+
+    view = ResidentLoad.model_validate(
+        {"name": "a", "places": [{"street": "s", "city": "Springfield"}, {"street": "t", "tags": ["x"]}]}
+    )
+    expected = ResidentUpdate.view_build_from(view.view_build_to())
+    converted = view.view_convert(ResidentUpdate)
+    assert converted == expected
+    assert [p.model_fields_set for p in converted.places] == [{"street"}, {"street", "tags"}]
+    converted.places[0].city = "Shelbyville"
+    assert converted.places[0].model_fields_set == {"street", "city"}
+
+    view = ResidentUpdate.model_validate({"name": "a", "places": [{"city": "x"}]})
+    with pytest.raises(ValidationError) as exc_info:
+        view.view_convert(ResidentLoad)
+    assert exc_info.value.title == "Resident"
+    assert exc_info.value.errors()[0]["loc"] == ("places", 0, "street")
+
+
+def test_dump_narrower_view():
+    assert dump_plan(ProfileLoad).include is not None
+    assert dump_plan(ProfileCreate).include is None
+
+    with pytest.raises(ValidationError):
+        ProfileCreate.view_dump_json(Profile(name="a", nick=None))
+    with pytest.raises(ValidationError):
+        ProfileCreate.view_dump_python(Profile(name="a", nick=None))
+    assert ProfileCreate.view_dump_json(Profile(name="a", nick="b")) == '{"name":"a","nick":"b"}'